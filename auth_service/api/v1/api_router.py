@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from api.v1.auth_router import auth_router
+from api.v1.health_router import health_router
 from api.v1.roles_router import roles_router
 from api.v1.subscriptions_router import subscriptions_router
 from api.v1.users_router import users_router
@@ -10,3 +11,4 @@ api_router.include_router(auth_router)
 api_router.include_router(users_router)
 api_router.include_router(roles_router)
 api_router.include_router(subscriptions_router)
+api_router.include_router(health_router)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, Form
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from redis import Redis
+from redis.asyncio import Redis
 from sqlalchemy import UUID
 from dependencies import (
     get_user_service,
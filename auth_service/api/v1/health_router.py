@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+health_router = APIRouter(prefix="/health", tags=["health"])
+
+
+@health_router.get("/live", response_class=JSONResponse)
+async def liveness():
+    """Процесс жив; Postgres и Redis не проверяются."""
+    return {"status": "ok"}
+
+
+@health_router.get("/ready", response_class=JSONResponse)
+async def readiness(request: Request):
+    """
+    Готовность принимать логины: Postgres и Redis отвечают быстрее таймаута.
+    Иначе 503 с задержкой и ошибкой по каждому из них.
+    """
+    ready, checks = await request.app.state.health.check()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ok" if ready else "unavailable", "checks": checks},
+    )
@@ -1,7 +1,7 @@
 import httpx
 from fastapi import Query, Depends, HTTPException
 from fastapi.responses import RedirectResponse
-from redis import Redis
+from redis.asyncio import Redis
 from starlette import status
 
 from auth_service.dependencies import get_user_service, get_token_service, get_redis
@@ -13,16 +13,35 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(30, env="REFRESH_TOKEN_EXPIRE_DAYS")
 
     # ---------------------- PASSWORD HASHING ----------------------
+    # New hashes use PASSWORD_SCHEME (argon2id or bcrypt); hashes of the other
+    # scheme or with other costs are rehashed on the next successful login.
+    # Pick costs with benchmarks/password_hash.py.
+    PASSWORD_SCHEME: str = Field("argon2id", env="PASSWORD_SCHEME")
     BCRYPT_ROUNDS: int = Field(12, env="BCRYPT_ROUNDS")
+    # OWASP minimum for argon2id: 19 MiB, 2 iterations, 1 lane
+    ARGON2_TIME_COST: int = Field(2, env="ARGON2_TIME_COST")
+    ARGON2_MEMORY_COST: int = Field(19456, env="ARGON2_MEMORY_COST")  # KiB
+    ARGON2_PARALLELISM: int = Field(1, env="ARGON2_PARALLELISM")
+    # Hashing runs in a thread pool: 0 workers = one per CPU;
+    # jobs beyond workers + queue limit are refused with 503
+    HASH_WORKERS: int = Field(0, env="HASH_WORKERS")
+    HASH_QUEUE_LIMIT: int = Field(64, env="HASH_QUEUE_LIMIT")
 
     # ---------------------- APP SETTINGS ----------------------
     DEBUG: bool = Field(False, env="DEBUG")
 
     REDIS_URL: str = Field(..., env="REDIS-HOST")
+    # One pool per worker, shared by token revocation and rate limiting
+    REDIS_POOL_SIZE: int = Field(50, env="REDIS_POOL_SIZE")
+    REDIS_POOL_TIMEOUT: float = Field(2.0, env="REDIS_POOL_TIMEOUT")
+    REDIS_SOCKET_TIMEOUT: float = Field(1.0, env="REDIS_SOCKET_TIMEOUT")
     DATABASE_URL: str = Field(..., env="AUTH_DATABASE_URL")
     PROJECT_NAME: str = "Auth Service"
     RATE_LIMIT: int = Field(20, env="RATE_LIMIT")
     WINDOW_SECONDS: int = Field(60, env="WINDOW_SECONDS")
+    # Readiness probes (/health/ready): per-dependency timeout and result cache
+    HEALTH_PROBE_TIMEOUT: float = Field(0.5, env="HEALTH_PROBE_TIMEOUT")
+    HEALTH_CACHE_TTL: float = Field(2.0, env="HEALTH_CACHE_TTL")
     SERVICE_NAME: str = Field("auth-service", env="SERVICE_NAME")
     ENVIRONMENT: str = Field("production", env="ENVIRONMENT")
     LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
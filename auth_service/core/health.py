@@ -0,0 +1,71 @@
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import anyio
+import redis.asyncio as aioredis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class HealthProbes:
+    """
+    Readiness of the auth service: Postgres and Redis.
+
+    Both are pinged concurrently, each within `timeout`; a login needs both,
+    so the worker is ready only when both answer in time. Results are cached
+    for `ttl` seconds and concurrent probe requests share one refresh.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        redis: aioredis.Redis,
+        timeout: float = 0.5,
+        ttl: float = 2.0,
+    ):
+        self.engine = engine
+        self.redis = redis
+        self.timeout = timeout
+        self.ttl = ttl
+        self._lock = anyio.Lock()
+        self._checked_at: Optional[float] = None
+        self._result: dict[str, dict[str, Any]] = {}
+
+    async def _postgres(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _run(
+        self, name: str, probe: Callable[[], Awaitable[Any]], results: dict
+    ) -> None:
+        start = time.perf_counter()
+        result: dict[str, Any] = {"ok": True}
+        try:
+            with anyio.fail_after(self.timeout):
+                await probe()
+        except TimeoutError:
+            result = {"ok": False, "error": f"no answer within {self.timeout}s"}
+        except Exception as exc:
+            result = {"ok": False, "error": repr(exc)}
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        results[name] = result
+
+    def _fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.ttl
+        )
+
+    async def check(self) -> tuple[bool, dict[str, dict[str, Any]]]:
+        """(ready, {"postgres"|"redis": {ok, latency_ms[, error]}})."""
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    results: dict[str, dict[str, Any]] = {}
+                    async with anyio.create_task_group() as tg:
+                        tg.start_soon(self._run, "postgres", self._postgres, results)
+                        tg.start_soon(self._run, "redis", self.redis.ping, results)
+                    self._result = results
+                    self._checked_at = time.monotonic()
+        result = dict(self._result)
+        return all(check["ok"] for check in result.values()), result
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+
+
+class StaticOpenAPI:
+    """
+    Hand-written OpenAPI schema served instead of the generated one.
+    Nothing is read at import: the file is served verbatim from memory after
+    the first request, and only parsed if app.openapi() is actually called.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._schema: Optional[dict[str, Any]] = None
+        self._body: Optional[bytes] = None
+
+    def schema(self) -> dict[str, Any]:
+        if self._schema is None:
+            self._schema = json.loads(self.body())
+        return self._schema
+
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self.path.read_bytes()
+        return self._body
+
+    def install(self, app: FastAPI, url: str = "/openapi.json") -> None:
+        """
+        Serve the schema and the docs pages.
+        The app must be created with openapi_url=None, so FastAPI does not
+        register its own (per-request serialising) routes.
+        """
+        app.openapi = self.schema
+
+        async def openapi(request: Request) -> Response:
+            return Response(self.body(), media_type="application/json")
+
+        async def swagger_ui(request: Request) -> Response:
+            root = request.scope.get("root_path", "")
+            return get_swagger_ui_html(
+                openapi_url=root + url, title=f"{app.title} - Swagger UI"
+            )
+
+        async def redoc(request: Request) -> Response:
+            root = request.scope.get("root_path", "")
+            return get_redoc_html(openapi_url=root + url, title=f"{app.title} - ReDoc")
+
+        app.add_route(url, openapi, include_in_schema=False)
+        app.add_route("/docs", swagger_ui, include_in_schema=False)
+        app.add_route("/redoc", redoc, include_in_schema=False)
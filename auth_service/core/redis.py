@@ -0,0 +1,43 @@
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from config.settings import settings
+
+_client: Optional[aioredis.Redis] = None
+
+
+def init_redis() -> aioredis.Redis:
+    """
+    The worker's single async Redis client, opened in the lifespan.
+    Token revocation, rate limiting and caching all borrow connections from
+    its pool, so a request no longer pays for a new TCP handshake. The pool
+    is bounded: past REDIS_POOL_SIZE a caller waits up to REDIS_POOL_TIMEOUT
+    for a free connection instead of opening another one.
+    """
+    global _client
+    if _client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_POOL_SIZE,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            health_check_interval=30,
+            decode_responses=True,
+            encoding="utf-8",
+        )
+        _client = aioredis.Redis(connection_pool=pool)
+    return _client
+
+
+def get_redis() -> aioredis.Redis:
+    # Outside the app (scripts, tests) the pool is opened on first use
+    return _client or init_redis()
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        await _client.connection_pool.disconnect()
+        _client = None
@@ -1,7 +1,7 @@
 from typing import AsyncGenerator
 
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from redis import Redis
+from redis.asyncio import Redis
 from fastapi import Depends, HTTPException, status
 
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
@@ -25,6 +25,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 from config.settings import settings
+from core import redis as redis_pool
 
 
 # Create PostgreSQL async engine
@@ -53,8 +54,9 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def get_redis() -> Redis:
-    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+def get_redis() -> Redis:
+    """Shared pooled client; see core.redis."""
+    return redis_pool.get_redis()
 
 
 def get_user_repo(session: AsyncSession = Depends(get_session)) -> UserRepository:
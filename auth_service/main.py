@@ -1,29 +1,51 @@
-import json
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from opentelemetry import trace
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 from config.settings import settings
+from core.health import HealthProbes
+from core.openapi import StaticOpenAPI
+from core.redis import close_redis, init_redis
+from dependencies import engine
+from security.password import HasherBusyError, hash_pool
 from services.tracing import setup_tracing
 from api.v1.api_router import api_router
 
 
-setup_tracing()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker startup: the span exporter thread and the Redis pool are
+    created after the fork and closed on shutdown.
+    """
+    setup_tracing()
+    redis = init_redis()
+    app.state.health = HealthProbes(
+        engine, redis, settings.HEALTH_PROBE_TIMEOUT, settings.HEALTH_CACHE_TTL
+    )
+    yield
+    await close_redis()
+    await engine.dispose()
+    hash_pool.shutdown()
+    trace.get_tracer_provider().shutdown()
 
-app = FastAPI(title=settings.SERVICE_NAME)
 
-FastAPIInstrumentor.instrument_app(app)
+app = FastAPI(title=settings.SERVICE_NAME, lifespan=lifespan, openapi_url=None)
 
-with open("api/v1/openapi_ru.json", "r", encoding="utf-8") as f:
-    custom_openapi_schema = json.load(f)
+FastAPIInstrumentor.instrument_app(app)
 
 
-def custom_openapi():
-    return custom_openapi_schema
+@app.exception_handler(HasherBusyError)
+async def hasher_busy(request: Request, exc: HasherBusyError):
+    return JSONResponse(
+        status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"}
+    )
 
 
-app.openapi = custom_openapi
+StaticOpenAPI("api/v1/openapi_ru.json").install(app)
 
 app.include_router(api_router)
 
@@ -32,6 +54,6 @@ app.include_router(api_router)
 async def healthcheck():
     """
     Простой healthcheck.
-    Returns 200 OK если приложение живо.
+    Returns 200 OK если приложение живо (то же, что /health/live).
     """
     return {"status": "ok"}
@@ -0,0 +1,35 @@
+-- GCRA (generic cell rate algorithm)
+-- One key per client holding its theoretical arrival time (TAT) in ms:
+-- memory does not depend on the limit and no two requests can collide.
+--
+-- KEYS[1]  limiter key
+-- ARGV[1]  emission interval, ms (period / limit)
+-- ARGV[2]  burst tolerance, ms (emission interval * burst)
+-- ARGV[3]  cost of the request
+--
+-- Returns {allowed (0/1), remaining, retry_after_ms, reset_after_ms}
+local key = KEYS[1]
+local emission = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+-- Redis clock, so every worker sees the same time
+local t = redis.call("TIME")
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local tat = tonumber(redis.call("GET", key)) or now
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + emission * cost
+local ahead = new_tat - now
+
+if ahead > tolerance then
+    local remaining = math.floor((tolerance - (tat - now)) / emission)
+    return {0, remaining, ahead - tolerance, tat - now}
+end
+
+-- The key expires once the client is back to a full burst
+redis.call("SET", key, new_tat, "PX", ahead)
+return {1, math.floor((tolerance - ahead) / emission), 0, ahead}
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from redis.asyncio import Redis
+
+SCRIPT = Path(__file__).with_name("gcra.lua")
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    # Seconds until the request would be allowed / until the full burst is back
+    retry_after: float
+    reset_after: float
+
+
+class RateLimiter:
+    """
+    GCRA limiter: `limit` requests per `period` seconds, at most `burst`
+    (default: `limit`) of them back to back.
+
+    State is a single integer key per client, checked and updated by one
+    atomic EVALSHA, so a decision is one round trip and memory stays constant
+    however high the limit is.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        limit: int,
+        period: float,
+        burst: Optional[int] = None,
+        prefix: str = "rate",
+    ):
+        self.redis = redis
+        # Whole ms: the TAT is stored as an integer
+        self.emission_ms = max(1, round(period * 1000 / limit))
+        self.tolerance_ms = self.emission_ms * (burst or limit)
+        self.prefix = prefix
+        self._script = redis.register_script(SCRIPT.read_text(encoding="utf-8"))
+
+    def _args(self, key: str, cost: int) -> dict:
+        return {
+            "keys": [f"{self.prefix}:{key}"],
+            "args": [self.emission_ms, self.tolerance_ms, cost],
+        }
+
+    @staticmethod
+    def _result(reply: list) -> RateLimitResult:
+        allowed, remaining, retry_after_ms, reset_after_ms = (int(x) for x in reply)
+        return RateLimitResult(
+            allowed=bool(allowed),
+            remaining=max(0, remaining),
+            retry_after=retry_after_ms / 1000,
+            reset_after=reset_after_ms / 1000,
+        )
+
+    async def hit(self, key: str, cost: int = 1) -> RateLimitResult:
+        reply = await self._script(**self._args(key, cost), client=self.redis)
+        return self._result(reply)
+
+    async def hit_many(self, keys: Iterable[str], cost: int = 1) -> list[RateLimitResult]:
+        """Decisions for several keys in one pipelined round trip."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                await self._script(**self._args(key, cost), client=pipe)
+            replies = await pipe.execute()
+        return [self._result(reply) for reply in replies]
@@ -1,37 +1,34 @@
-import time
-import redis.asyncio as aioredis
+import math
+from typing import Optional
+
 from fastapi import HTTPException, Request
 
 from config.settings import settings
+from core.redis import get_redis
+from rate_limit.gcra import RateLimiter
 
-redis_conn = aioredis.from_url(
-    settings.REDIS_URL,
-    decode_responses=True,
-    encoding="utf-8"
-)
-
-
+_limiter: Optional[RateLimiter] = None
 
-with open("rate_limit/rate-counter.lua", "r", encoding="utf-8") as f:
-    script_text = f.read()
-lua_script = redis_conn.register_script(script_text)
 
-def allow_request(user_id: str, service: str) -> bool:
-    key = f"rate:{service}:{user_id}"
-    now = int(time.time())
-    return bool(lua_script(
-        keys=[key],
-        args=[now, settings.WINDOW_SECONDS, settings.RATE_LIMIT]
-    ))
+def get_limiter() -> RateLimiter:
+    """Created on first use, on the worker's shared Redis pool."""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter(
+            get_redis(), settings.RATE_LIMIT, settings.WINDOW_SECONDS
+        )
+    return _limiter
 
 
 def rate_limit(service_name: str):
     async def limiter(request: Request):
         user_id = request.headers.get("X-User-Id", request.client.host)
 
-        if not allow_request(user_id, service_name):
+        result = await get_limiter().hit(f"{service_name}:{user_id}")
+        if not result.allowed:
             raise HTTPException(
                 status_code=429,
-                detail="Too Many Requests"
+                detail="Too Many Requests",
+                headers={"Retry-After": str(math.ceil(result.retry_after))},
             )
-    return limiter
\ No newline at end of file
+    return limiter
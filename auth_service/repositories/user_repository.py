@@ -29,5 +29,8 @@ class UserRepository:
         await self.session.flush()
         return user
 
+    async def commit(self):
+        await self.session.commit()
+
     async def delete(self, user: User):
         await self.session.delete(user)
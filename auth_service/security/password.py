@@ -1,18 +1,260 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Protocol, TypeVar
+
+import argon2
 import bcrypt
+from argon2.exceptions import InvalidHashError, VerificationError
+from opentelemetry import metrics
+
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
 
-class PasswordHasher:
-    def __init__(self, rounds: int | None = None):
-        self.rounds = rounds or settings.BCRYPT_ROUNDS
+T = TypeVar("T")
+
+meter = metrics.get_meter(__name__)
+queue_depth = meter.create_up_down_counter(
+    "password_hash.pending", description="Hash jobs queued or running"
+)
+wait_time = meter.create_histogram(
+    "password_hash.wait", unit="s", description="Time a job waited for a worker"
+)
+run_time = meter.create_histogram(
+    "password_hash.duration", unit="s", description="Time spent hashing"
+)
+rejected = meter.create_counter(
+    "password_hash.rejected", description="Jobs refused because the queue was full"
+)
+
+
+class HasherBusyError(Exception):
+    """The hashing queue is full; the caller should retry later (503)."""
+
+
+class HashPool:
+    """
+    Bounded thread pool for password hashing.
+
+    bcrypt and argon2 release the GIL, so `workers` threads hash in parallel while the
+    event loop keeps serving other requests. At most `queue_limit` jobs wait
+    behind the running ones; past that a login burst is refused right away
+    instead of piling up latency for everyone.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Jobs finish on worker threads, so the counters need a lock
+        self._lock = threading.Lock()
+
+    def _job(self, fn: Callable[..., T], queued_at: float, *args) -> T:
+        started = time.perf_counter()
+        wait_time.record(started - queued_at)
+        try:
+            return fn(*args)
+        finally:
+            run_time.record(time.perf_counter() - started)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.workers + self.queue_limit:
+            self.rejected += 1
+            rejected.add(1)
+            raise HasherBusyError("Too many password hashing requests")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.workers, thread_name_prefix="password-hash"
+            )
+
+        with self._lock:
+            self.pending += 1
+        queue_depth.add(1)
+        future = self._executor.submit(self._job, fn, time.perf_counter(), *args)
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def _done(self, future: Future) -> None:
+        """
+        Called once the job has left the executor: finished, failed, or
+        cancelled while still queued. A caller that gives up on a running
+        job does not free its slot, the thread is still busy with it.
+        """
+        ok = not future.cancelled() and future.exception() is None
+        with self._lock:
+            self.pending -= 1
+            if ok:
+                self.completed += 1
+        queue_depth.add(-1)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hash_pool = HashPool(
+    workers=settings.HASH_WORKERS or len(os.sched_getaffinity(0)),
+    queue_limit=settings.HASH_QUEUE_LIMIT,
+)
+
+
+class HashScheme(Protocol):
+    """
+    One hashing algorithm. Hashes are self-describing (modular crypt format:
+    scheme and cost parameters are stored in the hash itself), so a stored
+    hash can always be verified and compared against the current settings.
+    """
+
+    name: str
+
+    def identify(self, hashed: str) -> bool: ...
+
+    def hash(self, password: str) -> str: ...
+
+    def verify(self, password: str, hashed: str) -> bool: ...
+
+    def needs_rehash(self, hashed: str) -> bool: ...
 
-    def hash_password(self, password: str) -> str:
-        password_bytes = password.encode("utf-8")
+
+class BcryptScheme:
+    name = "bcrypt"
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith(("$2a$", "$2b$", "$2y$"))
+
+    def hash(self, password: str) -> str:
         salt = bcrypt.gensalt(self.rounds)
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        return hashed.decode("utf-8")
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        except ValueError:
+            return False
+
+    def needs_rehash(self, hashed: str) -> bool:
+        # $2b$<rounds>$<salt+hash>
+        return int(hashed.split("$")[2]) != self.rounds
+
+
+class Argon2idScheme:
+    """Memory-hard; `memory_cost` is in KiB."""
+
+    name = "argon2id"
+
+    def __init__(
+        self, time_cost: int = 2, memory_cost: int = 19456, parallelism: int = 1
+    ):
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith("$argon2id$")
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return self._hasher.verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._hasher.check_needs_rehash(hashed)
+
+
+def make_scheme(name: str) -> HashScheme:
+    if name == "bcrypt":
+        return BcryptScheme(settings.BCRYPT_ROUNDS)
+    if name == "argon2id":
+        return Argon2idScheme(
+            settings.ARGON2_TIME_COST,
+            settings.ARGON2_MEMORY_COST,
+            settings.ARGON2_PARALLELISM,
+        )
+    raise ValueError(f"Unknown password scheme: {name}")
+
+
+class PasswordHasher:
+    """
+    New hashes use the `current` scheme; hashes of the other known schemes
+    still verify. A hash made with another scheme or other cost parameters
+    is replaced on the next successful login (see verify_and_update).
+    """
+
+    def __init__(
+        self,
+        current: Optional[HashScheme] = None,
+        legacy: Optional[list[HashScheme]] = None,
+        pool: HashPool = hash_pool,
+    ):
+        self.current = current or make_scheme(settings.PASSWORD_SCHEME)
+        if legacy is None:
+            legacy = [
+                make_scheme(name)
+                for name in ("bcrypt", "argon2id")
+                if name != self.current.name
+            ]
+        self.schemes = [self.current, *legacy]
+        self.pool = pool
+
+    def _scheme_of(self, hashed: str) -> Optional[HashScheme]:
+        return next((s for s in self.schemes if s.identify(hashed)), None)
+
+    def _verify(self, password: str, hashed: str) -> bool:
+        scheme = self._scheme_of(hashed)
+        if scheme is None:
+            logger.warning("Password hash of an unknown scheme")
+            return False
+        return scheme.verify(password, hashed)
+
+    def _verify_and_update(
+        self, password: str, hashed: str
+    ) -> tuple[bool, Optional[str]]:
+        if not self._verify(password, hashed):
+            return False, None
+        if self.current.identify(hashed) and not self.current.needs_rehash(hashed):
+            return True, None
+        return True, self.current.hash(password)
+
+    async def hash_password(self, password: str) -> str:
+        return await self.pool.run(self.current.hash, password)
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        return await self.pool.run(self._verify, password, hashed_password)
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
-        password_bytes = password.encode("utf-8")
-        hashed_bytes = hashed_password.encode("utf-8")
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        (valid, new hash or None). The new hash is returned when the stored one
+        was made with another scheme or outdated parameters; the password is
+        only known at login, so this is the moment to upgrade it.
+        """
+        return await self.pool.run(
+            self._verify_and_update, password, hashed_password
+        )
@@ -29,7 +29,7 @@ class UserService:
         if existing:
             raise ValueError("Email already registered")
 
-        password_hash = self.hasher.hash_password(password)
+        password_hash = await self.hasher.hash_password(password)
 
         # 1. Create user
         user = await self.repo.create(
@@ -52,16 +52,26 @@ class UserService:
         if not user:
             return None
 
-        if not self.hasher.verify_password(password, user.password_hash):
+        valid, new_hash = await self.hasher.verify_and_update(
+            password, user.password_hash
+        )
+        if not valid:
             return None
+        if new_hash is not None:
+            # Stored with another scheme or outdated cost: upgrade in place.
+            # Commit it, the login request's session is never committed
+            # otherwise and every login would pay for the rehash again.
+            user.password_hash = new_hash
+            await self.repo.update(user)
+            await self.repo.commit()
 
         return user
 
     async def change_password(self, user: User, old_password: str, new_password: str):
-        if not self.hasher.verify_password(old_password, user.password_hash):
+        if not await self.hasher.verify_password(old_password, user.password_hash):
             raise ValueError("Old password incorrect")
 
-        user.password_hash = self.hasher.hash_password(new_password)
+        user.password_hash = await self.hasher.hash_password(new_password)
 
         await self.repo.update(user)
         return user
@@ -0,0 +1,238 @@
+"""
+Fixed-concurrency load test of the films API, with latency percentiles.
+
+By default the API runs in process on a seeded fake ES and Redis
+(benchmarks/fakes.py), so it needs no containers and gives stable numbers
+for CI. With --target it drives a running deployment instead; --seed then
+bulk-loads the same synthetic catalog into --es-url first.
+
+    python benchmarks/api_load.py --films 5000 -c 32 -n 2000
+    python benchmarks/api_load.py --target http://localhost:8000 \\
+        --seed --es-url http://localhost:9200 --films 100000
+    python benchmarks/api_load.py --json --max-p95-ms 50   # CI gate
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import jwt
+
+ROOT = Path(__file__).resolve().parents[1]
+for name, value in {
+    "ELK_URL": "http://localhost:9200",
+    "ELK_INDEX": "movies",
+    "SCHEMA_FILE": "movies_schema.json",
+    "REDIS_HOST": "localhost",
+    "DB_USER": "bench",
+    "DB_PASSWORD": "bench",
+    "DB_NAME": "bench",
+    "DB_HOST": "localhost",
+    "JWT_ACCESS_SECRET": "bench-secret-of-at-least-32-bytes",
+    "JWT_REFRESH_SECRET": "bench-secret-of-at-least-32-bytes",
+    "REDIS_URL": "redis://localhost",
+    "DATABASE_URL": "postgresql+asyncpg://localhost/bench",
+}.items():
+    os.environ.setdefault(name, value)
+sys.path.append(str(ROOT / "src"))
+sys.path.append(str(ROOT))
+from benchmarks.catalog import CatalogGenerator  # noqa: E402
+from benchmarks.fakes import FakeElasticsearch, FakeRedis  # noqa: E402
+
+ROUTES = [
+    "/films/",
+    "/films/?sort=rating&type=movie&limit=50",
+    "/films/{film_id}",
+    "/search/?query=star&page_size=20",
+    "/persons/",
+    "/persons/{person_id}/films",
+    "/genres/",
+    "/",
+]
+
+
+def make_token() -> str:
+    from dependencies.auth_settings import settings
+
+    payload = {"sub": "bench", "roles": [], "iss": settings.AUTH_ISSUER}
+    payload["exp"] = int(time.time()) + 3600
+    return jwt.encode(payload, settings.JWT_ACCESS_SECRET, settings.JWT_ALGORITHM)
+
+
+def in_process_app(documents: dict):
+    """The routers of src/main.py on a fake ES and Redis (no static mount)."""
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
+    from api.v1 import caching
+    from api.v1 import (
+        films_router,
+        genres_router,
+        home_router,
+        persons_router,
+        search_router,
+        suggest_router,
+    )
+    from core.templates import templates
+    from models.models import FilmWork
+    from repositories.elastic_repository import ElasticRepository
+    from repositories.resilience import BackendUnavailableError
+    from services.film_service import FilmService
+    from services.home_service import HomeService
+
+    os.chdir(ROOT / "src")  # templates/ is looked up relative to cwd
+    es = FakeElasticsearch(documents)
+    caching._redis = FakeRedis()
+
+    async def fake_client():
+        return es
+
+    app = FastAPI()
+    app.state.home = HomeService(
+        FilmService(ElasticRepository(es, index="movies", model=FilmWork)),
+        templates,
+    )
+    app.include_router(home_router.home_router)
+
+    @app.exception_handler(BackendUnavailableError)
+    async def backend_unavailable(request: Request, exc: BackendUnavailableError):
+        return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+    for module, router in [
+        (films_router, films_router.films_router),
+        (genres_router, genres_router.genres_router),
+        (persons_router, persons_router.persons_router),
+        (search_router, search_router.films_search_router),
+        (suggest_router, suggest_router.suggest_router),
+    ]:
+        app.dependency_overrides[module.get_elastic_client] = fake_client
+        app.include_router(router)
+    return app
+
+
+def seed_elasticsearch(url: str, documents: dict) -> None:
+    from elasticsearch import Elasticsearch, helpers
+
+    es = Elasticsearch(hosts=[url])
+    for index, docs in documents.items():
+        schema = json.loads((ROOT / "etl/es_schemas" / f"{index}_schema.json").read_text())
+        es.options(ignore_status=404).indices.delete(index=index)
+        es.indices.create(index=index, **schema)
+        helpers.bulk(
+            es, ({"_index": index, "_id": d["id"], "_source": d} for d in docs)
+        )
+        es.indices.refresh(index=index)
+        print(f"seeded {len(docs)} {index}")
+
+
+async def drive(client: httpx.AsyncClient, path: str, n: int, concurrency: int):
+    """n requests to path from `concurrency` workers; latencies in ms."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(n))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            resp = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if resp.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarise(path: str, latencies: list[float], errors: int, elapsed: float):
+    q = statistics.quantiles(latencies, n=100)
+    return {
+        "route": path,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(q[49], 2),
+        "p95_ms": round(q[94], 2),
+        "p99_ms": round(q[98], 2),
+    }
+
+
+async def run(args) -> list[dict]:
+    catalog = CatalogGenerator(args.films, seed=args.seed_value)
+    documents = catalog.es_documents() if not args.target or args.seed else None
+    if args.target:
+        if args.seed:
+            seed_elasticsearch(args.es_url, documents)
+        transport, base_url = None, args.target
+    else:
+        app = in_process_app(documents)
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    ids = {"film_id": documents["movies"][0]["id"] if documents else args.film_id}
+    ids["person_id"] = documents["persons"][0]["id"] if documents else args.person_id
+    headers = {"Authorization": f"Bearer {make_token()}"}
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    results = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, headers=headers, limits=limits
+    ) as client:
+        for route in args.routes or ROUTES:
+            path = route.format(**ids)
+            await drive(client, path, args.warmup, args.concurrency)
+            latencies, errors, elapsed = await drive(
+                client, path, args.n, args.concurrency
+            )
+            results.append(summarise(path, latencies, errors, elapsed))
+    return results
+
+
+def report(results: list[dict]) -> None:
+    for r in results:
+        print(
+            f"{r['route']:<52} {r['rps']:8.1f} req/s  p50={r['p50_ms']:7.2f}ms"
+            f" p95={r['p95_ms']:7.2f}ms p99={r['p99_ms']:7.2f}ms"
+            + (f"  errors={r['errors']}" if r["errors"] else "")
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--films", type=int, default=2000, help="catalog size")
+    parser.add_argument("--seed-value", type=int, default=0, help="catalog RNG seed")
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-n", type=int, default=500, help="requests per route")
+    parser.add_argument("--warmup", type=int, default=50, help="untimed requests")
+    parser.add_argument("--routes", nargs="*", help="override the route list")
+    parser.add_argument("--target", help="base URL of a running API")
+    parser.add_argument("--seed", action="store_true", help="bulk-load --es-url")
+    parser.add_argument("--es-url", default="http://localhost:9200")
+    parser.add_argument("--film-id", help="detail id when --target is not seeded")
+    parser.add_argument("--person-id", help="person id when --target is not seeded")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    parser.add_argument("--max-p95-ms", type=float, help="exit 1 above this p95")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        report(results)
+
+    failed = [r for r in results if r["errors"]]
+    if args.max_p95_ms is not None:
+        failed += [r for r in results if r["p95_ms"] > args.max_p95_ms]
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Synthetic film catalog shared by the benchmarks.
+
+Rows have the shape of the `content` schema (film_work, genre, person and
+the two link tables). Cardinalities follow a power law, like the real
+catalog: most films have a handful of actors and a few have dozens, and a
+small set of popular people appears in a large share of the films.
+Everything is derived from the seed and streamed, so millions of films
+never need to be held in memory.
+"""
+
+import datetime
+import random
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "etl"))
+from etl_transformer import TransformerFactory  # noqa: E402
+
+GENRES = [
+    "Action", "Adventure", "Animation", "Biography", "Comedy", "Crime",
+    "Documentary", "Drama", "Family", "Fantasy", "History", "Horror",
+    "Music", "Musical", "Mystery", "News", "Reality-TV", "Romance",
+    "Sci-Fi", "Short", "Sport", "Talk-Show", "Thriller", "War", "Western",
+    "Game-Show",
+]  # fmt: skip
+FIRST_NAMES = [
+    "Anna", "Boris", "Chris", "Daria", "Emma", "Fedor", "George", "Helen",
+    "Ivan", "Julia", "Kevin", "Lena", "Mark", "Nina", "Oleg", "Paul",
+    "Rita", "Sam", "Tom", "Vera",
+]  # fmt: skip
+LAST_NAMES = [
+    "Adams", "Brown", "Clark", "Davis", "Evans", "Fisher", "Green", "Hall",
+    "Ivanov", "Jones", "King", "Lee", "Miller", "Nolan", "Orlov", "Parker",
+    "Quinn", "Reed", "Smith", "Turner",
+]  # fmt: skip
+TITLE_WORDS = [
+    "Star", "Wars", "Night", "City", "Dark", "Empire", "Return", "Last",
+    "Lost", "World", "Dream", "Love", "Storm", "River", "Shadow", "Light",
+    "Secret", "Garden", "Iron", "Moon", "Ghost", "Road", "King", "Winter",
+]  # fmt: skip
+TYPES = ["movie", "movie", "movie", "tv_show"]
+EPOCH = datetime.datetime(2021, 6, 16, tzinfo=datetime.timezone.utc)
+
+
+def entity_id(kind: int, index: int) -> str:
+    """Stable UUID of the index-th entity of a kind, without storing it."""
+    return str(uuid.UUID(int=(kind << 96) | index))
+
+
+class CatalogGenerator:
+    FILM, PERSON, GENRE, LINK = range(1, 5)
+
+    def __init__(self, n_films: int, seed: int = 0, persons_per_film: float = 2.0):
+        self.n_films = n_films
+        self.n_persons = max(10, int(n_films * persons_per_film))
+        self.seed = seed
+
+    @staticmethod
+    def stamp(index: int) -> datetime.datetime:
+        # Distinct, so the extractor's ORDER BY created/modified + OFFSET is stable
+        return EPOCH + datetime.timedelta(seconds=index)
+
+    def person_name(self, index: int) -> str:
+        first = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        suffix = index // (len(FIRST_NAMES) * len(LAST_NAMES))
+        return f"{first} {last}" + (f" {suffix}" if suffix else "")
+
+    def genres(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": entity_id(self.GENRE, i),
+                "name": name,
+                "description": f"{name} films",
+                "created": EPOCH,
+                "modified": EPOCH,
+            }
+            for i, name in enumerate(GENRES)
+        ]
+
+    def persons(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.n_persons):
+            yield {
+                "id": entity_id(self.PERSON, i),
+                "full_name": self.person_name(i),
+                "created": self.stamp(i),
+                "modified": self.stamp(i),
+            }
+
+    def _person(self, rng: random.Random) -> int:
+        # Skewed towards low indices: those are the popular people
+        return int(self.n_persons * rng.random() ** 3)
+
+    def films(self) -> Iterator[tuple[dict, list[int], list[tuple[int, str]]]]:
+        """(film_work row, genre indices, [(person index, role)]) per film."""
+        rng = random.Random(self.seed)
+        for i in range(self.n_films):
+            words = rng.sample(TITLE_WORDS, rng.randint(1, 4))
+            film = {
+                "id": entity_id(self.FILM, i),
+                "title": " ".join(words) + (f" {i}" if rng.random() < 0.5 else ""),
+                "description": " ".join(rng.choices(TITLE_WORDS, k=30)).lower(),
+                "creation_date": datetime.date(1950 + i % 75, 1 + i % 12, 1),
+                "rating": round(rng.uniform(1, 10), 1),
+                "type": rng.choice(TYPES),
+                "created": self.stamp(i),
+                "modified": self.stamp(i),
+            }
+            genres = rng.sample(range(len(GENRES)), rng.randint(1, 3))
+
+            actors = min(60, 1 + int(rng.paretovariate(1.2)))
+            cast = {(self._person(rng), "actor") for _ in range(actors)}
+            cast |= {(self._person(rng), "director") for _ in range(rng.randint(1, 2))}
+            cast |= {(self._person(rng), "writer") for _ in range(rng.randint(1, 3))}
+            yield film, genres, sorted(cast)
+
+    # ------------------------------------------------------------------
+    # Elasticsearch documents, built with the ETL's own transformers
+    # ------------------------------------------------------------------
+    def es_documents(self) -> dict[str, list[dict[str, Any]]]:
+        movie, person, genre = (
+            TransformerFactory.get(kind) for kind in ("movie", "person", "genre")
+        )
+        genre_rows = self.genres()
+        movies = []
+        for film, genre_ids, cast in self.films():
+            row = {
+                **film,
+                "genres": [genre_rows[g]["name"] for g in genre_ids],
+                "persons": [
+                    {
+                        "id": entity_id(self.PERSON, p),
+                        "name": self.person_name(p),
+                        "role": role,
+                    }
+                    for p, role in cast
+                ],
+            }
+            movies.append(movie.transform(row))
+
+        def dated(doc: dict[str, Any]) -> dict[str, Any]:
+            return {
+                k: v.isoformat() if isinstance(v, datetime.datetime) else v
+                for k, v in doc.items()
+            }
+
+        return {
+            "movies": movies,
+            "genres": [dated(genre.transform(row)) for row in genre_rows],
+            "persons": [dated(person.transform(row)) for row in self.persons()],
+        }
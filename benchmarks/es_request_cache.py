@@ -0,0 +1,97 @@
+"""
+Repeated-filter benchmark for the film browse queries.
+
+Runs the same browse request many times against a live Elasticsearch,
+with and without the shard request cache, and prints latency percentiles
+together with the request cache hit/miss counters of the index.
+
+    python benchmarks/es_request_cache.py --url http://localhost:9200 -n 500
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from elasticsearch import Elasticsearch
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from services.query_builder import browse_body, film_filters  # noqa: E402
+
+
+def legacy_body(min_rating: float, type_: str, limit: int) -> dict:
+    """
+    The shape FilmService used before the query builder: match_all in `must`.
+    The type filter uses type.raw so both variants return the same hits.
+    """
+    return {
+        "query": {
+            "bool": {
+                "must": [{"match_all": {}}],
+                "filter": [
+                    {"range": {"rating": {"gte": min_rating}}},
+                    {"term": {"type.raw": type_}},
+                ],
+            }
+        },
+        "from": 0,
+        "size": limit,
+        "sort": [{"rating": {"order": "desc"}}],
+    }
+
+
+def request_cache_stats(es: Elasticsearch, index: str) -> tuple[int, int]:
+    stats = es.indices.stats(index=index, metric="request_cache")
+    cache = stats["_all"]["total"]["request_cache"]
+    return cache["hit_count"], cache["miss_count"]
+
+
+def run(es: Elasticsearch, index: str, body: dict, n: int, request_cache: bool):
+    es.indices.clear_cache(index=index, request=True)
+    hits, misses = request_cache_stats(es, index)
+    wall, took = [], []
+    for _ in range(n):
+        start = time.perf_counter()
+        resp = es.search(index=index, body=body, request_cache=request_cache)
+        wall.append((time.perf_counter() - start) * 1000)
+        took.append(resp["took"])
+    # Shard-level counters: they show whether the cache really served the hits
+    hits_after, misses_after = request_cache_stats(es, index)
+    return wall, took, hits_after - hits, misses_after - misses
+
+
+def report(
+    name: str, wall: list[float], took: list[int], hits: int, misses: int
+) -> None:
+    q = statistics.quantiles(wall, n=100)
+    print(
+        f"{name:<28} wall p50={q[49]:6.2f}ms p95={q[94]:6.2f}ms p99={q[98]:6.2f}ms"
+        f"  es took mean={statistics.mean(took):5.2f}ms"
+        f"  request cache hits={hits} misses={misses}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:9200")
+    parser.add_argument("--index", default="movies")
+    parser.add_argument("-n", type=int, default=300, help="requests per variant")
+    parser.add_argument("--min-rating", type=float, default=5.0)
+    parser.add_argument("--type", default="movie")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    es = Elasticsearch(args.url)
+    builder = browse_body(
+        film_filters(args.min_rating, None, args.type), "rating", "desc", args.limit, 0
+    )
+    legacy = legacy_body(args.min_rating, args.type, args.limit)
+
+    report("legacy, no request cache", *run(es, args.index, legacy, args.n, False))
+    report("builder, no request cache", *run(es, args.index, builder, args.n, False))
+    report("builder, request cache", *run(es, args.index, builder, args.n, True))
+
+
+if __name__ == "__main__":
+    main()
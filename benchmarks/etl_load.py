@@ -0,0 +1,311 @@
+"""
+Full-reindex benchmark of the ETL: Postgres -> transform -> Elasticsearch.
+
+--seed wipes the `content` tables and COPYs in a synthetic catalog of
+--films films (benchmarks/catalog.py), then ETLPipeline runs end to end
+against Postgres and ES with in-memory state. Prints docs/sec for each
+stage (extract, transform, load) per entity, overall throughput and peak RSS.
+
+    python benchmarks/etl_load.py --seed --films 1000000 --batch-size 1000
+    python benchmarks/etl_load.py --json   # rerun on the already seeded data
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import resource
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+from benchmarks.catalog import CatalogGenerator, entity_id  # noqa: E402
+
+TABLES = {
+    "film_work": "id, title, description, creation_date, rating, type, created, modified",
+    "genre": "id, name, description, created, modified",
+    "person": "id, full_name, created, modified",
+    "genre_film_work": "id, genre_id, film_work_id, created",
+    "person_film_work": "id, person_id, film_work_id, role, created",
+}
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ----------------------------------------------------------------------
+# Seeding
+# ----------------------------------------------------------------------
+class CopyBuffer:
+    """CSV rows for one table, COPYed in chunks so memory stays flat."""
+
+    def __init__(self, cur, table: str, chunk: int = 50_000):
+        self.cur = cur
+        self.table = table
+        self.chunk = chunk
+        self.rows = 0
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+        self._pending = 0
+
+    def add(self, *values: Any) -> None:
+        self._writer.writerow(values)
+        self._pending += 1
+        if self._pending >= self.chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._buf.seek(0)
+        self.cur.copy_expert(
+            f"COPY content.{self.table} ({TABLES[self.table]}) FROM STDIN WITH (FORMAT csv)",
+            self._buf,
+        )
+        self.rows += self._pending
+        self._buf.seek(0)
+        self._buf.truncate()
+        self._pending = 0
+
+
+def seed_postgres(conn, catalog: CatalogGenerator) -> dict[str, int]:
+    """Replaces the content tables with the catalog; returns rows per table."""
+    links = (entity_id(catalog.LINK, i) for i in range(sys.maxsize))
+    with conn.cursor() as cur:
+        cur.execute(
+            "TRUNCATE " + ", ".join(f"content.{table}" for table in TABLES)
+        )
+        buffers = {table: CopyBuffer(cur, table) for table in TABLES}
+
+        genres = catalog.genres()
+        for g in genres:
+            buffers["genre"].add(*(g[k] for k in TABLES["genre"].split(", ")))
+        for p in catalog.persons():
+            buffers["person"].add(p["id"], p["full_name"], p["created"], p["modified"])
+
+        for film, genre_ids, cast in catalog.films():
+            buffers["film_work"].add(
+                *(film[k] for k in TABLES["film_work"].split(", "))
+            )
+            for g in genre_ids:
+                buffers["genre_film_work"].add(
+                    next(links), genres[g]["id"], film["id"], film["created"]
+                )
+            for person, role in cast:
+                buffers["person_film_work"].add(
+                    next(links),
+                    entity_id(catalog.PERSON, person),
+                    film["id"],
+                    role,
+                    film["created"],
+                )
+
+        for buffer in buffers.values():
+            buffer.flush()
+        cur.execute("ANALYZE")
+    conn.commit()
+    return {table: buffer.rows for table, buffer in buffers.items()}
+
+
+# ----------------------------------------------------------------------
+# Instrumentation
+# ----------------------------------------------------------------------
+class StageStats:
+    def __init__(self):
+        self.seconds: dict[tuple[str, str], float] = defaultdict(float)
+        self.docs: dict[tuple[str, str], int] = defaultdict(int)
+
+    def add(self, entity: str, stage: str, seconds: float, docs: int) -> None:
+        self.seconds[entity, stage] += seconds
+        self.docs[entity, stage] += docs
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "entity": entity,
+                "stage": stage,
+                "docs": self.docs[entity, stage],
+                "seconds": round(seconds, 3),
+                "docs_per_sec": round(self.docs[entity, stage] / seconds, 1)
+                if seconds
+                else None,
+            }
+            for (entity, stage), seconds in self.seconds.items()
+        ]
+
+
+def timed_fetch(fetch_fn, stats: StageStats, entity: str):
+    """The extractor's batch generator, timing each round trip to Postgres."""
+
+    def fetch(*args, **kwargs) -> Iterator[list[dict]]:
+        batches = fetch_fn(*args, **kwargs)
+        while True:
+            start = time.perf_counter()
+            rows = next(batches, None)
+            if rows is None:
+                return
+            stats.add(entity, "extract", time.perf_counter() - start, len(rows))
+            yield rows
+
+    return fetch
+
+
+class TimedTransformer:
+    def __init__(self, transformer, stats: StageStats, entity: str):
+        self.transformer = transformer
+        self.stats = stats
+        self.entity = entity
+
+    def transform(self, row: dict[str, Any]) -> dict[str, Any]:
+        start = time.perf_counter()
+        doc = self.transformer.transform(row)
+        self.stats.add(self.entity, "transform", time.perf_counter() - start, 1)
+        return doc
+
+
+class TimedLoader:
+    def __init__(self, loader, stats: StageStats):
+        self.loader = loader
+        self.stats = stats
+
+    def load_bulk(self, docs: list[dict[str, Any]], index: str) -> None:
+        start = time.perf_counter()
+        self.loader.load_bulk(docs, index=index)
+        self.stats.add(index, "load", time.perf_counter() - start, len(docs))
+
+
+def run_pipeline(args, stats: StageStats) -> float:
+    os.chdir(ROOT / "etl")  # sql/ and es_schemas/ are read relative to cwd
+    sys.path.append(str(ROOT / "etl"))
+    from es_loader import ElasticLoader, ElasticsearchHealthChecker
+    from etl_pipeline import ETLPipeline
+    from pg_extractor import PostgresExtractor
+    from state_storage import BaseStorage
+
+    class MemoryStorage(BaseStorage):
+        """Fresh state on every run, so the whole catalog is reindexed."""
+
+        def __init__(self):
+            self.data: dict[str, Any] = {}
+
+        def save_state(self, key: str, value: Any) -> None:
+            self.data[key] = value
+
+        def retrieve_state(self, key: str) -> Optional[Any]:
+            return self.data.get(key)
+
+    if args.fresh:
+        from elasticsearch import Elasticsearch
+
+        es = Elasticsearch([args.es_url])
+        for index in ("movies", "genres", "persons"):
+            es.options(ignore_status=404).indices.delete(index=index)
+    # Creates the indices from etl/es_schemas when they are missing
+    loader = ElasticLoader(
+        health_checker=ElasticsearchHealthChecker(args.es_url), es_host=args.es_url
+    )
+
+    pipeline = ETLPipeline(
+        PostgresExtractor(args.dsn), TimedLoader(loader, stats), MemoryStorage()
+    )
+    for etl in pipeline.entities:
+        etl.fetch_fn = timed_fetch(etl.fetch_fn, stats, etl.name)
+        etl.transformer = TimedTransformer(etl.transformer, stats, etl.name)
+
+    start = time.perf_counter()
+    pipeline.run(batch_size=args.batch_size)
+    return time.perf_counter() - start
+
+
+def report(seeded: Optional[dict], stats: StageStats, wall: float) -> None:
+    if seeded:
+        print("seeded " + ", ".join(f"{n} {t}" for t, n in seeded.items()))
+    for row in stats.rows():
+        print(
+            f"{row['entity']:<8} {row['stage']:<9} {row['docs']:>9} docs"
+            f" {row['seconds']:9.2f}s {row['docs_per_sec'] or 0:10.1f} docs/s"
+        )
+    total = sum(n for (_, stage), n in stats.docs.items() if stage == "load")
+    print(f"total    {total} docs in {wall:.2f}s = {total / wall:.1f} docs/s")
+    print(f"peak RSS {peak_rss_mb():.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--films", type=int, default=100_000, help="catalog size")
+    parser.add_argument("--seed-value", type=int, default=0, help="catalog RNG seed")
+    parser.add_argument(
+        "--seed", action="store_true", help="TRUNCATE the content tables and refill"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--es-url", default="http://localhost:9200")
+    parser.add_argument("--pg-host", default=os.getenv("DB_HOST", "localhost"))
+    parser.add_argument("--pg-port", type=int, default=os.getenv("DB_PORT", 5432))
+    parser.add_argument("--pg-db", default=os.getenv("DB_NAME", "theatre"))
+    parser.add_argument("--pg-user", default=os.getenv("DB_USER", "postgres"))
+    parser.add_argument("--pg-password", default=os.getenv("DB_PASSWORD", ""))
+    parser.add_argument(
+        "--keep-indices", dest="fresh", action="store_false",
+        help="index into the existing ES indices instead of recreating them",
+    )  # fmt: skip
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args()
+
+    args.dsn = {
+        "dbname": args.pg_db,
+        "user": args.pg_user,
+        "password": args.pg_password,
+        "host": args.pg_host,
+        "port": args.pg_port,
+    }
+    # The ETL modules read these through config.config at import time
+    for name, value in {
+        "DB_USER": args.pg_user,
+        "DB_PASSWORD": args.pg_password,
+        "DB_NAME": args.pg_db,
+        "DB_HOST": args.pg_host,
+        "ELK_URL": args.es_url,
+        "ELK_INDEX": "movies",
+        "SCHEMA_FILE": "movies_schema.json",
+        "REDIS_HOST": "localhost",
+    }.items():
+        os.environ.setdefault(name, str(value))
+
+    seeded = None
+    if args.seed:
+        import psycopg2
+
+        conn = psycopg2.connect(**args.dsn)
+        start = time.perf_counter()
+        seeded = seed_postgres(conn, CatalogGenerator(args.films, args.seed_value))
+        conn.close()
+        rows = sum(seeded.values())
+        print(f"COPY {rows} rows in {time.perf_counter() - start:.1f}s")
+
+    stats = StageStats()
+    wall = run_pipeline(args, stats)
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "seeded": seeded,
+                    "stages": stats.rows(),
+                    "wall_seconds": round(wall, 3),
+                    "peak_rss_mb": round(peak_rss_mb(), 1),
+                },
+                indent=2,
+            )
+        )
+    else:
+        report(seeded, stats, wall)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+In-process stand-ins for Elasticsearch and Redis, for benchmarks only.
+
+They implement just the calls and query clauses the films API issues, so
+the whole request path (routers, services, repository, cache, encoding)
+runs without containers. Numbers measure the API itself, not ES.
+"""
+
+import itertools
+from typing import Any, Optional
+
+from elastic_transport import ApiResponseMeta, HttpHeaders
+from elasticsearch import NotFoundError
+
+
+def _field(doc: dict[str, Any], field: str) -> Any:
+    # keyword/search_as_you_type sub-fields hold the parent's value
+    return doc.get(field.split(".")[0])
+
+
+def _values(doc: dict[str, Any], field: str) -> list[Any]:
+    value = _field(doc, field)
+    return value if isinstance(value, list) else [value]
+
+
+def matches(doc: dict[str, Any], query: Optional[dict[str, Any]]) -> bool:
+    if not query or "match_all" in query:
+        return True
+    if "bool" in query:
+        clause = query["bool"]
+        required = clause.get("must", []) + clause.get("filter", [])
+        if not all(matches(doc, q) for q in required):
+            return False
+        should = clause.get("should", [])
+        return not should or any(matches(doc, q) for q in should)
+    if "term" in query:
+        (field, value), = query["term"].items()
+        if "." in field and field.split(".")[1] == "id":
+            return any(item.get("id") == value for item in doc.get(field.split(".")[0], []))
+        return value in _values(doc, field)
+    if "range" in query:
+        (field, bounds), = query["range"].items()
+        value = _field(doc, field)
+        if value is None:
+            return False
+        return value >= bounds.get("gte", value) and value <= bounds.get("lte", value)
+    if "nested" in query:
+        return matches(doc, query["nested"]["query"])
+    if "multi_match" in query:
+        words = query["multi_match"]["query"].lower().split()
+        text = " ".join(
+            str(v)
+            for f in query["multi_match"]["fields"]
+            for v in _values(doc, f)
+            if v is not None
+        ).lower()
+        return all(word in text for word in words)
+    raise NotImplementedError(f"fake ES does not support {query}")
+
+
+def matched_queries(doc: dict[str, Any], query: Optional[dict[str, Any]]) -> list:
+    """Names of the named (`_name`) should clauses the document matches."""
+    should = (query or {}).get("bool", {}).get("should", [])
+    return [
+        clause[kind]["_name"]
+        for clause in should
+        for kind in clause
+        if "_name" in clause[kind] and matches(doc, clause)
+    ]
+
+
+class FakeElasticsearch:
+    def __init__(self, documents: dict[str, list[dict[str, Any]]]):
+        self.indices = {
+            index: {doc["id"]: doc for doc in docs} for index, docs in documents.items()
+        }
+        self._pits: dict[str, str] = {}
+        self._pit_ids = itertools.count()
+
+    @staticmethod
+    def _not_found() -> NotFoundError:
+        meta = ApiResponseMeta(404, "1.1", HttpHeaders(), 0.0, None)
+        return NotFoundError("not_found", meta, {"found": False})
+
+    @staticmethod
+    def _project(doc: dict[str, Any], source: Any) -> dict[str, Any]:
+        if not isinstance(source, list):
+            return doc
+        return {k: doc[k] for k in source if k in doc}
+
+    async def get(self, index: str, id: str, source_includes=None, **_):
+        doc = self.indices[index].get(id)
+        if doc is None:
+            raise self._not_found()
+        return {
+            "_index": index,
+            "_id": id,
+            "_seq_no": 1,
+            "_primary_term": 1,
+            "found": True,
+            "_source": self._project(doc, source_includes),
+        }
+
+    async def mget(self, index: str, ids: list[str], source_includes=None, **_):
+        docs = []
+        for id_ in ids:
+            doc = self.indices[index].get(id_)
+            docs.append(
+                {"_id": id_, "found": doc is not None}
+                | ({"_source": self._project(doc, source_includes)} if doc else {})
+            )
+        return {"docs": docs}
+
+    async def search(self, index: Optional[str] = None, body=None, **_):
+        body = body or {}
+        if index is None:
+            index = self._pits[body["pit"]["id"]]
+        hits = [
+            (name, doc)
+            for name in index.split(",")
+            for doc in self.indices[name].values()
+            if matches(doc, body.get("query"))
+        ]
+
+        for sort in reversed(body.get("sort", [])):
+            (field, order), = sort.items()
+            if field in ("_score", "_shard_doc"):
+                continue
+            order = order["order"] if isinstance(order, dict) else order
+            hits.sort(
+                key=lambda hit: (_field(hit[1], field) is None, _field(hit[1], field)),
+                reverse=order == "desc",
+            )
+
+        start = body.get("from", 0)
+        if body.get("search_after"):
+            start = body["search_after"][-1] + 1
+        size = body.get("size", 10)
+        page = [
+            {
+                "_index": name,
+                "_id": doc["id"],
+                "_seq_no": 1,
+                "_primary_term": 1,
+                "_source": self._project(doc, body.get("_source")),
+                "sort": [position],
+                "matched_queries": matched_queries(doc, body.get("query")),
+            }
+            for position, (name, doc) in enumerate(hits[start : start + size], start)
+        ]
+
+        resp = {"took": 0, "hits": {"total": {"value": len(hits)}, "hits": page}}
+        if "aggs" in body:
+            resp["aggregations"] = self._aggregate([doc for _, doc in hits], body["aggs"])
+        if "pit" in body:
+            resp["pit_id"] = body["pit"]["id"]
+        return resp
+
+    @staticmethod
+    def _aggregate(docs: list[dict], aggs: dict[str, Any]) -> dict[str, Any]:
+        result = {}
+        for name, agg in aggs.items():
+            if "terms" in agg:
+                counts: dict[Any, int] = {}
+                for doc in docs:
+                    for value in _values(doc, agg["terms"]["field"]):
+                        counts[value] = counts.get(value, 0) + 1
+                top = sorted(counts.items(), key=lambda kv: -kv[1])
+                buckets = [{"key": k, "doc_count": c} for k, c in top]
+                result[name] = {"buckets": buckets[: agg["terms"].get("size", 10)]}
+            elif "range" in agg:
+                field = agg["range"]["field"]
+                buckets = []
+                for spec in agg["range"]["ranges"]:
+                    low, high = spec.get("from", float("-inf")), spec.get("to", float("inf"))
+                    count = sum(
+                        1
+                        for doc in docs
+                        if doc.get(field) is not None and low <= doc[field] < high
+                    )
+                    buckets.append({"key": spec.get("key"), "doc_count": count})
+                result[name] = {"buckets": buckets}
+        return result
+
+    async def msearch(self, searches: list[dict[str, Any]], **_):
+        responses = []
+        for header, body in zip(searches[::2], searches[1::2]):
+            responses.append(await self.search(index=header["index"], body=body))
+        return {"responses": responses}
+
+    async def open_point_in_time(self, index: str, **_):
+        pit_id = f"pit-{next(self._pit_ids)}"
+        self._pits[pit_id] = index
+        return {"id": pit_id}
+
+    async def close_point_in_time(self, id: str, **_):
+        self._pits.pop(id, None)
+        return {"succeeded": True}
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    """Dict-backed subset of redis.asyncio.Redis (bytes in, bytes out; no TTLs)."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+
+    @staticmethod
+    def _bytes(value: Any) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = self._bytes(value)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = self._bytes(value)
+        return value
+
+    async def hmget(self, key, fields):
+        entry = self.data.get(key, {})
+        return [entry.get(field) for field in fields]
+
+    async def hset(self, key, mapping):
+        entry = self.data.setdefault(key, {})
+        entry.update({k: self._bytes(v) for k, v in mapping.items()})
+
+    async def expire(self, key, ttl):
+        return key in self.data
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(await getattr(self.redis, name)(*args, **kwargs))
+        self.commands = []
+        return results
@@ -0,0 +1,79 @@
+"""
+Import-time profile of the API entry points (cold-start cost).
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter from
+the app directory, so nothing is cached in-process, and prints the total
+plus the slowest modules by self and by cumulative time.
+
+    python benchmarks/import_profile.py --app src --top 15
+    python benchmarks/import_profile.py --app auth_service -n 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def profile(app_dir: Path, module: str) -> list[tuple[int, int, str]]:
+    """(self us, cumulative us, module) for every import, in import order."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=app_dir,
+        # config/ lives at the repo root (mounted at /opt/config in Docker)
+        env={**os.environ, "PYTHONPATH": f"{app_dir}{os.pathsep}{ROOT}"},
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative), name.rstrip()))
+    if proc.returncode:
+        print(f"warning: import {module} failed; partial profile", file=sys.stderr)
+        print(proc.stderr.strip().splitlines()[-1], file=sys.stderr)
+    return rows
+
+
+def depth(name: str) -> int:
+    # Indentation encodes nesting: one space at the top, two more per level
+    return (len(name) - len(name.lstrip()) - 1) // 2
+
+
+def at_depth(rows: list[tuple[int, int, str]], level: int) -> list:
+    return [row for row in rows if depth(row[2]) == level]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--app", default="src", help="src or auth_service")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("-n", type=int, default=3, help="runs; the median is shown")
+    args = parser.parse_args()
+
+    runs = [profile(ROOT / args.app, args.module) for _ in range(args.n)]
+    totals = [sum(row[1] for row in at_depth(rows, 0)) / 1000 for rows in runs]
+    rows = runs[totals.index(statistics.median_low(totals))]
+
+    print(
+        f"import {args.module} ({args.app}): {statistics.median(totals):.1f}ms"
+        f" median of {args.n}, {len(rows)} modules"
+    )
+    print(f"\nslowest direct imports of {args.module} (cumulative):")
+    direct = sorted(at_depth(rows, 1), key=lambda r: -r[1])
+    for self_us, cumulative, name in direct[: args.top]:
+        print(f"  {cumulative / 1000:8.1f}ms  {name.strip()}")
+    print("\nslowest by self time:")
+    for self_us, cumulative, name in sorted(rows, key=lambda r: -r[0])[: args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Password hashing throughput per scheme and cost setting.
+
+For each setting prints the single-hash latency and the hashes/sec of a
+pool of --threads workers (HASH_WORKERS in the auth service), so costs can
+be matched to the login QPS of the target hardware: a cost is affordable
+when peak logins/sec stay well below the pool's hashes/sec.
+
+    python benchmarks/password_hash.py --threads 4 -n 32
+    python benchmarks/password_hash.py --bcrypt 12 13 --argon2 2:19456 3:65536
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for name, value in {
+    "JWT_ACCESS_SECRET": "bench",
+    "JWT_REFRESH_SECRET": "bench",
+    "REDIS_URL": "redis://localhost",
+    "DATABASE_URL": "postgresql+asyncpg://localhost/bench",
+}.items():
+    os.environ.setdefault(name, value)
+sys.path.insert(0, str(ROOT / "auth_service"))
+from security.password import Argon2idScheme, BcryptScheme  # noqa: E402
+
+
+def measure(scheme, n: int, threads: int) -> tuple[float, float]:
+    """(median ms per hash on one thread, hashes/sec with `threads` threads)."""
+    single = []
+    for i in range(max(3, n // 4)):
+        start = time.perf_counter()
+        scheme.hash(f"password-{i}")
+        single.append((time.perf_counter() - start) * 1000)
+
+    with ThreadPoolExecutor(threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(scheme.hash, (f"password-{i}" for i in range(n))))
+        elapsed = time.perf_counter() - start
+    return statistics.median(single), n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bcrypt", type=int, nargs="*", default=[10, 11, 12, 13])
+    parser.add_argument(
+        "--argon2", nargs="*", default=["1:19456", "2:19456", "3:65536"],
+        help="time_cost:memory_cost_kib[:parallelism]",
+    )  # fmt: skip
+    parser.add_argument("--threads", type=int, default=len(os.sched_getaffinity(0)))
+    parser.add_argument("-n", type=int, default=32, help="hashes per setting")
+    args = parser.parse_args()
+
+    settings = [(f"bcrypt rounds={r}", BcryptScheme(r)) for r in args.bcrypt]
+    for spec in args.argon2:
+        t, m, *p = (int(x) for x in spec.split(":"))
+        label = f"argon2id t={t} m={m // 1024}MiB p={p[0] if p else 1}"
+        settings.append((label, Argon2idScheme(t, m, p[0] if p else 1)))
+
+    print(f"{args.threads} threads, {args.n} hashes per setting")
+    for label, scheme in settings:
+        latency, rate = measure(scheme, args.n, args.threads)
+        print(f"{label:<28} {latency:8.1f} ms/hash  {rate:8.1f} hashes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Rate limiter throughput against a real Redis.
+
+Runs GCRA decisions from --concurrency tasks sharing one connection pool (as
+an auth worker does) and prints decisions/sec with p50/p99 latency, then the
+same number of decisions sent in pipelined batches of --batch keys. --keys
+spreads the load over that many clients; with one key every decision hits
+the same slot.
+
+    python benchmarks/rate_limit_throughput.py --redis redis://localhost:6379/15 -n 20000
+    python benchmarks/rate_limit_throughput.py --concurrency 1 8 64 --batch 50 --keys 1
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "auth_service"))
+from rate_limit.gcra import RateLimiter  # noqa: E402
+
+
+async def run_hits(limiter: RateLimiter, n: int, concurrency: int, keys: int):
+    latencies: list[float] = []
+    allowed = 0
+
+    async def worker(offset: int):
+        nonlocal allowed
+        for i in range(offset, n, concurrency):
+            start = time.perf_counter()
+            result = await limiter.hit(f"user-{i % keys}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            allowed += result.allowed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(c) for c in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return n / elapsed, latencies, allowed
+
+
+async def run_batches(limiter: RateLimiter, n: int, batch: int, keys: int):
+    start = time.perf_counter()
+    allowed = 0
+    for first in range(0, n, batch):
+        batch_keys = [f"user-{i % keys}" for i in range(first, min(n, first + batch))]
+        allowed += sum(r.allowed for r in await limiter.hit_many(batch_keys))
+    return n / (time.perf_counter() - start), allowed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--redis", default="redis://localhost:6379/15")
+    parser.add_argument("-n", type=int, default=10000, help="decisions per run")
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 16, 64])
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--period", type=float, default=60)
+    args = parser.parse_args()
+
+    pool = BlockingConnectionPool.from_url(
+        args.redis, max_connections=max(args.concurrency), decode_responses=True
+    )
+    redis = Redis(connection_pool=pool)
+    prefix = f"bench-rate-{uuid.uuid4().hex[:8]}"
+
+    def limiter(run: str) -> RateLimiter:
+        # Fresh keys per run, so every run starts with full bursts
+        return RateLimiter(redis, args.limit, args.period, prefix=f"{prefix}:{run}")
+
+    print(f"{args.n} decisions over {args.keys} keys, {args.limit}/{args.period:g}s")
+    try:
+        for concurrency in args.concurrency:
+            rate, latencies, allowed = await run_hits(
+                limiter(f"c{concurrency}"), args.n, concurrency, args.keys
+            )
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(
+                f"hit       concurrency={concurrency:<4} {rate:9.0f} decisions/s"
+                f"  p50 {statistics.median(latencies):6.2f}ms  p99 {p99:6.2f}ms"
+                f"  allowed {allowed}"
+            )
+        rate, allowed = await run_batches(
+            limiter("batch"), args.n, args.batch, args.keys
+        )
+        print(
+            f"hit_many  batch={args.batch:<10} {rate:9.0f} decisions/s"
+            f"  allowed {allowed}"
+        )
+    finally:
+        async for key in redis.scan_iter(f"{prefix}:*", count=1000):
+            await redis.delete(key)
+        await redis.aclose()
+        await pool.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
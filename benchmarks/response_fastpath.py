@@ -0,0 +1,100 @@
+"""
+Per-page CPU of building and serialising ES hits.
+
+Compares the validated path (model per hit, then FastAPI's response_model
+validation and serialisation) with the trusted fast path (the `_source`
+dicts passed straight to orjson, as with `raw=True` and json_response).
+model_construct is measured too: in pydantic v2 it is a Python loop and
+no faster than validation. No ES or Redis needed.
+
+    python benchmarks/response_fastpath.py --hits 100 -n 300
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import orjson
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from api.v1.response_cache import encode_body  # noqa: E402
+from models.models import FilmWork  # noqa: E402
+
+
+def make_hits(n: int) -> list[dict]:
+    return [
+        {
+            "_source": {
+                "id": str(uuid.uuid4()),
+                "title": f"Film {i}",
+                "description": "A long enough description of the film. " * 5,
+                "creation_date": "2001-01-01",
+                "rating": 7.5,
+                "type": "movie",
+                "created": "2021-06-16T20:14:09.221838",
+                "modified": "2021-06-16T20:14:09.221838",
+            }
+        }
+        for i in range(n)
+    ]
+
+
+async def validated(hits: list[dict], field) -> bytes:
+    films = [FilmWork(**hit["_source"]) for hit in hits]
+    content = await serialize_response(field=field, response_content=films)
+    return orjson.dumps(content)
+
+
+async def constructed(hits: list[dict], field) -> bytes:
+    films = [FilmWork.model_construct(**hit["_source"]) for hit in hits]
+    return encode_body(films)
+
+
+async def passthrough(hits: list[dict], field) -> bytes:
+    return encode_body([hit["_source"] for hit in hits])
+
+
+def measure(fn, hits, field, n: int) -> list[float]:
+    timings = []
+    for _ in range(n):
+        coro = fn(hits, field)
+        start = time.perf_counter()
+        try:
+            coro.send(None)
+        except StopIteration:
+            pass
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    q = statistics.quantiles(timings, n=100)
+    print(f"{name:<12} p50={q[49]:8.1f}us p95={q[94]:8.1f}us per page")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hits", type=int, default=100, help="hits per page")
+    parser.add_argument("-n", type=int, default=300, help="pages per variant")
+    args = parser.parse_args()
+
+    hits = make_hits(args.hits)
+    field = create_model_field(
+        name="Response", type_=list[FilmWork], mode="serialization"
+    )
+    slow = measure(validated, hits, field, args.n)
+    report("validated", slow)
+    report("construct", measure(constructed, hits, field, args.n))
+    fast = measure(passthrough, hits, field, args.n)
+    report("passthrough", fast)
+    saved = 1 - statistics.median(fast) / statistics.median(slow)
+    print(f"saved {saved:.0%} per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -68,6 +68,12 @@ class Settings(BaseSettings):
     elk_url: str = Field(..., alias="ELK_URL")
     elk_index: str = Field(..., alias="ELK_INDEX")
     elk_port: int = Field(9200, alias="ELK_PORT")
+    es_timeout: float = Field(2.0, alias="ES_TIMEOUT")
+    es_max_concurrency: int = Field(50, alias="ES_MAX_CONCURRENCY")
+    es_breaker_threshold: int = Field(5, alias="ES_BREAKER_THRESHOLD")
+    es_breaker_reset_timeout: float = Field(30.0, alias="ES_BREAKER_RESET_TIMEOUT")
+    es_msearch_window_ms: float = Field(0, alias="ES_MSEARCH_WINDOW_MS")
+    es_msearch_max_batch: int = Field(50, alias="ES_MSEARCH_MAX_BATCH")
 
     # Other settings
     schema_file: str = Field(..., alias="SCHEMA_FILE")
@@ -75,6 +81,14 @@ class Settings(BaseSettings):
     # Redis settings
     redis_host: str = Field(..., alias="REDIS_HOST")
     redis_port: int = Field(6379, alias="REDIS_PORT")
+    cache_ttl: int = Field(3600, alias="CACHE_TTL")
+    cache_serializer: str = Field("orjson", alias="CACHE_SERIALIZER")
+    cache_compress_min_size: int = Field(1024, alias="CACHE_COMPRESS_MIN_SIZE")
+    home_materialize_interval: float = Field(5.0, alias="HOME_MATERIALIZE_INTERVAL")
+
+    # Readiness probes (/health/ready)
+    health_probe_timeout: float = Field(0.5, alias="HEALTH_PROBE_TIMEOUT")
+    health_cache_ttl: float = Field(2.0, alias="HEALTH_CACHE_TTL")
 
 
 settings = Settings()
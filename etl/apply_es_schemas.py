@@ -34,7 +34,10 @@ def apply_elastic_schemas():
                 resp.status_code == 400
                 and "resource_already_exists_exception" in resp.text
             ):
-                logging.warning(f"ℹ️ Index '{index_name}' already exists. Skipping.")
+                logging.warning(
+                    f"ℹ️ Index '{index_name}' already exists. Updating mappings."
+                )
+                update_mappings(index_name, schema_json["mappings"])
             else:
                 logging.error(
                     f"❌ Failed to create index '{index_name}': {resp.status_code} {resp.text}"
@@ -47,3 +50,17 @@ def apply_elastic_schemas():
             logging.exception(
                 f"💥 Unexpected error while applying schema to '{index_name}': {e}"
             )
+
+
+def update_mappings(index_name: str, mappings: dict):
+    """
+    Добавляет в существующий индекс новые поля и подполя (например, `type.raw`).
+    Уже загруженные документы получат их после переиндексации.
+    """
+    resp = requests.put(f"{settings.elk_url}/{index_name}/_mapping", json=mappings)
+    if resp.ok:
+        logging.info(f"✅ Mappings of '{index_name}' are up to date.")
+    else:
+        logging.error(
+            f"❌ Failed to update mappings of '{index_name}': {resp.status_code} {resp.text}"
+        )
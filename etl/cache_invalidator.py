@@ -0,0 +1,48 @@
+import logging
+from typing import Protocol
+
+from redis import Redis
+
+from config.config import settings
+
+
+class CacheInvalidator(Protocol):
+    def invalidate(self, index: str, ids: list[str]) -> None: ...
+
+
+class RedisCacheInvalidator:
+    """
+    Сбрасывает кэш API после записи в Elasticsearch.
+
+    Ключи отдельных документов (`film:{id}`, `genre:{id}`, `person:{id}`)
+    удаляются точечно, а для готовых ответов (карточки, списки, поиск)
+    увеличивается счётчик версии индекса: API включает его в ключ,
+    поэтому старые ответы больше не читаются.
+    Формат ключей должен совпадать с src/api/v1/caching.py
+    и src/api/v1/response_cache.py.
+
+    Вызывать только после того, как записи видны поиску (refresh):
+    иначе запрос между записью и refresh прочитает старые данные
+    и закэширует их под новой версией.
+    """
+
+    KEY_PREFIXES = {"movies": "film", "genres": "genre", "persons": "person"}
+    VERSION_KEY = "cache_version:{index}"
+
+    def __init__(self, redis_adapter: Redis = None):
+        self.redis_adapter = redis_adapter or Redis(
+            host=settings.redis_host,
+            port=int(settings.redis_port),
+            db=0,
+            decode_responses=True,
+        )
+
+    def invalidate(self, index: str, ids: list[str]) -> None:
+        """Удаляет закэшированные документы и сдвигает версию индекса."""
+        pipe = self.redis_adapter.pipeline()
+        prefix = self.KEY_PREFIXES.get(index)
+        if prefix and ids:
+            pipe.delete(*[f"{prefix}:{doc_id}" for doc_id in ids])
+        pipe.incr(self.VERSION_KEY.format(index=index))
+        pipe.execute()
+        logging.debug(f"Invalidated API cache for {len(ids)} {index} documents")
@@ -64,7 +64,11 @@ class ElasticLoader:
             schema_applier.apply()
 
     def load_bulk(self, docs: list[dict[str, Any]], index: str) -> None:
-        """Insert or replace multiple documents."""
+        """
+        Insert or replace multiple documents.
+        No refresh per bulk chunk: callers that invalidate the API cache
+        call refresh() once for the batch first.
+        """
         logging.info(f"📦 Loading {len(docs)} documents into {index}...")
         actions = [
             {"_op_type": "index", "_index": index, "_id": doc["id"], "_source": doc}
@@ -73,6 +77,14 @@ class ElasticLoader:
         helpers.bulk(self.es, actions)
         logging.info(f"✅ Loaded {len(actions)} documents into {index}.")
 
+    def refresh(self, index: str) -> None:
+        """
+        Make everything written so far visible to search. Run before the API
+        cache is invalidated, otherwise a request served before the periodic
+        refresh would cache the old documents under the new version.
+        """
+        self.es.indices.refresh(index=index)
+
     def update(self, index: str, doc_id: str, doc: dict[str, Any]) -> None:
         """Partial update of a document."""
         logging.info(f"🧩 Updating document {doc_id} in {index}...")
@@ -8,11 +8,20 @@ from state_storage import RedisStorage
 from pg_extractor import PostgresExtractor
 from pg_listener import PostgresListener
 from etl_transformer import TransformerFactory
+from cache_invalidator import RedisCacheInvalidator
 
 
 class EntityETL:
     def __init__(
-        self, name: str, extractor, fetch_fn, transformer, loader, state, index: str
+        self,
+        name: str,
+        extractor,
+        fetch_fn,
+        transformer,
+        loader,
+        state,
+        index: str,
+        invalidator=None,
     ):
         self.name = name
         self.extractor = extractor
@@ -21,6 +30,7 @@ class EntityETL:
         self.loader = loader
         self.state = state
         self.index = index
+        self.invalidator = invalidator
 
     def run(self, batch_size: int):
         logging.info(f"Starting {self.name} ETL...")
@@ -29,6 +39,9 @@ class EntityETL:
         for rows in self.fetch_fn(time, ids, batch_size=batch_size):
             transformed = [self.transformer.transform(r) for r in rows]
             self.loader.load_bulk(transformed, index=self.index)
+            if self.invalidator and transformed:
+                self.loader.refresh(self.index)
+                self.invalidator.invalidate(self.index, [r["id"] for r in transformed])
             if rows:
                 self.state.save_state(
                     f"{self.name}_time",
@@ -43,7 +56,7 @@ class EntityETL:
 
 
 class ETLPipeline:
-    def __init__(self, extractor, loader, state):
+    def __init__(self, extractor, loader, state, invalidator=None):
         self.entities = [
             EntityETL(
                 "movies",
@@ -53,6 +66,7 @@ class ETLPipeline:
                 loader,
                 state,
                 "movies",
+                invalidator,
             ),
             EntityETL(
                 "genres",
@@ -62,6 +76,7 @@ class ETLPipeline:
                 loader,
                 state,
                 "genres",
+                invalidator,
             ),
             EntityETL(
                 "persons",
@@ -71,6 +86,7 @@ class ETLPipeline:
                 loader,
                 state,
                 "persons",
+                invalidator,
             ),
         ]
 
@@ -90,10 +106,11 @@ def main():
     extractor = PostgresExtractor(postgres_dsl)
     loader = ElasticLoader()
     state = RedisStorage()
-    pipeline = ETLPipeline(extractor, loader, state)
+    invalidator = RedisCacheInvalidator()
+    pipeline = ETLPipeline(extractor, loader, state, invalidator)
     pipeline.run(batch_size=int(settings.batch_size))
 
-    listener = PostgresListener(postgres_dsl)
+    listener = PostgresListener(postgres_dsl, invalidator=invalidator)
     for change in listener.wait_for_changes():
         listener.handle_change(change)
 
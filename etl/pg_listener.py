@@ -10,9 +10,15 @@ from db_routines import connect_and_listen, get_db_cursor
 class PostgresListener:
     """LISTEN/NOTIFY слушатель с автопереподключением"""
 
-    def __init__(self, dsn: dict[str, Any], channel: str = "content_changes"):
+    def __init__(
+        self,
+        dsn: dict[str, Any],
+        channel: str = "content_changes",
+        invalidator=None,
+    ):
         self.dsn = dsn
         self.channel = channel
+        self.invalidator = invalidator
         self.conn, self.cur = connect_and_listen(dsn, channel)
 
     def wait_for_changes(
@@ -49,14 +55,20 @@ class PostgresListener:
             return
 
         if op == "DELETE":
-            self.es.delete(index=self.index, id=row_id, ignore=[404])
+            self.es.delete(
+                index=self.index, id=row_id, ignore=[404], refresh="wait_for"
+            )
             logging.info(f"Deleted film {row_id} from Elasticsearch")
         else:
             row = self.fetch_film(row_id)
-            if row:
-                doc = self.transformer.transform(dict(row))
-                self.es.index(index=self.index, id=row_id, document=doc)
-                logging.debug(f"Upserted film {row_id} into Elasticsearch")
+            if not row:
+                return
+            doc = self.transformer.transform(dict(row))
+            self.es.index(
+                index=self.index, id=row_id, document=doc, refresh="wait_for"
+            )
+            logging.debug(f"Upserted film {row_id} into Elasticsearch")
+        self._invalidate([row_id])
 
     def refresh_related_films(self, row_id: str, table: str):
         """When person/genre links change, reload affected film(s)."""
@@ -83,3 +95,16 @@ class PostgresListener:
                 doc = self.transformer.transform(dict(row))
                 self.es.update(index=self.index, id=film_id, document=doc)
                 logging.debug(f"Refreshed film {film_id} due to {table} change")
+        if film_ids:
+            # One refresh for the whole batch before the cache is dropped
+            self.es.indices.refresh(index=self.index)
+        self._invalidate(film_ids)
+
+    def _invalidate(self, film_ids: list[str]):
+        """
+        Сбрасывает кэш API для изменённых фильмов.
+        Вызывается только после refresh индекса, иначе запрос между записью
+        и refresh закэширует старые данные под новой версией.
+        """
+        if self.invalidator and film_ids:
+            self.invalidator.invalidate(self.index, [str(i) for i in film_ids])
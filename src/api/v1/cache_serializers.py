@@ -0,0 +1,110 @@
+import json
+import zlib
+from typing import Any, Optional, Protocol
+
+import orjson
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for CACHE_SERIALIZER=msgpack
+    msgpack = None
+
+# One-byte header in front of every cached payload.
+RAW = b"\x00"
+ZLIB = b"\x01"
+
+
+def encode_default(value: Any) -> Any:
+    """Fallback encoder for values the serializers do not know natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+class CacheSerializer(Protocol):
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonSerializer:
+    """Stdlib JSON, kept for compatibility and debugging with redis-cli."""
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=encode_default).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """orjson: several times faster than json and emits compact UTF-8 bytes."""
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=encode_default)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer:
+    """MessagePack: the smallest payloads."""
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("CACHE_SERIALIZER=msgpack requires the msgpack package")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=encode_default)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+class CompressingSerializer:
+    """Wraps a serializer and zlib-compresses payloads above min_size bytes."""
+
+    def __init__(self, inner: CacheSerializer, min_size: int = 1024, level: int = 1):
+        self.inner = inner
+        self.min_size = min_size
+        self.level = level
+
+    def dumps(self, value: Any) -> bytes:
+        return self.pack(self.inner.dumps(value))
+
+    def loads(self, data: bytes) -> Any:
+        return self.inner.loads(self.unpack(data))
+
+    def pack(self, data: bytes) -> bytes:
+        if self.min_size and len(data) >= self.min_size:
+            return ZLIB + zlib.compress(data, self.level)
+        return RAW + data
+
+    @staticmethod
+    def unpack(data: bytes) -> bytes:
+        header = data[:1]
+        if header == ZLIB:
+            return zlib.decompress(data[1:])
+        if header == RAW:
+            return data[1:]
+        # Entries written before the header was introduced.
+        return data
+
+
+SERIALIZERS = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+
+def get_serializer(
+    name: str, compress_min_size: Optional[int] = 1024
+) -> CompressingSerializer:
+    """Build the serializer selected in settings (CACHE_SERIALIZER)."""
+    try:
+        inner = SERIALIZERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer: {name}")
+    return CompressingSerializer(inner, min_size=compress_min_size or 0)
@@ -1,16 +1,42 @@
-import json
+from typing import Any, Optional
+
 import backoff
 import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError as RedisConnectionError
+from api.v1.cache_serializers import get_serializer
 from config.config import settings
 
-CACHE_TTL = 300  # seconds
+CACHE_TTL = settings.cache_ttl  # seconds
+
+# Bumped by the ETL (etl/cache_invalidator.py) after every write to an index.
+CACHE_VERSION_KEY = "cache_version:{index}"
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    Worker-wide Redis client, created on first use rather than at import
+    (raw bytes: payloads are encoded by the serializer).
+    """
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(
+            f"redis://redis:{settings.redis_port}",
+            decode_responses=False,
+        )
+    return _redis
 
-# Create global Redis client
-redis = aioredis.from_url(
-    f"redis://redis:{settings.redis_port}",
-    decode_responses=True,
-    encoding="utf-8",
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+serializer = get_serializer(
+    settings.cache_serializer, settings.cache_compress_min_size
 )
 
 
@@ -27,9 +53,9 @@ redis = aioredis.from_url(
 async def get_from_cache(key: str):
     """Retrieve value from Redis cache (with retry if Redis temporarily unavailable)."""
     try:
-        data = await redis.get(key)
+        data = await get_redis().get(key)
         if data:
-            return json.loads(data)
+            return serializer.loads(data)
         return None
     except RedisConnectionError as e:
         raise e
@@ -44,8 +70,112 @@ async def get_from_cache(key: str):
     on_backoff=lambda d: print(f"⚠️ Retrying Redis set (attempt {d['tries']})..."),
 )
 async def set_to_cache(key: str, value, ttl: int = CACHE_TTL):
-    """Store value in Redis cache as JSON (with retry if Redis temporarily unavailable)."""
+    """Store value in Redis cache (with retry if Redis temporarily unavailable)."""
     try:
-        await redis.set(key, json.dumps(value, default=str), ex=ttl)
+        await get_redis().set(key, serializer.dumps(value), ex=ttl)
     except RedisConnectionError as e:
         raise e
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis mget (attempt {d['tries']})..."),
+)
+async def get_many_from_cache(keys: list[str]) -> list[Optional[Any]]:
+    """Retrieve several values in one MGET; misses come back as None."""
+    if not keys:
+        return []
+    values = await get_redis().mget(keys)
+    return [serializer.loads(data) if data else None for data in values]
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis mset (attempt {d['tries']})..."),
+)
+async def set_many_to_cache(items: dict[str, Any], ttl: int = CACHE_TTL):
+    """Store several values in one pipelined round trip."""
+    if not items:
+        return
+    async with get_redis().pipeline(transaction=False) as pipe:
+        for key, value in items.items():
+            pipe.set(key, serializer.dumps(value), ex=ttl)
+        await pipe.execute()
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(
+        f"⚠️ Retrying Redis version lookup (attempt {d['tries']})..."
+    ),
+)
+async def get_cache_version(index: str) -> int:
+    """
+    Current cache generation of an ES index.
+    List and search keys embed it, so an ETL write makes old pages unreachable.
+    """
+    version = await get_redis().get(CACHE_VERSION_KEY.format(index=index))
+    return int(version or 0)
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis get (attempt {d['tries']})..."),
+)
+async def get_bytes_from_cache(key: str) -> Optional[bytes]:
+    """Retrieve an already rendered body (HTML page, fragment) as stored."""
+    return await get_redis().get(key)
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis set (attempt {d['tries']})..."),
+)
+async def set_bytes_to_cache(key: str, body: bytes, ttl: int = CACHE_TTL):
+    """Store a rendered body as is, bypassing the serializer."""
+    await get_redis().set(key, body, ex=ttl)
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis claim (attempt {d['tries']})..."),
+)
+async def claim_key(key: str, ttl: int = CACHE_TTL) -> bool:
+    """SET NX: True only for the first caller, across all workers."""
+    return bool(await get_redis().set(key, b"1", nx=True, ex=ttl))
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(f"⚠️ Retrying Redis delete (attempt {d['tries']})..."),
+)
+async def release_key(key: str) -> None:
+    await get_redis().delete(key)
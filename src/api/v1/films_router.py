@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from elasticsearch import AsyncElasticsearch, NotFoundError
 from typing import List, Optional
-from models.models import FilmWork
+from api.v1.pagination import (
+    CURSOR_DESCRIPTION,
+    decode_cursor,
+    next_cursor_headers,
+)
+from api.v1.response_cache import json_response, render_response
+from models.models import FilmWork, IdsBatch
 from repositories.elastic_repository import ElasticRepository
 from services.film_service import FilmService
 
@@ -27,17 +33,31 @@ def get_film_service(
     return FilmService(repo)
 
 
+@films_router.post("/batch", response_model=List[FilmWork])
+async def get_films_batch(
+    batch: IdsBatch, service: FilmService = Depends(get_film_service)
+):
+    """Get several films by ID in one request; unknown ids are skipped."""
+    return json_response(await service.get_films(batch.ids))
+
+
 @films_router.get("/{film_id}", response_model=FilmWork)
-async def get_film(film_id: str, service: FilmService = Depends(get_film_service)):
+async def get_film(
+    film_id: str,
+    request: Request,
+    service: FilmService = Depends(get_film_service),
+):
     """Get a single film by ID."""
     try:
-        return await service.get_film(film_id)
+        cached = await service.get_film_response(film_id)
     except NotFoundError:
         raise HTTPException(status_code=404, detail="film not found")
+    return render_response(cached, request)
 
 
 @films_router.get("/", response_model=List[FilmWork])
 async def list_films(
+    request: Request,
     sort: Optional[str] = Query(None),
     sort_order: str = Query("desc", regex="^(asc|desc)$"),
     min_rating: Optional[float] = Query(None),
@@ -45,8 +65,16 @@ async def list_films(
     type: Optional[str] = Query(None, alias="type"),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: FilmService = Depends(get_film_service),
 ):
-    return await service.list_films(
+    if cursor is not None:
+        films, next_cursor = await service.list_films_page(
+            sort, sort_order, min_rating, max_rating, type, limit, decode_cursor(cursor)
+        )
+        return json_response(films, headers=next_cursor_headers(next_cursor))
+
+    cached = await service.list_films_response(
         sort, sort_order, min_rating, max_rating, type, limit, offset
     )
+    return render_response(cached, request)
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from elasticsearch import AsyncElasticsearch, NotFoundError
 from typing import List, Optional
 
+from api.v1.pagination import (
+    CURSOR_DESCRIPTION,
+    decode_cursor,
+    next_cursor_headers,
+)
+from api.v1.response_cache import json_response, render_response
 from config.config import settings
-from models.models import Genre
+from models.models import Genre, IdsBatch
 from repositories.elastic_repository import ElasticRepository
 from services.genre_service import GenreService
 from dependencies.auth import get_current_user
@@ -26,22 +32,44 @@ def get_genre_service(
     return GenreService(repo)
 
 
+@genres_router.post("/batch", response_model=List[Genre])
+async def get_genres_batch(
+    batch: IdsBatch, service: GenreService = Depends(get_genre_service)
+):
+    """Get several genres by ID in one request; unknown ids are skipped."""
+    return json_response(await service.get_genres(batch.ids))
+
+
 @genres_router.get("/{genre_id}", response_model=Genre)
-async def get_genre(genre_id: str, service: GenreService = Depends(get_genre_service)):
+async def get_genre(
+    genre_id: str,
+    request: Request,
+    service: GenreService = Depends(get_genre_service),
+):
     """Get a single genre by ID."""
     try:
-        return await service.get_genre(genre_id)
+        cached = await service.get_genre_response(genre_id)
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Genre not found")
+    return render_response(cached, request)
 
 
 @genres_router.get("/", response_model=List[Genre])
 async def list_genres(
+    request: Request,
     sort: Optional[str] = Query(None),
     sort_order: str = Query("asc", regex="^(asc|desc)$"),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: GenreService = Depends(get_genre_service),
 ):
     """List or search genres."""
-    return await service.list_genres(sort, sort_order, limit, offset)
+    if cursor is not None:
+        genres, next_cursor = await service.list_genres_page(
+            sort, sort_order, limit, decode_cursor(cursor)
+        )
+        return json_response(genres, headers=next_cursor_headers(next_cursor))
+
+    cached = await service.list_genres_response(sort, sort_order, limit, offset)
+    return render_response(cached, request)
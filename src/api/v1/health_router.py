@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+health_router = APIRouter(prefix="/health", tags=["health"])
+
+
+@health_router.get("/live", response_class=JSONResponse)
+async def liveness():
+    """
+    Процесс жив и event loop отвечает.
+    Зависимости не проверяются: их сбой не лечится перезапуском.
+    """
+    return {"status": "ok"}
+
+
+@health_router.get("/ready", response_class=JSONResponse)
+async def readiness(request: Request):
+    """
+    Готовность принимать трафик: Elasticsearch и Redis отвечают быстрее таймаута.
+    503 с задержкой и ошибкой по каждой зависимости, если хотя бы одна нет.
+    """
+    ready, checks = await request.app.state.health.check()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ok" if ready else "unavailable", "checks": checks},
+    )
@@ -0,0 +1,46 @@
+import base64
+import binascii
+from typing import Optional
+
+import orjson
+from fastapi import HTTPException, status
+
+from repositories.elastic_repository import Cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_DESCRIPTION = (
+    "Opaque cursor for deep paging. Pass an empty value to start, then the "
+    f"{NEXT_CURSOR_HEADER} header of the previous page. Keep the other "
+    "parameters unchanged between pages; offset is ignored."
+)
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    payload = orjson.dumps({"pit": cursor.pit_id, "after": cursor.search_after})
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Empty token starts a new crawl; anything unreadable is a client error."""
+    if not token:
+        return Cursor()
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = orjson.loads(base64.urlsafe_b64decode(padded))
+        return Cursor(pit_id=payload["pit"], search_after=payload["after"])
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def next_cursor_headers(cursor: Optional[Cursor]) -> dict[str, str]:
+    """
+    Headers of a cursor page for the Response the handler returns; headers
+    set on an injected Response are lost once a Response is returned.
+    No header means the crawl is complete.
+    """
+    if cursor is None:
+        return {}
+    return {NEXT_CURSOR_HEADER: encode_cursor(cursor)}
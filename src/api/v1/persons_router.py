@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from elasticsearch import AsyncElasticsearch, NotFoundError
 from typing import List, Optional
 
+from api.v1.pagination import (
+    CURSOR_DESCRIPTION,
+    decode_cursor,
+    next_cursor_headers,
+)
+from api.v1.response_cache import json_response, render_response
 from config.config import settings
-from models.models import Person
+from models.models import FilmWork, Person, IdsBatch
 from repositories.elastic_repository import ElasticRepository
+from services.film_service import FilmService
 from services.person_service import PersonService
 
 from dependencies.auth import get_current_user
@@ -27,24 +34,65 @@ def get_person_service(
     return PersonService(repo)
 
 
+def get_person_film_service(
+    es: AsyncElasticsearch = Depends(get_elastic_client),
+) -> FilmService:
+    repo = ElasticRepository(es, index="movies", model=FilmWork)
+    return FilmService(repo)
+
+
+@persons_router.post("/batch", response_model=List[Person])
+async def get_people_batch(
+    batch: IdsBatch, service: PersonService = Depends(get_person_service)
+):
+    """Get several people by ID in one request; unknown ids are skipped."""
+    return json_response(await service.get_people(batch.ids))
+
+
 @persons_router.get("/{person_id}", response_model=Person)
 async def get_person(
-    person_id: str, service: PersonService = Depends(get_person_service)
+    person_id: str,
+    request: Request,
+    service: PersonService = Depends(get_person_service),
 ):
     """Get a single person by ID."""
     try:
-        return await service.get_person(person_id)
+        cached = await service.get_person_response(person_id)
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Person not found")
+    return render_response(cached, request)
+
+
+@persons_router.get("/{person_id}/films", response_model=List[FilmWork])
+async def get_person_films(
+    person_id: str,
+    request: Request,
+    role: Optional[str] = Query(None, regex="^(actor|director|writer)$"),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    service: FilmService = Depends(get_person_film_service),
+):
+    """Films the person took part in, optionally in one role only."""
+    cached = await service.person_films_response(person_id, role, limit, offset)
+    return render_response(cached, request)
 
 
 @persons_router.get("/", response_model=List[Person])
 async def list_people(
+    request: Request,
     sort: Optional[str] = Query(None),
     sort_order: str = Query("asc", regex="^(asc|desc)$"),
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: PersonService = Depends(get_person_service),
 ):
     """List or search people."""
-    return await service.list_people(sort, sort_order, limit, offset)
+    if cursor is not None:
+        people, next_cursor = await service.list_people_page(
+            sort, sort_order, limit, decode_cursor(cursor)
+        )
+        return json_response(people, headers=next_cursor_headers(next_cursor))
+
+    cached = await service.list_people_response(sort, sort_order, limit, offset)
+    return render_response(cached, request)
@@ -0,0 +1,131 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import backoff
+import orjson
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from api.v1.cache_serializers import encode_default
+from api.v1.caching import CACHE_TTL, get_redis, serializer
+
+# Response entries live next to the data keys, so the ETL evicts both.
+RESPONSE_KEY = "response:{key}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Final JSON body of an endpoint together with its ETag."""
+
+    body: bytes
+    etag: str
+
+
+def make_etag(versions: Iterable[str]) -> str:
+    """Strong ETag over the ES revisions (`_primary_term`/`_seq_no`) of the payload."""
+    digest = hashlib.blake2b(digest_size=16)
+    for version in versions:
+        digest.update(version.encode("utf-8"))
+        digest.update(b"\n")
+    return f'"{digest.hexdigest()}"'
+
+
+def encode_model(value: Any) -> Any:
+    """
+    orjson fallback for models: hand over the declared fields as a dict.
+    Our models are flat and hold JSON-native values (str, float, date,
+    datetime), which orjson encodes itself, much faster than model_dump.
+    """
+    if isinstance(value, BaseModel):
+        return {name: getattr(value, name) for name in type(value).model_fields}
+    return encode_default(value)
+
+
+def encode_body(payload: Any) -> bytes:
+    return orjson.dumps(payload, default=encode_model)
+
+
+def json_response(
+    payload: Any, headers: Optional[dict[str, str]] = None
+) -> Response:
+    """
+    Encode trusted data straight to JSON. Returning a Response makes FastAPI
+    skip re-validating and re-serialising it against `response_model`.
+    """
+    return Response(
+        content=encode_body(payload), media_type="application/json", headers=headers
+    )
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(
+        f"⚠️ Retrying Redis response get (attempt {d['tries']})..."
+    ),
+)
+async def get_cached_response(key: str) -> Optional[CachedResponse]:
+    data = await get_redis().hmget(RESPONSE_KEY.format(key=key), ["etag", "body"])
+    etag, body = data
+    if etag is None or body is None:
+        return None
+    return CachedResponse(body=serializer.unpack(body), etag=etag.decode("utf-8"))
+
+
+@backoff.on_exception(
+    backoff.expo,
+    RedisConnectionError,
+    max_time=60,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=lambda d: print(
+        f"⚠️ Retrying Redis response set (attempt {d['tries']})..."
+    ),
+)
+async def set_cached_response(
+    key: str, cached: CachedResponse, ttl: int = CACHE_TTL
+) -> None:
+    full_key = RESPONSE_KEY.format(key=key)
+    async with get_redis().pipeline(transaction=True) as pipe:
+        body = serializer.pack(cached.body)
+        pipe.hset(full_key, mapping={"etag": cached.etag, "body": body})
+        pipe.expire(full_key, ttl)
+        await pipe.execute()
+
+
+async def cached_response(
+    key: str, loader: Callable[[], Awaitable[tuple[Any, list[str]]]]
+) -> CachedResponse:
+    """
+    Return the stored response for key, or build it once from loader.
+    loader returns the payload and the ES revisions it was built from.
+    """
+    cached = await get_cached_response(key)
+    if cached is None:
+        payload, versions = await loader()
+        cached = CachedResponse(body=encode_body(payload), etag=make_etag(versions))
+        await set_cached_response(key, cached)
+    return cached
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as required for If-None-Match (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def render_response(cached: CachedResponse, request: Request) -> Response:
+    """Send the cached bytes as is, or 304 if the client already has them."""
+    headers = {"ETag": cached.etag}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from elasticsearch import AsyncElasticsearch
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Optional, Union
 
+from api.v1.pagination import (
+    CURSOR_DESCRIPTION,
+    decode_cursor,
+    next_cursor_headers,
+)
+from api.v1.response_cache import json_response, render_response
 from config.config import settings
-from models.models import FilmWork
+from models.models import FilmSearchResult, FilmWork
 from repositories.elastic_repository import ElasticRepository
 from services.film_service import FilmService
 
@@ -31,17 +37,38 @@ def get_film_service(
 
 
 # --- Endpoint ---
-@films_search_router.get("/", response_model=list[FilmWork])
+@films_search_router.get(
+    "/", response_model=Union[list[FilmWork], FilmSearchResult]
+)
 async def search_films(
+    request: Request,
     query: str = Query(..., description="Search query string"),
     page_number: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Results per page"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    facets: bool = Query(
+        False,
+        description="Return {results, facets} with genre, type and rating counts",
+    ),
     service: FilmService = Depends(get_film_service),
 ):
     """
     Search films by title or description.
     Returns paginated FilmWork results.
     """
-    return await service.search_films(
+    if cursor is not None:
+        films, next_cursor = await service.search_films_page(
+            query=query, page_size=page_size, cursor=decode_cursor(cursor)
+        )
+        return json_response(films, headers=next_cursor_headers(next_cursor))
+
+    if facets:
+        result = await service.search_films_faceted(
+            query=query, page_number=page_number, page_size=page_size
+        )
+        return json_response(result)
+
+    cached = await service.search_films_response(
         query=query, page_number=page_number, page_size=page_size
     )
+    return render_response(cached, request)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query
+from elasticsearch import AsyncElasticsearch
+from typing import Any, AsyncGenerator
+
+from config.config import settings
+from models.models import Suggestion
+from repositories.elastic_repository import ElasticRepository
+from services.suggest_service import SUGGEST_INDICES, SuggestService
+
+from dependencies.auth import get_current_user
+
+suggest_router = APIRouter(prefix="/suggest", tags=["search"], dependencies=[Depends(get_current_user)])
+
+
+async def get_elastic_client() -> AsyncGenerator[AsyncElasticsearch, Any]:
+    client = AsyncElasticsearch(hosts=[settings.elk_url], verify_certs=False)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def get_suggest_service(
+    es: AsyncElasticsearch = Depends(get_elastic_client),
+) -> SuggestService:
+    repo = ElasticRepository(es, index=SUGGEST_INDICES, model=Suggestion)
+    return SuggestService(repo)
+
+
+@suggest_router.get("/", response_model=list[Suggestion])
+async def suggest(
+    query: str = Query(..., min_length=1, max_length=100, description="Typed prefix"),
+    limit: int = Query(10, ge=1, le=20),
+    service: SuggestService = Depends(get_suggest_service),
+):
+    """
+    Typeahead over film titles and person names.
+    Cheap enough to call on every keystroke, unlike /search/.
+    """
+    return await service.suggest(query, limit)
@@ -0,0 +1,68 @@
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import anyio
+
+Probe = Callable[[], Awaitable[Any]]
+
+
+class HealthProbes:
+    """
+    Readiness checks of the films API worker (Elasticsearch and Redis).
+
+    All probes run concurrently, each bounded by `timeout`: a dependency that
+    cannot answer within it counts as down, so traffic only reaches workers
+    that can serve quickly. Results are cached for `ttl` seconds and a burst
+    of probe requests shares one refresh, so load balancers polling every
+    worker do not multiply the load on ES and Redis.
+    """
+
+    def __init__(self, timeout: float = 0.5, ttl: float = 2.0):
+        self.timeout = timeout
+        self.ttl = ttl
+        self.probes: dict[str, Probe] = {}
+        self._lock = anyio.Lock()
+        self._checked_at: Optional[float] = None
+        self._result: dict[str, dict[str, Any]] = {}
+
+    def add(self, name: str, probe: Probe) -> None:
+        """A probe fails by raising or by returning False (as ES ping does)."""
+        self.probes[name] = probe
+
+    async def _run(self, name: str, probe: Probe, results: dict) -> None:
+        start = time.perf_counter()
+        error = None
+        try:
+            with anyio.fail_after(self.timeout):
+                ok = await probe() is not False
+        except TimeoutError:
+            ok, error = False, f"no answer within {self.timeout}s"
+        except Exception as exc:
+            ok, error = False, repr(exc)
+        result: dict[str, Any] = {
+            "ok": ok,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+        if error is not None:
+            result["error"] = error
+        results[name] = result
+
+    def _fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.ttl
+        )
+
+    async def check(self) -> tuple[bool, dict[str, dict[str, Any]]]:
+        """(ready, {dependency: {ok, latency_ms[, error]}})."""
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    results: dict[str, dict[str, Any]] = {}
+                    async with anyio.create_task_group() as tg:
+                        for name, probe in self.probes.items():
+                            tg.start_soon(self._run, name, probe, results)
+                    self._result = results
+                    self._checked_at = time.monotonic()
+        result = dict(self._result)
+        return all(check["ok"] for check in result.values()), result
@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+
+
+class StaticOpenAPI:
+    """
+    Hand-written OpenAPI schema served instead of the generated one.
+    The file is read and parsed on the first request, not at import, and the
+    encoded bytes are kept, so /openapi.json costs no JSON work afterwards.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        patch: Optional[Callable[[dict[str, Any]], None]] = None,
+    ):
+        self.path = Path(path)
+        self.patch = patch
+        self._schema: Optional[dict[str, Any]] = None
+        self._body: Optional[bytes] = None
+
+    def schema(self) -> dict[str, Any]:
+        if self._schema is None:
+            schema = orjson.loads(self.path.read_bytes())
+            if self.patch is not None:
+                self.patch(schema)
+            self._schema = schema
+        return self._schema
+
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = orjson.dumps(self.schema())
+        return self._body
+
+    def install(self, app: FastAPI, url: str = "/openapi.json") -> None:
+        """
+        Serve the schema and the docs pages.
+        The app must be created with openapi_url=None, so FastAPI does not
+        register its own (per-request serialising) routes.
+        """
+        app.openapi = self.schema
+
+        async def openapi(request: Request) -> Response:
+            return Response(self.body(), media_type="application/json")
+
+        async def swagger_ui(request: Request) -> Response:
+            root = request.scope.get("root_path", "")
+            return get_swagger_ui_html(
+                openapi_url=root + url, title=f"{app.title} - Swagger UI"
+            )
+
+        async def redoc(request: Request) -> Response:
+            root = request.scope.get("root_path", "")
+            return get_redoc_html(openapi_url=root + url, title=f"{app.title} - ReDoc")
+
+        app.add_route(url, openapi, include_in_schema=False)
+        app.add_route("/docs", swagger_ui, include_in_schema=False)
+        app.add_route("/redoc", redoc, include_in_schema=False)
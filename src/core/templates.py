@@ -0,0 +1,27 @@
+from jinja2 import Environment, FileSystemLoader
+from fastapi.templating import Jinja2Templates
+
+TEMPLATES_DIR = "templates"
+
+
+def make_templates(directory: str = TEMPLATES_DIR) -> Jinja2Templates:
+    """
+    Async Jinja environment: pages are rendered with `render_async`.
+    Templates do not change in a running container, so mtime checks are off.
+    """
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,
+        enable_async=True,
+        auto_reload=False,
+    )
+    return Jinja2Templates(env=env)
+
+
+def preload_templates(templates: Jinja2Templates) -> None:
+    """Compile every template up front instead of on the first request."""
+    for name in templates.env.list_templates():
+        templates.get_template(name)
+
+
+templates = make_templates()
@@ -1,11 +1,87 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 import jwt
+import orjson
 
 from dependencies.security import bearer_scheme
 from dependencies.auth_settings import settings
 
 
+class TokenCache:
+    """
+    Bounded LRU of verified JWT payloads, keyed by a hash of the token.
+    An entry never outlives the token's `exp`, and is capped by `ttl`
+    so that secret rotation and revocation take effect within `ttl` seconds.
+    Only successfully verified tokens are stored.
+
+    The auth dependencies are sync, so FastAPI calls them from its threadpool:
+    all access goes through a lock. Payloads are kept encoded and every get
+    returns a fresh dict, so no request can change another one's claims.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, payload = entry
+            if expires <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return orjson.loads(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        expires = time.time() + self.ttl
+        if "exp" in payload:
+            expires = min(expires, payload["exp"])
+        key = self._key(token)
+        encoded = orjson.dumps(payload)
+        with self._lock:
+            self._data[key] = (expires, encoded)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+token_cache = TokenCache(settings.JWT_CACHE_SIZE, settings.JWT_CACHE_TTL)
+
+
+def decode_token(token: str) -> dict:
+    """jwt.decode with the verification result cached for repeat requests."""
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(
+            token,
+            settings.JWT_ACCESS_SECRET,
+            algorithms=[settings.JWT_ALGORITHM],
+            issuer=settings.AUTH_ISSUER,
+        )
+        token_cache.set(token, payload)
+    return payload
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
 ):
@@ -18,12 +94,7 @@ def get_current_user(
     token = credentials.credentials
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_ACCESS_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-            issuer=settings.AUTH_ISSUER,
-        )
+        payload = decode_token(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -38,12 +109,7 @@ def get_anonymous_user(
         return None
 
     try:
-        return jwt.decode(
-            credentials.credentials,
-            settings.JWT_ACCESS_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-            issuer=settings.AUTH_ISSUER,
-        )
+        return decode_token(credentials.credentials)
     except jwt.InvalidTokenError:
         return None
 
@@ -52,4 +118,4 @@ def require_role(role: str):
         if role not in user.get("roles", []):
             raise HTTPException(status_code=403, detail="Forbidden")
         return user
-    return checker
\ No newline at end of file
+    return checker
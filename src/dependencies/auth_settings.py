@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(15, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(30, env="REFRESH_TOKEN_EXPIRE_DAYS")
 
+    # Verified tokens kept in process; an entry lives until `exp`, at most TTL
+    JWT_CACHE_SIZE: int = Field(10000, env="JWT_CACHE_SIZE")
+    JWT_CACHE_TTL: int = Field(60, env="JWT_CACHE_TTL")
+
     # ---------------------- PASSWORD HASHING ----------------------
     BCRYPT_ROUNDS: int = Field(12, env="BCRYPT_ROUNDS")
 
@@ -0,0 +1,44 @@
+"""
+Production server: gunicorn managing uvicorn workers (uvloop + httptools).
+
+    gunicorn main:app -c gunicorn.conf.py
+
+Every worker imports the app itself (no preload) and opens its own ES and
+Redis clients in the lifespan, so nothing is shared across the fork.
+On SIGTERM workers stop accepting connections, finish in-flight requests
+for up to GRACEFUL_TIMEOUT seconds, then run the lifespan shutdown.
+"""
+
+import math
+import os
+
+
+def cpu_count() -> int:
+    """CPUs this container may use: affinity mask, capped by the cgroup quota."""
+    cpus = len(os.sched_getaffinity(0))
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# The API is I/O bound and async: one event loop per core is enough
+workers = int(os.getenv("WEB_CONCURRENCY", 0)) or cpu_count()
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = False
+
+timeout = int(os.getenv("WORKER_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("KEEPALIVE", 5))
+# Recycle workers now and then; jitter keeps them from restarting together
+max_requests = int(os.getenv("MAX_REQUESTS", 0))
+max_requests_jitter = max_requests // 10
+
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,7 +1,9 @@
-import json
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from elasticsearch import AsyncElasticsearch
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from fastapi.templating import Jinja2Templates
 import sys
 
 from starlette.staticfiles import StaticFiles
@@ -12,45 +14,91 @@ from api.v1.films_router import films_router
 from api.v1.persons_router import persons_router
 from api.v1.genres_router import genres_router
 from api.v1.search_router import films_search_router
+from api.v1.suggest_router import suggest_router
+from api.v1.health_router import health_router
+from api.v1.caching import close_redis, get_redis
+from config.config import settings
+from core.health import HealthProbes
+from core.openapi import StaticOpenAPI
+from core.templates import preload_templates, templates
+from models.models import FilmWork
+from repositories.elastic_repository import CursorError, ElasticRepository
+from repositories.msearch import close_msearch_batcher
+from repositories.resilience import BackendUnavailableError
+from services.film_service import FilmService
+from services.home_service import HomeService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Compile templates, then keep the home page materialised in Redis."""
+    preload_templates(templates)
+    es = AsyncElasticsearch(hosts=[settings.elk_url], verify_certs=False)
+    health = HealthProbes(settings.health_probe_timeout, settings.health_cache_ttl)
+    health.add("elasticsearch", es.ping)
+    health.add("redis", lambda: get_redis().ping())
+    app.state.health = health
+    home = HomeService(
+        FilmService(ElasticRepository(es, index="movies", model=FilmWork)),
+        templates,
+    )
+    app.state.home = home
+    task = asyncio.create_task(home.run(settings.home_materialize_interval))
+    yield
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    await es.close()
+    await close_msearch_batcher()
+    await close_redis()
+
+
+app = FastAPI(
+    title="films API with Elasticsearch", lifespan=lifespan, openapi_url=None
+)
+
 
+@app.exception_handler(BackendUnavailableError)
+async def backend_unavailable(request: Request, exc: BackendUnavailableError):
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+
+@app.exception_handler(CursorError)
+async def cursor_error(request: Request, exc: CursorError):
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
 
-app = FastAPI(title="films API with Elasticsearch")
 
 app.include_router(home_router)
 app.include_router(films_router)
 app.include_router(genres_router)
 app.include_router(persons_router)
 app.include_router(films_search_router)
-
-templates = Jinja2Templates(directory="templates")
-
-with open("api/v1/openapi.json", "r", encoding="utf-8") as f:
-    custom_openapi_schema = json.load(f)
+app.include_router(suggest_router)
+app.include_router(health_router)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
-# Override FastAPI's openapi generation function
-def custom_openapi():
-    custom_openapi_schema["components"]["securitySchemes"] = {
+def add_bearer_auth(schema: dict) -> None:
+    schema["components"]["securitySchemes"] = {
         "BearerAuth": {
             "type": "http",
             "scheme": "bearer",
             "bearerFormat": "JWT"
         }
     }
-    custom_openapi_schema["security"] = [{"BearerAuth": []}]
-    return custom_openapi_schema
+    schema["security"] = [{"BearerAuth": []}]
 
 
-# Assign it to the app
-app.openapi = custom_openapi
+# Hand-written schema instead of FastAPI's generated one, loaded on first use
+StaticOpenAPI("api/v1/openapi.json", patch=add_bearer_auth).install(app)
 
 
 @app.get("/health", response_class=JSONResponse)
 async def healthcheck():
     """
     Простой healthcheck.
-    Returns 200 OK если приложение живо.
+    Returns 200 OK если приложение живо (то же, что /health/live).
     """
     return {"status": "ok"}
+
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import Optional
 import datetime
 
+MAX_BATCH_SIZE = 100
+
 
 class FilmWork(BaseModel):
     id: str  # UUID
@@ -29,6 +31,28 @@ class Person(BaseModel):
     modified: Optional[datetime.datetime] = None
 
 
+class FacetBucket(BaseModel):
+    key: str
+    count: int
+
+
+class FilmSearchResult(BaseModel):
+    results: list[FilmWork]
+    facets: dict[str, list[FacetBucket]]
+
+
+class Suggestion(BaseModel):
+    id: str  # UUID
+    text: str
+    kind: str  # film | person
+
+
+class IdsBatch(BaseModel):
+    """Body of the batch endpoints: ids to fetch in a single request."""
+
+    ids: list[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class GenreFilmWork(BaseModel):
     id: str  # UUID
     genre_id: str  # UUID
@@ -1,21 +1,244 @@
-from elasticsearch import AsyncElasticsearch
-from typing import Any, TypeVar
+import logging
+from dataclasses import dataclass
+from elasticsearch import AsyncElasticsearch, BadRequestError, NotFoundError
+from typing import Any, Optional, TypeVar, Union
+
+import anyio
+import orjson
+
+from repositories.msearch import MsearchBatcher, get_msearch_batcher
+from repositories.resilience import EsGuard, es_guard
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+# What reads with raw=True return: the model, or its plain `_source` dict
+Doc = Union[T, dict[str, Any]]
+
+PIT_KEEP_ALIVE = "2m"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position in a point-in-time crawl: the PIT id and the last sort values."""
+
+    pit_id: Optional[str] = None
+    search_after: Optional[list[Any]] = None
+
+
+class CursorError(Exception):
+    """A client cursor can no longer be used; paging has to start over."""
+
+    status_code = 400
+
+
+class CursorExpiredError(CursorError):
+    """The point-in-time of the cursor expired (keep-alive passed)."""
+
+    status_code = 410
+
+
+def doc_version(doc: dict[str, Any]) -> str:
+    """Identity of a document revision, taken from ES sequence numbers."""
+    return f"{doc['_id']}:{doc.get('_primary_term')}:{doc.get('_seq_no')}"
 
 
 class ElasticRepository:
     """Generic repository for Elasticsearch operations."""
 
-    def __init__(self, es: AsyncElasticsearch, index: str, model: type[T]):
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        index: str,
+        model: type[T],
+        source: Optional[list[str]] = None,
+        guard: Optional[EsGuard] = None,
+        batcher: Optional[MsearchBatcher] = None,
+    ):
+        """
+        :param source: `_source` fields to fetch; defaults to the model fields,
+            so nested cast arrays and other unused data never leave ES.
+        :param guard: timeouts, concurrency limit and circuit breaker shared by
+            all repositories of the worker.
+        :param batcher: send index searches through `_msearch` micro-batches;
+            defaults to the worker batcher when ES_MSEARCH_WINDOW_MS is set.
+        """
         self.es = es
         self.index = index
         self.model = model
+        self.source = source or list(model.model_fields)
+        # Optional fields the ETL may leave out of `_source`, for raw reads
+        self._defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if name in self.source and not field.is_required()
+        }
+        self.guard = guard or es_guard
+        self.batcher = batcher or get_msearch_batcher()
+
+    def _project(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Add source filtering unless the caller chose its own."""
+        if "_source" in body:
+            return body
+        return {**body, "_source": self.source}
+
+    def _build(self, source: dict[str, Any], raw: bool) -> Doc[T]:
+        """
+        raw=True returns the `_source` dict without building a model: our ETL
+        wrote it against a strict mapping and the projection keeps only model
+        fields. Missing optional fields get the model defaults, so the JSON
+        body has the same keys as a serialised model.
+        """
+        return {**self._defaults, **source} if raw else self.model(**source)
+
+    async def _read(self, method: str, **kwargs: Any) -> Any:
+        """Idempotent ES read: guarded, with the last result kept as stale."""
+        key = (method, orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS, default=str))
+        if method == "search" and self.batcher is not None:
+            call = self.batcher.search
+        else:
+            call = getattr(self.es, method)
+        return await self.guard.call(lambda: call(**kwargs), key=key)
 
     async def get_by_id(self, entity_id: str) -> T:
-        result = await self.es.get(index=self.index, id=entity_id)
+        result = await self._read(
+            "get", index=self.index, id=entity_id, source_includes=self.source
+        )
         return self.model(**result["_source"])
 
-    async def search(self, body: dict[str, Any]) -> list[T]:
-        resp = await self.es.search(index=self.index, body=body)
+    async def search(
+        self, body: dict[str, Any], request_cache: Optional[bool] = None
+    ) -> list[T]:
+        """
+        :param request_cache: opt into the shard request cache. ES only caches
+            hits (size > 0) when this is set explicitly on the request.
+        """
+        resp = await self._read(
+            "search",
+            index=self.index,
+            body=self._project(body),
+            request_cache=request_cache,
+        )
         return [self.model(**hit["_source"]) for hit in resp["hits"]["hits"]]
+
+    async def search_with_aggs(
+        self, body: dict[str, Any], request_cache: Optional[bool] = None
+    ) -> tuple[list[T], dict[str, Any]]:
+        """Hits and aggregations of a single request."""
+        resp = await self._read(
+            "search",
+            index=self.index,
+            body=self._project(body),
+            request_cache=request_cache,
+        )
+        items = [self.model(**hit["_source"]) for hit in resp["hits"]["hits"]]
+        return items, resp.get("aggregations", {})
+
+    async def search_hits(
+        self, body: dict[str, Any], request_cache: Optional[bool] = None
+    ) -> list[dict[str, Any]]:
+        """Raw hits, for callers that read several indices or custom `_source`."""
+        resp = await self._read(
+            "search", index=self.index, body=body, request_cache=request_cache
+        )
+        return resp["hits"]["hits"]
+
+    async def get_many(self, entity_ids: list[str]) -> list[T]:
+        """Fetch several documents in one `mget`; missing ids are skipped."""
+        if not entity_ids:
+            return []
+        resp = await self._read(
+            "mget", index=self.index, ids=entity_ids, source_includes=self.source
+        )
+        return [
+            self.model(**doc["_source"]) for doc in resp["docs"] if doc.get("found")
+        ]
+
+    async def get_with_version(
+        self, entity_id: str, raw: bool = False
+    ) -> tuple[Doc[T], str]:
+        """Like get_by_id, but also returns the document revision."""
+        result = await self._read(
+            "get", index=self.index, id=entity_id, source_includes=self.source
+        )
+        return self._build(result["_source"], raw), doc_version(result)
+
+    async def search_with_versions(
+        self,
+        body: dict[str, Any],
+        request_cache: Optional[bool] = None,
+        raw: bool = False,
+    ) -> tuple[list[Doc[T]], list[str]]:
+        """Like search, but also returns the revision of every hit."""
+        body = {**self._project(body), "seq_no_primary_term": True}
+        resp = await self._read(
+            "search", index=self.index, body=body, request_cache=request_cache
+        )
+        hits = resp["hits"]["hits"]
+        return [self._build(hit["_source"], raw) for hit in hits], [
+            doc_version(hit) for hit in hits
+        ]
+
+    async def search_page(
+        self,
+        body: dict[str, Any],
+        cursor: Cursor,
+        keep_alive: str = PIT_KEEP_ALIVE,
+        raw: bool = False,
+    ) -> tuple[list[Doc[T]], Optional[Cursor]]:
+        """
+        One page of a `search_after` crawl over a point-in-time snapshot.
+        Cost does not grow with depth and there is no 10k window limit.
+        Returns the next cursor, or None once the snapshot is exhausted.
+        """
+        pit_id = cursor.pit_id
+        opened = pit_id is None
+        if opened:
+            pit = await self.guard.call(
+                lambda: self.es.open_point_in_time(
+                    index=self.index, keep_alive=keep_alive
+                )
+            )
+            pit_id = pit["id"]
+
+        body = {k: v for k, v in self._project(body).items() if k != "from"}
+        body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+        # _shard_doc is the cheapest unique tiebreaker available inside a PIT
+        sort = body.get("sort") or [{"_score": "desc"}]
+        body["sort"] = [*sort, {"_shard_doc": "asc"}]
+        if cursor.search_after:
+            body["search_after"] = cursor.search_after
+
+        try:
+            resp = await self.guard.call(lambda: self.es.search(body=body))
+        except BaseException as exc:
+            if opened:
+                # Nobody has a cursor for this PIT yet: close it right away
+                await self._close_pit(pit_id)
+                raise
+            if isinstance(exc, NotFoundError):
+                raise CursorExpiredError(
+                    "Cursor expired, restart paging with an empty cursor"
+                ) from exc
+            if isinstance(exc, BadRequestError):
+                raise CursorError(
+                    "Invalid cursor, restart paging with an empty cursor"
+                ) from exc
+            raise
+        hits = resp["hits"]["hits"]
+        items = [self._build(hit["_source"], raw) for hit in hits]
+
+        # ES may hand back a new PIT id; always continue with the latest one
+        pit_id = resp.get("pit_id", pit_id)
+        if len(hits) < body.get("size", 10):
+            await self.guard.call(lambda: self.es.close_point_in_time(id=pit_id))
+            return items, None
+        return items, Cursor(pit_id, hits[-1]["sort"])
+
+    async def _close_pit(self, pit_id: str) -> None:
+        """Best-effort close, also while the caller is being cancelled."""
+        with anyio.CancelScope(shield=True):
+            try:
+                await self.guard.call(lambda: self.es.close_point_in_time(id=pit_id))
+            except Exception as exc:
+                logger.warning(f"Could not close point-in-time: {exc!r}")
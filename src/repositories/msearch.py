@@ -0,0 +1,152 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import anyio
+from elasticsearch import AsyncElasticsearch
+
+from config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MsearchError(Exception):
+    """One search of a batch failed; the others are unaffected."""
+
+    def __init__(self, status: int, error: Any):
+        super().__init__(f"msearch item failed with {status}: {error}")
+        self.status = status
+        self.error = error
+
+
+@dataclass
+class _Slot:
+    header: dict[str, Any]
+    body: dict[str, Any]
+    done: anyio.Event = field(default_factory=anyio.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _Batch:
+    slots: list[_Slot] = field(default_factory=list)
+    full: anyio.Event = field(default_factory=anyio.Event)
+
+
+class MsearchBatcher:
+    """
+    Gathers searches issued within `window` seconds into one `_msearch`.
+
+    The first search of a batch leads: it waits for the window (or until
+    `max_batch` searches have joined), sends the batch and hands every
+    caller its own response. Followers only wait for their slot, so their
+    own timeouts and cancellations keep working.
+    """
+
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        window: float = 0.002,
+        max_batch: int = 50,
+        timeout: float = 2.0,
+    ):
+        self.es = es
+        self.window = window
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._batch: Optional[_Batch] = None
+
+    async def search(
+        self,
+        index: str,
+        body: dict[str, Any],
+        request_cache: Optional[bool] = None,
+    ) -> Any:
+        header: dict[str, Any] = {"index": index}
+        if request_cache is not None:
+            header["request_cache"] = request_cache
+        slot = _Slot(header, body)
+
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+        batch.slots.append(slot)
+
+        if len(batch.slots) == 1:
+            await self._lead(batch)
+        elif len(batch.slots) >= self.max_batch:
+            self._batch = None
+            batch.full.set()
+
+        await slot.done.wait()
+        if slot.error is not None:
+            raise slot.error
+        return slot.result
+
+    async def _lead(self, batch: _Batch) -> None:
+        # Shielded: the followers depend on this flush even if the leader
+        # itself is cancelled; the deadline still bounds it.
+        deadline = anyio.current_time() + self.window + self.timeout
+        with anyio.CancelScope(shield=True, deadline=deadline) as scope:
+            with anyio.move_on_after(self.window):
+                await batch.full.wait()
+            if self._batch is batch:
+                self._batch = None
+            await self._flush(batch.slots)
+        if scope.cancelled_caught:
+            self._fail(batch.slots, TimeoutError("msearch timed out"))
+
+    async def _flush(self, slots: list[_Slot]) -> None:
+        searches = []
+        for slot in slots:
+            searches.extend((slot.header, slot.body))
+        try:
+            resp = await self.es.msearch(searches=searches)
+        except Exception as exc:
+            self._fail(slots, exc)
+            return
+
+        for slot, item in zip(slots, resp["responses"]):
+            if "error" in item:
+                slot.error = MsearchError(item.get("status", 500), item["error"])
+            else:
+                slot.result = item
+            slot.done.set()
+        logger.debug(f"msearch flushed {len(slots)} searches")
+
+    @staticmethod
+    def _fail(slots: list[_Slot], exc: BaseException) -> None:
+        for slot in slots:
+            if not slot.done.is_set():
+                slot.error = exc
+                slot.done.set()
+
+
+_batcher: Optional[MsearchBatcher] = None
+
+
+def get_msearch_batcher() -> Optional[MsearchBatcher]:
+    """
+    Worker-wide batcher with its own long-lived client, or None when
+    ES_MSEARCH_WINDOW_MS is 0 (the default).
+    """
+    global _batcher
+    if settings.es_msearch_window_ms <= 0:
+        return None
+    if _batcher is None:
+        es = AsyncElasticsearch(hosts=[settings.elk_url], verify_certs=False)
+        _batcher = MsearchBatcher(
+            es,
+            window=settings.es_msearch_window_ms / 1000,
+            max_batch=settings.es_msearch_max_batch,
+            timeout=settings.es_timeout,
+        )
+    return _batcher
+
+
+async def close_msearch_batcher() -> None:
+    global _batcher
+    if _batcher is not None:
+        await _batcher.es.close()
+        _batcher = None
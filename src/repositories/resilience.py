@@ -0,0 +1,178 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+import anyio
+from elasticsearch import ApiError, TransportError
+
+from config.config import settings
+from repositories.msearch import MsearchError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackendUnavailableError(Exception):
+    """ES did not answer (or the breaker is open) and nothing stale is cached."""
+
+
+def is_backend_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx/429 mean ES is unhealthy; 404 does not."""
+    if isinstance(exc, (TimeoutError, TransportError)):
+        return True
+    if isinstance(exc, ApiError):
+        return exc.meta.status >= 500 or exc.meta.status == 429
+    if isinstance(exc, MsearchError):
+        return exc.status >= 500 or exc.status == 429
+    return False
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive failures;
+    open -> half-open after `reset_timeout`, letting a single probe through;
+    the probe closes the circuit again or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def end_probe(self) -> None:
+        """The probe ended without a verdict (cancelled, never sent): allow another."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._probing:
+                logger.warning("Elasticsearch circuit opened")
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class StaleCache:
+    """Last good result of every read, served while ES is unavailable."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self._data.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class EsGuard:
+    """
+    Wraps every ES call of ElasticRepository:
+    - a per-call timeout and a cap on in-flight requests per worker; time
+      spent waiting for the cap is part of the timeout;
+    - a circuit breaker, with the last good result served while it is open.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 2.0,
+        max_concurrency: int = 50,
+        breaker: Optional[CircuitBreaker] = None,
+        stale: Optional[StaleCache] = None,
+    ):
+        self.timeout = timeout
+        self.semaphore = anyio.Semaphore(max_concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        self.stale = stale or StaleCache()
+
+    async def call(
+        self,
+        call: Callable[[], Awaitable[T]],
+        key: Optional[Hashable] = None,
+    ) -> T:
+        """:param key: identity of an idempotent read; enables the stale fallback."""
+        # Past allow() in half-open state, this call is the single probe
+        probing = self.breaker.state == "half-open"
+        if not self.breaker.allow():
+            return self._fallback(key, None)
+        try:
+            return await self._guarded(call, key)
+        finally:
+            if probing:
+                self.breaker.end_probe()
+
+    async def _guarded(
+        self, call: Callable[[], Awaitable[T]], key: Optional[Hashable]
+    ) -> T:
+        # Waiting for the in-flight cap counts against the same deadline
+        deadline = anyio.current_time() + self.timeout
+        try:
+            with anyio.fail_after(self.timeout):
+                await self.semaphore.acquire()
+        except TimeoutError as exc:
+            # Local overload rather than an ES failure: the breaker is left alone
+            logger.warning("Elasticsearch concurrency cap reached")
+            return self._fallback(key, exc)
+
+        try:
+            with anyio.fail_after(deadline - anyio.current_time()):
+                result = await call()
+        except Exception as exc:
+            if not is_backend_failure(exc):
+                self.breaker.record_success()
+                raise
+            self.breaker.record_failure()
+            logger.warning(f"Elasticsearch call failed: {exc!r}")
+            return self._fallback(key, exc)
+        finally:
+            self.semaphore.release()
+
+        self.breaker.record_success()
+        if key is not None:
+            self.stale.set(key, result)
+        return result
+
+    def _fallback(self, key: Optional[Hashable], exc: Optional[Exception]) -> Any:
+        stale = self.stale.get(key) if key is not None else None
+        if stale is None:
+            raise BackendUnavailableError("Elasticsearch is unavailable") from exc
+        return stale
+
+
+es_guard = EsGuard(
+    timeout=settings.es_timeout,
+    max_concurrency=settings.es_max_concurrency,
+    breaker=CircuitBreaker(
+        settings.es_breaker_threshold, settings.es_breaker_reset_timeout
+    ),
+)
@@ -1,8 +1,22 @@
 import logging
 from typing import Optional
-from api.v1.caching import get_from_cache
-from models.models import FilmWork
-from repositories.elastic_repository import ElasticRepository
+from api.v1.caching import (
+    get_cache_version,
+    get_from_cache,
+    get_many_from_cache,
+    set_many_to_cache,
+    set_to_cache,
+)
+from api.v1.response_cache import CachedResponse, cached_response
+from models.models import FilmSearchResult, FilmWork
+from repositories.elastic_repository import Cursor, ElasticRepository
+from services.query_builder import (
+    browse_body,
+    facet_aggs,
+    film_filters,
+    parse_facets,
+    person_films_filter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +27,33 @@ class FilmService:
     def __init__(self, repo: ElasticRepository):
         self.repo = repo
 
-    async def get_film(self, film_id: str) -> FilmWork:
-        cache_key = f"film:{film_id}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return FilmWork(**cached)
-        return await self.repo.get_by_id(film_id)
+    async def get_films(self, film_ids: list[str]) -> list[FilmWork]:
+        """Fetch several films: one Redis MGET, then one ES mget for the misses."""
+        film_ids = list(dict.fromkeys(film_ids))
+        cached = await get_many_from_cache([f"film:{i}" for i in film_ids])
+        found = {i: FilmWork(**doc) for i, doc in zip(film_ids, cached) if doc}
+
+        missing = [i for i in film_ids if i not in found]
+        if missing:
+            fetched = await self.repo.get_many(missing)
+            await set_many_to_cache({f"film:{film.id}": film for film in fetched})
+            found.update((film.id, film) for film in fetched)
+
+        return [found[i] for i in film_ids if i in found]
 
-    async def list_films(
+    async def get_film_response(self, film_id: str) -> CachedResponse:
+        """Encoded film JSON with its ETag, served from the response cache."""
+
+        async def load():
+            film, version = await self.repo.get_with_version(film_id, raw=True)
+            return film, [version]
+
+        # Versioned like the list keys: a read that raced an ETL write is
+        # stored under the old version, which nobody reads any more
+        version = await get_cache_version("movies")
+        return await cached_response(f"film:{version}:{film_id}", load)
+
+    async def list_films_response(
         self,
         sort: Optional[str] = "rating",
         sort_order: str = "desc",
@@ -29,60 +62,151 @@ class FilmService:
         type_: Optional[str] = "movie",
         limit: int = 10,
         offset: int = 0,
-    ) -> list[FilmWork]:
-        cache_key = f"films:list:{sort}:{sort_order}:{min_rating}:{max_rating}:{type_}:{limit}:{offset}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return [FilmWork(**doc) for doc in cached]
+    ) -> CachedResponse:
+        """Encoded film list JSON with its ETag, served from the response cache."""
+        version = await get_cache_version("movies")
+        cache_key = f"films:list:{version}:{sort}:{sort_order}:{min_rating}:{max_rating}:{type_}:{limit}:{offset}"
+        body = self._list_body(
+            sort, sort_order, min_rating, max_rating, type_, limit, offset
+        )
+        return await cached_response(
+            cache_key,
+            lambda: self.repo.search_with_versions(
+                body, request_cache=True, raw=True
+            ),
+        )
 
-        must, filters = [], []
+    async def list_films_with_versions(
+        self,
+        sort: Optional[str],
+        sort_order: str,
+        min_rating: Optional[float],
+        max_rating: Optional[float],
+        type_: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> tuple[list[FilmWork], list[str]]:
+        """Film list plus the ES revision of every film, for fragment caching."""
+        body = self._list_body(
+            sort, sort_order, min_rating, max_rating, type_, limit, offset
+        )
+        return await self.repo.search_with_versions(body, request_cache=True)
 
-        if min_rating is not None or max_rating is not None:
-            range_filter = {}
-            if min_rating is not None:
-                range_filter["gte"] = min_rating
-            if max_rating is not None:
-                range_filter["lte"] = max_rating
-            filters.append({"range": {"rating": range_filter}})
+    async def list_films_page(
+        self,
+        sort: Optional[str],
+        sort_order: str,
+        min_rating: Optional[float],
+        max_rating: Optional[float],
+        type_: Optional[str],
+        limit: int,
+        cursor: Cursor,
+    ) -> tuple[list[dict], Optional[Cursor]]:
+        """One page of a cursor crawl over the film list, as raw documents."""
+        body = self._list_body(
+            sort, sort_order, min_rating, max_rating, type_, limit, 0
+        )
+        return await self.repo.search_page(body, cursor, raw=True)
 
-        if type_:
-            filters.append({"term": {"type.keyword": type_}})
+    async def person_films_response(
+        self, person_id: str, role: Optional[str], limit: int, offset: int
+    ) -> CachedResponse:
+        """Films of a person, best rated first, served from the response cache."""
+        version = await get_cache_version("movies")
+        cache_key = f"films:person:{version}:{person_id}:{role}:{limit}:{offset}"
+        body = browse_body(
+            [person_films_filter(person_id, role)], "rating", "desc", limit, offset
+        )
+        return await cached_response(
+            cache_key,
+            lambda: self.repo.search_with_versions(
+                body, request_cache=True, raw=True
+            ),
+        )
 
-        body = {
-            "query": {"bool": {"must": must or [{"match_all": {}}], "filter": filters}},
-            "from": offset,
-            "size": limit,
-        }
+    async def search_films_response(
+        self, query: str, page_number: int = 1, page_size: int = 10
+    ) -> CachedResponse:
+        """Encoded search results JSON with its ETag, served from the response cache."""
+        version = await get_cache_version("movies")
+        cache_key = f"films:search:{version}:{query}:{page_number}:{page_size}"
+        body = self._search_body(query, page_number, page_size)
+        return await cached_response(
+            cache_key, lambda: self.repo.search_with_versions(body, raw=True)
+        )
 
-        if sort:
-            body["sort"] = [{sort: {"order": sort_order}}]
+    async def search_films_faceted(
+        self, query: str, page_number: int = 1, page_size: int = 10
+    ) -> FilmSearchResult:
+        """Search results plus facet counts, in a single ES round trip."""
+        version = await get_cache_version("movies")
+        cache_key = f"films:search:facets:{version}:{query}:{page_number}:{page_size}"
+        cached = await get_from_cache(cache_key)
+        if cached:
+            return FilmSearchResult(**cached)
 
-        logger.info("Executing film search query.")
-        return await self.repo.search(body)
+        body = self._search_body(query, page_number, page_size)
+        if query.strip():
+            body["aggs"] = facet_aggs()
+            films, aggs = await self.repo.search_with_aggs(body)
+            facets = parse_facets(aggs)
+        else:
+            films = await self.repo.search(body, request_cache=True)
+            facets = await self.catalog_facets(version)
 
-    async def search_films(
-        self, query: str, page_number: int = 1, page_size: int = 10
-    ) -> list[FilmWork]:
-        """Full-text search for films by title or description."""
-        cache_key = f"films:search:{query}:{page_number}:{page_size}"
+        result = FilmSearchResult(results=films, facets=facets)
+        await set_to_cache(cache_key, result)
+        return result
+
+    async def catalog_facets(self, version: int) -> dict:
+        """Facets of the whole catalog, shared by every empty query."""
+        cache_key = f"films:facets:{version}"
         cached = await get_from_cache(cache_key)
         if cached:
-            return [FilmWork(**doc) for doc in cached]
+            return cached
+
+        _, aggs = await self.repo.search_with_aggs(
+            {"size": 0, "aggs": facet_aggs()}, request_cache=True
+        )
+        facets = parse_facets(aggs)
+        await set_to_cache(cache_key, facets)
+        return facets
+
+    async def search_films_page(
+        self, query: str, page_size: int, cursor: Cursor
+    ) -> tuple[list[dict], Optional[Cursor]]:
+        """One page of a cursor crawl over search results, as raw documents."""
+        body = self._search_body(query, 1, page_size)
+        return await self.repo.search_page(body, cursor, raw=True)
 
-        # Elasticsearch query
-        body = {
-            "query": {
+    @staticmethod
+    def _list_body(
+        sort: Optional[str],
+        sort_order: str,
+        min_rating: Optional[float],
+        max_rating: Optional[float],
+        type_: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> dict:
+        filters = film_filters(min_rating, max_rating, type_)
+        return browse_body(filters, sort, sort_order, limit, offset)
+
+    @staticmethod
+    def _search_body(query: str, page_number: int, page_size: int) -> dict:
+        # Elasticsearch query; an empty query browses the whole catalog
+        if query.strip():
+            es_query = {
                 "multi_match": {
                     "query": query,
                     "fields": ["title", "description", "genres", "directors_names"],
                     "fuzziness": "auto",
                 }
-            },
+            }
+        else:
+            es_query = {"match_all": {}}
+        return {
+            "query": es_query,
             "from": (page_number - 1) * page_size,
             "size": page_size,
         }
-
-        logger.info(
-            f"Searching films: query='{query}', page={page_number}, size={page_size}"
-        )
-        return await self.repo.search(body)
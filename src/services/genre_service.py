@@ -1,8 +1,14 @@
 import logging
 from typing import Optional
-from api.v1.caching import get_from_cache
+from api.v1.caching import (
+    get_cache_version,
+    get_many_from_cache,
+    set_many_to_cache,
+)
+from api.v1.response_cache import CachedResponse, cached_response
 from models.models import Genre
-from repositories.elastic_repository import ElasticRepository
+from repositories.elastic_repository import Cursor, ElasticRepository
+from services.query_builder import browse_body
 
 logger = logging.getLogger(__name__)
 
@@ -13,31 +19,55 @@ class GenreService:
     def __init__(self, repo: ElasticRepository):
         self.repo = repo
 
-    async def get_genre(self, genre_id: str) -> Genre:
-        cache_key = f"genre:{genre_id}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return Genre(**cached)
-        return await self.repo.get_by_id(genre_id)
+    async def get_genres(self, genre_ids: list[str]) -> list[Genre]:
+        """Fetch several genres: one Redis MGET, then one ES mget for the misses."""
+        genre_ids = list(dict.fromkeys(genre_ids))
+        cached = await get_many_from_cache([f"genre:{i}" for i in genre_ids])
+        found = {i: Genre(**doc) for i, doc in zip(genre_ids, cached) if doc}
 
-    async def list_genres(
-        self, sort: Optional[str], sort_order: str, limit: int, offset: int
-    ) -> list[Genre]:
-        cache_key = f"genres:list:{sort}:{sort_order}:{limit}:{offset}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return [Genre(**doc) for doc in cached]
+        missing = [i for i in genre_ids if i not in found]
+        if missing:
+            fetched = await self.repo.get_many(missing)
+            await set_many_to_cache({f"genre:{genre.id}": genre for genre in fetched})
+            found.update((genre.id, genre) for genre in fetched)
+
+        return [found[i] for i in genre_ids if i in found]
+
+    async def get_genre_response(self, genre_id: str) -> CachedResponse:
+        """Encoded genre JSON with its ETag, served from the response cache."""
 
-        must = []
+        async def load():
+            genre, version = await self.repo.get_with_version(genre_id, raw=True)
+            return genre, [version]
 
-        body = {
-            "query": {"bool": {"must": must or [{"match_all": {}}]}},
-            "from": offset,
-            "size": limit,
-        }
+        # Versioned like the list keys: a read that raced an ETL write is
+        # stored under the old version, which nobody reads any more
+        version = await get_cache_version("genres")
+        return await cached_response(f"genre:{version}:{genre_id}", load)
+
+    async def list_genres_response(
+        self, sort: Optional[str], sort_order: str, limit: int, offset: int
+    ) -> CachedResponse:
+        """Encoded genre list JSON with its ETag, served from the response cache."""
+        version = await get_cache_version("genres")
+        cache_key = f"genres:list:{version}:{sort}:{sort_order}:{limit}:{offset}"
+        body = self._list_body(sort, sort_order, limit, offset)
+        return await cached_response(
+            cache_key,
+            lambda: self.repo.search_with_versions(
+                body, request_cache=True, raw=True
+            ),
+        )
 
-        if sort:
-            body["sort"] = [{sort: {"order": sort_order}}]
+    async def list_genres_page(
+        self, sort: Optional[str], sort_order: str, limit: int, cursor: Cursor
+    ) -> tuple[list[dict], Optional[Cursor]]:
+        """One page of a cursor crawl over the list, as raw documents."""
+        body = self._list_body(sort, sort_order, limit, 0)
+        return await self.repo.search_page(body, cursor, raw=True)
 
-        logger.info("Executing genre search query.")
-        return await self.repo.search(body)
+    @staticmethod
+    def _list_body(
+        sort: Optional[str], sort_order: str, limit: int, offset: int
+    ) -> dict:
+        return browse_body([], sort, sort_order, limit, offset)
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+
+from api.v1.caching import (
+    claim_key,
+    get_bytes_from_cache,
+    get_cache_version,
+    release_key,
+    set_bytes_to_cache,
+)
+from models.models import FilmWork
+from services.film_service import FilmService
+
+logger = logging.getLogger(__name__)
+
+HOME_TEMPLATE = "index.html"
+# Taken by the one worker that materialises a given catalog version
+MATERIALIZE_CLAIM_KEY = "home:materialize:{version}"
+CARD_TEMPLATE = "_film_card.html"
+
+
+@dataclass(frozen=True)
+class HomeParams:
+    """Query parameters of the home page; one rendered page per combination."""
+
+    sort: Optional[str] = None
+    sort_order: str = "desc"
+    min_rating: Optional[float] = None
+    max_rating: Optional[float] = None
+    type_: Optional[str] = None
+    limit: int = 10
+    offset: int = 0
+
+    def cache_key(self) -> str:
+        return (
+            f"home:page:{self.sort}:{self.sort_order}:{self.min_rating}:"
+            f"{self.max_rating}:{self.type_}:{self.limit}:{self.offset}"
+        )
+
+
+# Combinations rendered ahead of time after every ETL batch
+HOME_VARIANTS = (
+    HomeParams(),
+    HomeParams(sort="rating"),
+    HomeParams(sort="rating", type_="movie"),
+    HomeParams(sort="title", sort_order="asc"),
+)
+
+
+class FragmentCache:
+    """
+    In-process LRU of rendered film cards keyed by document revision.
+    A revision never changes its content, so entries need no TTL.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Markup] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Markup]:
+        fragment = self._data.get(key)
+        if fragment is not None:
+            self._data.move_to_end(key)
+        return fragment
+
+    def set(self, key: str, fragment: Markup) -> None:
+        self._data[key] = fragment
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+fragment_cache = FragmentCache()
+
+
+class HomeService:
+    """
+    Home page served from rendered HTML kept in Redis.
+
+    Every page lives under a stable key and is stored with the catalog
+    version it was rendered for. The worker learns the current version from
+    its materialiser loop, so serving a page is a single GET.
+    """
+
+    def __init__(
+        self,
+        film_service: FilmService,
+        templates: Jinja2Templates,
+        fragments: FragmentCache = fragment_cache,
+    ):
+        self.film_service = film_service
+        self.templates = templates
+        self.fragments = fragments
+        # Catalog version of the last materialisation; None until the first one
+        self.version: Optional[int] = None
+
+    async def get_page(self, params: HomeParams) -> bytes:
+        """A single cache read; pages older than the catalog are rendered again."""
+        version = self.version
+        if version is None:
+            version = await get_cache_version("movies")
+        stored = await get_bytes_from_cache(params.cache_key())
+        if stored:
+            page_version, _, page = stored.partition(b"\n")
+            if int(page_version) >= version:
+                return page
+
+        page = await self.render(params)
+        await self._store(params, version, page)
+        return page
+
+    @staticmethod
+    async def _store(params: HomeParams, version: int, page: bytes) -> None:
+        await set_bytes_to_cache(params.cache_key(), b"%d\n%s" % (version, page))
+
+    async def render(self, params: HomeParams) -> bytes:
+        films, versions = await self.film_service.list_films_with_versions(
+            params.sort,
+            params.sort_order,
+            params.min_rating,
+            params.max_rating,
+            params.type_,
+            params.limit,
+            params.offset,
+        )
+        cards = [
+            await self._render_card(film, version)
+            for film, version in zip(films, versions)
+        ]
+        page = self.templates.get_template(HOME_TEMPLATE)
+        return (await page.render_async(cards=cards)).encode()
+
+    async def _render_card(self, film: FilmWork, version: str) -> Markup:
+        """Only films changed since the last render go through Jinja again."""
+        card = self.fragments.get(version)
+        if card is None:
+            template = self.templates.get_template(CARD_TEMPLATE)
+            card = Markup(await template.render_async(film=film))
+            self.fragments.set(version, card)
+        return card
+
+    async def materialize(self, version: int) -> None:
+        """Render every HOME_VARIANTS page for the given cache version."""
+        for params in HOME_VARIANTS:
+            await self._store(params, version, await self.render(params))
+        logger.info(f"Materialised {len(HOME_VARIANTS)} home pages, version {version}")
+
+    async def refresh(self) -> None:
+        """
+        The ETL bumps cache_version:movies after each batch, so a new version
+        means the pages have to be rendered again. Every gunicorn worker runs
+        this loop, but only the one that claims the version renders; the
+        others just start expecting pages of that version.
+        """
+        version = await get_cache_version("movies")
+        if version == self.version:
+            return
+        claim = MATERIALIZE_CLAIM_KEY.format(version=version)
+        if await claim_key(claim):
+            try:
+                await self.materialize(version)
+            except BaseException:
+                # Let another worker try on its next tick
+                await release_key(claim)
+                raise
+        self.version = version
+
+    async def run(self, interval: float) -> None:
+        """Background loop of refresh() every `interval` seconds."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Home page materialisation failed")
+            await asyncio.sleep(interval)
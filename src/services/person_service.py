@@ -1,8 +1,14 @@
 import logging
 from typing import Optional
-from api.v1.caching import get_from_cache
+from api.v1.caching import (
+    get_cache_version,
+    get_many_from_cache,
+    set_many_to_cache,
+)
+from api.v1.response_cache import CachedResponse, cached_response
 from models.models import Person
-from repositories.elastic_repository import ElasticRepository
+from repositories.elastic_repository import Cursor, ElasticRepository
+from services.query_builder import browse_body
 
 logger = logging.getLogger(__name__)
 
@@ -13,31 +19,55 @@ class PersonService:
     def __init__(self, repo: ElasticRepository):
         self.repo = repo
 
-    async def get_person(self, person_id: str) -> Person:
-        cache_key = f"person:{person_id}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return Person(**cached)
-        return await self.repo.get_by_id(person_id)
+    async def get_people(self, person_ids: list[str]) -> list[Person]:
+        """Fetch several people: one Redis MGET, then one ES mget for the misses."""
+        person_ids = list(dict.fromkeys(person_ids))
+        cached = await get_many_from_cache([f"person:{i}" for i in person_ids])
+        found = {i: Person(**doc) for i, doc in zip(person_ids, cached) if doc}
 
-    async def list_people(
-        self, sort: Optional[str], sort_order: str, limit: int, offset: int
-    ) -> list[Person]:
-        cache_key = f"people:list:{sort}:{sort_order}:{limit}:{offset}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return [Person(**doc) for doc in cached]
+        missing = [i for i in person_ids if i not in found]
+        if missing:
+            fetched = await self.repo.get_many(missing)
+            await set_many_to_cache({f"person:{p.id}": p for p in fetched})
+            found.update((p.id, p) for p in fetched)
+
+        return [found[i] for i in person_ids if i in found]
+
+    async def get_person_response(self, person_id: str) -> CachedResponse:
+        """Encoded person JSON with its ETag, served from the response cache."""
 
-        must = []
+        async def load():
+            person, version = await self.repo.get_with_version(person_id, raw=True)
+            return person, [version]
 
-        body = {
-            "query": {"bool": {"must": must or [{"match_all": {}}]}},
-            "from": offset,
-            "size": limit,
-        }
+        # Versioned like the list keys: a read that raced an ETL write is
+        # stored under the old version, which nobody reads any more
+        version = await get_cache_version("persons")
+        return await cached_response(f"person:{version}:{person_id}", load)
+
+    async def list_people_response(
+        self, sort: Optional[str], sort_order: str, limit: int, offset: int
+    ) -> CachedResponse:
+        """Encoded person list JSON with its ETag, served from the response cache."""
+        version = await get_cache_version("persons")
+        cache_key = f"people:list:{version}:{sort}:{sort_order}:{limit}:{offset}"
+        body = self._list_body(sort, sort_order, limit, offset)
+        return await cached_response(
+            cache_key,
+            lambda: self.repo.search_with_versions(
+                body, request_cache=True, raw=True
+            ),
+        )
 
-        if sort:
-            body["sort"] = [{sort: {"order": sort_order}}]
+    async def list_people_page(
+        self, sort: Optional[str], sort_order: str, limit: int, cursor: Cursor
+    ) -> tuple[list[dict], Optional[Cursor]]:
+        """One page of a cursor crawl over the list, as raw documents."""
+        body = self._list_body(sort, sort_order, limit, 0)
+        return await self.repo.search_page(body, cursor, raw=True)
 
-        logger.info("Executing person search query.")
-        return await self.repo.search(body)
+    @staticmethod
+    def _list_body(
+        sort: Optional[str], sort_order: str, limit: int, offset: int
+    ) -> dict:
+        return browse_body([], sort, sort_order, limit, offset)
@@ -0,0 +1,105 @@
+from typing import Any, Optional
+
+# Text fields cannot be sorted or filtered exactly; use their keyword sub-fields.
+KEYWORD_FIELDS = {
+    "title": "title.raw",
+    "genres": "genres.raw",
+    "type": "type.raw",
+    "name": "name.raw",
+    "full_name": "full_name.raw",
+}
+
+
+def keyword_field(field: str) -> str:
+    return KEYWORD_FIELDS.get(field, field)
+
+
+def film_filters(
+    min_rating: Optional[float] = None,
+    max_rating: Optional[float] = None,
+    type_: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Structured film filters; they never affect scoring."""
+    filters = []
+
+    if min_rating is not None or max_rating is not None:
+        range_filter = {}
+        if min_rating is not None:
+            range_filter["gte"] = min_rating
+        if max_rating is not None:
+            range_filter["lte"] = max_rating
+        filters.append({"range": {"rating": range_filter}})
+
+    if type_:
+        filters.append({"term": {keyword_field("type"): type_}})
+
+    return filters
+
+
+def browse_body(
+    filters: list[dict[str, Any]],
+    sort: Optional[str],
+    sort_order: str,
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    """
+    Body for the browse endpoints: filter context only, no scoring.
+    Filter clauses are cached per segment by ES, and the whole response can
+    sit in the shard request cache (see ElasticRepository.search).
+    """
+    if filters:
+        query = {"bool": {"filter": filters}}
+    else:
+        query = {"match_all": {}}
+
+    body = {"query": query, "from": offset, "size": limit}
+
+    if sort:
+        body["sort"] = [{keyword_field(sort): {"order": sort_order}}]
+    return body
+
+
+# Nested person arrays of a film document, by role
+PERSON_ROLES = {"actor": "actors", "director": "directors", "writer": "writers"}
+
+
+def person_films_filter(person_id: str, role: Optional[str] = None) -> dict[str, Any]:
+    """Films a person took part in: exact term on the nested `<role>.id` keywords."""
+    paths = [PERSON_ROLES[role]] if role else list(PERSON_ROLES.values())
+    return {
+        "bool": {
+            "should": [
+                {"nested": {"path": path, "query": {"term": {f"{path}.id": person_id}}}}
+                for path in paths
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+
+
+RATING_BUCKETS = [
+    {"key": "0-5", "to": 5},
+    {"key": "5-7", "from": 5, "to": 7},
+    {"key": "7-8", "from": 7, "to": 8},
+    {"key": "8-10", "from": 8},
+]
+
+
+def facet_aggs(size: int = 30) -> dict[str, Any]:
+    """Sidebar facets computed in the same request as the hits."""
+    return {
+        "genres": {"terms": {"field": keyword_field("genres"), "size": size}},
+        "types": {"terms": {"field": keyword_field("type"), "size": size}},
+        "ratings": {"range": {"field": "rating", "ranges": RATING_BUCKETS}},
+    }
+
+
+def parse_facets(aggs: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    return {
+        name: [
+            {"key": str(bucket["key"]), "count": bucket["doc_count"]}
+            for bucket in agg["buckets"]
+        ]
+        for name, agg in aggs.items()
+    }
@@ -0,0 +1,99 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from models.models import Suggestion
+from repositories.elastic_repository import ElasticRepository
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_INDICES = "movies,persons"
+# Suggestion kind -> the field it completes. Each kind is a named clause of
+# the query, so a hit is classified by the clause it matched, not by its
+# _index (which is the concrete index name when the configured ones are aliases)
+SUGGEST_FIELDS = {"film": "title", "person": "full_name"}
+
+
+class PrefixCache:
+    """Small in-process LRU with TTL for the hottest typeahead prefixes."""
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[list[Suggestion]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: list[Suggestion]) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+prefix_cache = PrefixCache()
+
+
+class SuggestService:
+    """Typeahead over film titles and person names."""
+
+    def __init__(self, repo: ElasticRepository, cache: PrefixCache = prefix_cache):
+        self.repo = repo
+        self.cache = cache
+
+    async def suggest(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+
+        key = (prefix, limit)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # One request over both indices; a field missing in an index is ignored
+        body = {
+            "query": {
+                "bool": {
+                    "should": [
+                        self._prefix_clause(prefix, kind, field)
+                        for kind, field in SUGGEST_FIELDS.items()
+                    ]
+                }
+            },
+            "_source": ["id", *SUGGEST_FIELDS.values()],
+            "size": limit,
+        }
+        hits = await self.repo.search_hits(body, request_cache=True)
+
+        suggestions = []
+        for hit in hits:
+            kind = hit["matched_queries"][0]
+            text = hit["_source"][SUGGEST_FIELDS[kind]]
+            suggestions.append(Suggestion(id=hit["_source"]["id"], text=text, kind=kind))
+
+        self.cache.set(key, suggestions)
+        return suggestions
+
+    @staticmethod
+    def _prefix_clause(prefix: str, kind: str, field: str) -> dict:
+        return {
+            "multi_match": {
+                "query": prefix,
+                "type": "bool_prefix",
+                "fields": [
+                    f"{field}.suggest{suffix}" for suffix in ("", "._2gram", "._3gram")
+                ],
+                "_name": kind,
+            }
+        }
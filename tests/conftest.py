@@ -3,7 +3,7 @@ import sys
 
 import pytest
 from unittest.mock import AsyncMock
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
 from fastapi.testclient import TestClient
 
 sys.path.append("/opt/app/src")
@@ -11,6 +11,9 @@ from services.film_service import FilmService
 from services.genre_service import GenreService
 from services.person_service import PersonService
 from repositories.elastic_repository import ElasticRepository
+from repositories.resilience import EsGuard
+from api.v1.response_cache import json_response, render_response
+from models.models import FilmWork, IdsBatch
 
 
 # ------------------------------------------------------------------------------
@@ -39,7 +42,13 @@ def mock_repo():
         "full_name": f"Mock Person {id_}",
     }
 
-    repo.search.return_value = [
+    repo.get_many.side_effect = lambda ids: [
+        FilmWork(id=id_, title=f"Mock Film {id_}", type="movie")
+        for id_ in ids
+        if id_ != "missing"
+    ]
+
+    docs = [
         {
             "id": "1",
             "title": "Mock Film 1",
@@ -59,22 +68,72 @@ def mock_repo():
             "full_name": "Mock Person 2",
         },
     ]
+    repo.search.return_value = docs
+
+    # Response-cache loaders read raw documents with their revisions
+    repo.get_with_version.side_effect = lambda id_, raw=False: (
+        repo.get_by_id.side_effect(id_),
+        f"1:1:{id_}",
+    )
+    repo.search_with_versions.return_value = (
+        docs,
+        [f"1:1:{doc['id']}" for doc in docs],
+    )
     return repo
 
 
+# ------------------------------------------------------------------------------
+# ES guard
+# ------------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def es_guard(monkeypatch):
+    """Fresh breaker and stale cache per test, bound to the test's event loop."""
+    guard = EsGuard(timeout=1.0)
+    monkeypatch.setattr("repositories.elastic_repository.es_guard", guard)
+    return guard
+
+
 # ------------------------------------------------------------------------------
 # Cache Mock
 # ------------------------------------------------------------------------------
 @pytest.fixture
 def mock_cache(monkeypatch):
-    """Patch get_from_cache to always return None to skip Redis."""
+    """Patch the cache helpers so services always miss and never touch Redis."""
+
+    async def fake_get_cached_response(_):
+        return None
+
+    async def fake_set_cached_response(*_, **__):
+        return None
 
     async def fake_get_from_cache(_):
         return None
 
+    async def fake_set_to_cache(*_, **__):
+        return None
+
+    async def fake_get_cache_version(_):
+        return 0
+
+    async def fake_get_many_from_cache(keys):
+        return [None] * len(keys)
+
+    monkeypatch.setattr(
+        "api.v1.response_cache.get_cached_response", fake_get_cached_response
+    )
+    monkeypatch.setattr(
+        "api.v1.response_cache.set_cached_response", fake_set_cached_response
+    )
     monkeypatch.setattr("services.film_service.get_from_cache", fake_get_from_cache)
-    monkeypatch.setattr("services.genre_service.get_from_cache", fake_get_from_cache)
-    monkeypatch.setattr("services.person_service.get_from_cache", fake_get_from_cache)
+    monkeypatch.setattr("services.film_service.set_to_cache", fake_set_to_cache)
+    for module in ("film_service", "genre_service", "person_service"):
+        monkeypatch.setattr(
+            f"services.{module}.get_cache_version", fake_get_cache_version
+        )
+        monkeypatch.setattr(
+            f"services.{module}.get_many_from_cache", fake_get_many_from_cache
+        )
+        monkeypatch.setattr(f"services.{module}.set_many_to_cache", fake_set_to_cache)
 
 
 # ------------------------------------------------------------------------------
@@ -114,48 +173,70 @@ async def client(mock_cache, film_service, genre_service, person_service):
         return person_service
 
     # ----------------------- FILM ENDPOINTS -----------------------
+    @app.post("/films/batch")
+    async def get_films_batch(
+        batch: IdsBatch, service: FilmService = Depends(get_film_service)
+    ):
+        return json_response(await service.get_films(batch.ids))
+
     @app.get("/films/{film_id}")
-    async def get_film(film_id: str, service: FilmService = Depends(get_film_service)):
-        return await service.get_film(film_id)
+    async def get_film(
+        film_id: str, request: Request, service: FilmService = Depends(get_film_service)
+    ):
+        return render_response(await service.get_film_response(film_id), request)
 
     @app.get("/films/")
-    async def list_films(service: FilmService = Depends(get_film_service)):
-        return await service.list_films()
+    async def list_films(
+        request: Request, service: FilmService = Depends(get_film_service)
+    ):
+        return render_response(await service.list_films_response(), request)
 
     @app.get("/search")
     async def search_films(
+        request: Request,
         query: str,
         page_number: int = 1,
         page_size: int = 10,
         service: FilmService = Depends(get_film_service),
     ):
-        return await service.search_films(query, page_number, page_size)
+        cached = await service.search_films_response(query, page_number, page_size)
+        return render_response(cached, request)
 
     # ----------------------- GENRE ENDPOINTS -----------------------
     @app.get("/genres/{genre_id}")
     async def get_genre(
-        genre_id: str, service: GenreService = Depends(get_genre_service)
+        genre_id: str,
+        request: Request,
+        service: GenreService = Depends(get_genre_service),
     ):
-        return await service.get_genre(genre_id)
+        return render_response(await service.get_genre_response(genre_id), request)
 
     @app.get("/genres/")
-    async def list_genres(service: GenreService = Depends(get_genre_service)):
-        return await service.list_genres(
+    async def list_genres(
+        request: Request, service: GenreService = Depends(get_genre_service)
+    ):
+        cached = await service.list_genres_response(
             sort=None, sort_order="asc", limit=10, offset=0
         )
+        return render_response(cached, request)
 
     # ----------------------- PERSON ENDPOINTS -----------------------
     @app.get("/persons/{person_id}")
     async def get_person(
-        person_id: str, service: PersonService = Depends(get_person_service)
+        person_id: str,
+        request: Request,
+        service: PersonService = Depends(get_person_service),
     ):
-        return await service.get_person(person_id)
+        return render_response(await service.get_person_response(person_id), request)
 
     @app.get("/persons/")
-    async def list_persons(service: PersonService = Depends(get_person_service)):
-        return await service.list_people(
+    async def list_persons(
+        request: Request, service: PersonService = Depends(get_person_service)
+    ):
+        cached = await service.list_people_response(
             sort=None, sort_order="asc", limit=10, offset=0
         )
+        return render_response(cached, request)
 
     # ----------------------- HEALTHCHECK -----------------------
     @app.get("/health")
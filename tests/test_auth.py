@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from dependencies import auth
+from dependencies.auth import TokenCache, get_current_user
+from dependencies.auth_settings import settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_cache(monkeypatch):
+    monkeypatch.setattr(auth, "token_cache", TokenCache(maxsize=2, ttl=60))
+
+
+def make_token(exp_in: float = 300, **claims) -> HTTPAuthorizationCredentials:
+    payload = {"sub": "1", "iss": settings.AUTH_ISSUER, **claims}
+    payload["exp"] = int(time.time() + exp_in)
+    token = jwt.encode(payload, settings.JWT_ACCESS_SECRET, settings.JWT_ALGORITHM)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_repeat_requests_skip_verification(monkeypatch):
+    """Only the first request with a token pays for signature verification."""
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    credentials = make_token(roles=["admin"])
+    for _ in range(3):
+        assert get_current_user(credentials)["roles"] == ["admin"]
+    assert len(calls) == 1
+
+
+def test_cached_entry_expires_with_token(monkeypatch):
+    """An entry is dropped at `exp`, so the token goes through jwt.decode again."""
+    credentials = make_token(exp_in=30)
+    get_current_user(credentials)
+    assert auth.token_cache.get(credentials.credentials) is not None
+
+    later = time.time() + 31
+    monkeypatch.setattr(auth.time, "time", lambda: later)
+    assert auth.token_cache.get(credentials.credentials) is None
+
+
+def test_cached_entry_is_capped_by_ttl(monkeypatch):
+    """Long-lived tokens are verified again after JWT_CACHE_TTL."""
+    credentials = make_token(exp_in=3600)
+    get_current_user(credentials)
+
+    later = time.time() + 61
+    monkeypatch.setattr(auth.time, "time", lambda: later)
+    assert auth.token_cache.get(credentials.credentials) is None
+
+
+def test_invalid_tokens_are_not_cached():
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="a.b.c")
+    with pytest.raises(HTTPException):
+        get_current_user(credentials)
+    assert not auth.token_cache._data
+
+
+def test_cache_is_bounded():
+    for _ in range(3):
+        get_current_user(make_token(jti=str(time.monotonic_ns())))
+    assert len(auth.token_cache._data) == 2
+
+
+def test_cached_payload_is_a_copy():
+    """A caller changing its payload does not change what the next request sees."""
+    credentials = make_token(roles=["user"])
+    get_current_user(credentials)["roles"].append("admin")
+    get_current_user(credentials)["roles"].append("admin")
+    assert get_current_user(credentials)["roles"] == ["user"]
+
+
+def test_cache_is_thread_safe():
+    """Sync dependencies run in FastAPI's threadpool; concurrent use must not fail."""
+    tokens = [make_token(sub=str(i)).credentials for i in range(8)]
+    cache = TokenCache(maxsize=4, ttl=60)
+
+    def hammer(offset):
+        for i in range(2000):
+            token = tokens[(i + offset) % len(tokens)]
+            cache.set(token, {"sub": token})
+            cache.get(token)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(hammer, range(8)))
+    assert len(cache._data) <= 4
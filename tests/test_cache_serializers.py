@@ -0,0 +1,33 @@
+import orjson
+import pytest
+
+from api.v1.cache_serializers import RAW, ZLIB, get_serializer
+from models.models import FilmWork
+
+FILM = FilmWork(
+    id="1", title="Mock Film 1", description="Desc " * 400, type="movie", rating=8.1
+)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_round_trip_models(name):
+    """Models are stored as plain documents and loaded back unchanged."""
+    serializer = get_serializer(name)
+    data = serializer.dumps([FILM])
+    assert serializer.loads(data) == [FILM.model_dump(mode="json")]
+
+
+def test_payloads_above_threshold_are_compressed():
+    """Only payloads at or above the threshold pay for zlib."""
+    serializer = get_serializer("orjson", compress_min_size=1024)
+    assert serializer.dumps({"id": "1"})[:1] == RAW
+
+    data = serializer.dumps(FILM)
+    assert data[:1] == ZLIB
+    assert len(data) < len(orjson.dumps(FILM.model_dump(mode="json")))
+
+
+def test_legacy_entries_without_header_are_readable():
+    """Values written by the old json.dumps cache still load."""
+    serializer = get_serializer("orjson")
+    assert serializer.loads(b'{"id": "1"}') == {"id": "1"}
@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from models.models import FilmWork
+from repositories.elastic_repository import ElasticRepository
+
+pytestmark = pytest.mark.anyio
+
+FILM_SOURCE = {"id": "1", "title": "Mock Film 1", "type": "movie"}
+
+
+@pytest.fixture
+def es():
+    es = AsyncMock()
+    es.search.return_value = {"hits": {"hits": [{"_source": FILM_SOURCE}]}}
+    es.get.return_value = {"_id": "1", "_source": FILM_SOURCE}
+    return es
+
+
+async def test_source_is_derived_from_model_fields(es):
+    """Only fields of the response model are requested from ES."""
+    repo = ElasticRepository(es, index="movies", model=FilmWork)
+
+    await repo.search({"query": {"match_all": {}}})
+    await repo.get_by_id("1")
+
+    source = es.search.call_args.kwargs["body"]["_source"]
+    assert set(source) == set(FilmWork.model_fields)
+    assert "actors" not in source
+    assert es.get.call_args.kwargs["source_includes"] == source
+
+
+async def test_explicit_projection_wins(es):
+    """An explicit projection, or one set in the query body, is kept as is."""
+    repo = ElasticRepository(
+        es, index="movies", model=FilmWork, source=["id", "title", "type"]
+    )
+
+    await repo.search({"query": {"match_all": {}}})
+    assert es.search.call_args.kwargs["body"]["_source"] == ["id", "title", "type"]
+
+    await repo.search({"query": {"match_all": {}}, "_source": False})
+    assert es.search.call_args.kwargs["body"]["_source"] is False
+
+
+async def test_raw_reads_pass_source_through(es):
+    """raw=True returns `_source` dicts shaped like the serialised model."""
+    repo = ElasticRepository(es, index="movies", model=FilmWork)
+    expected = FilmWork(**FILM_SOURCE).model_dump()
+
+    film, version = await repo.get_with_version("1", raw=True)
+    assert film == expected
+    assert film["description"] is None and film["creation_date"] is None
+    es.search.return_value = {"hits": {"hits": [{"_id": "1", "_source": FILM_SOURCE}]}}
+    films, _ = await repo.search_with_versions({}, raw=True)
+    assert films == [expected]
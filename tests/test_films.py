@@ -40,3 +40,10 @@ async def test_get_film_by_id(client):
     assert film["id"] == film_id
     assert "title" in film
     assert "type" in film
+
+
+async def test_get_films_batch(client):
+    """POST /films/batch returns found films in request order, skipping unknown ids."""
+    resp = client.post("/films/batch", json={"ids": ["2", "missing", "1", "2"]})
+    assert resp.status_code == HTTPStatus.OK
+    assert [film["id"] for film in resp.json()] == ["2", "1"]
@@ -0,0 +1,93 @@
+import anyio
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from api.v1.health_router import health_router
+from core.health import HealthProbes
+
+pytestmark = pytest.mark.anyio
+
+
+def counting(result=True, delay=0.0):
+    calls = []
+
+    async def probe():
+        calls.append(1)
+        await anyio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return probe, calls
+
+
+async def test_all_probes_ok_reports_latency():
+    health = HealthProbes(timeout=1.0)
+    health.add("es", counting()[0])
+    health.add("redis", counting()[0])
+
+    ready, checks = await health.check()
+
+    assert ready
+    assert set(checks) == {"es", "redis"}
+    assert all(c["ok"] and c["latency_ms"] >= 0 for c in checks.values())
+
+
+async def test_slow_failing_and_false_probes_are_not_ready():
+    health = HealthProbes(timeout=0.05)
+    health.add("slow", counting(delay=1.0)[0])
+    health.add("broken", counting(ConnectionError("refused"))[0])
+    health.add("ping", counting(False)[0])
+    health.add("ok", counting()[0])
+
+    ready, checks = await health.check()
+
+    assert not ready
+    assert "within" in checks["slow"]["error"]
+    assert "refused" in checks["broken"]["error"]
+    assert not checks["ping"]["ok"]
+    assert checks["ok"]["ok"]
+
+
+async def test_results_are_cached_for_ttl():
+    probe, calls = counting()
+    health = HealthProbes(timeout=1.0, ttl=60)
+    health.add("es", probe)
+
+    for _ in range(3):
+        await health.check()
+    assert len(calls) == 1
+
+    health.ttl = 0
+    await health.check()
+    assert len(calls) == 2
+
+
+async def test_concurrent_checks_share_one_refresh():
+    probe, calls = counting(delay=0.01)
+    health = HealthProbes(timeout=1.0, ttl=60)
+    health.add("es", probe)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(10):
+            tg.start_soon(health.check)
+    assert len(calls) == 1
+
+
+async def test_ready_endpoint_returns_503_with_details():
+    app = FastAPI()
+    app.include_router(health_router)
+    app.state.health = HealthProbes(timeout=1.0)
+    app.state.health.add("es", counting()[0])
+    app.state.health.add("redis", counting(ConnectionError("down"))[0])
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as c:
+        live = await c.get("/health/live")
+        ready = await c.get("/health/ready")
+
+    assert live.status_code == 200
+    assert ready.status_code == 503
+    body = ready.json()
+    assert body["status"] == "unavailable"
+    assert body["checks"]["es"]["ok"] and not body["checks"]["redis"]["ok"]
@@ -0,0 +1,164 @@
+from pathlib import Path
+
+import pytest
+
+from core.templates import make_templates
+from models.models import FilmWork
+from services.home_service import (
+    HOME_VARIANTS,
+    FragmentCache,
+    HomeParams,
+    HomeService,
+)
+
+pytestmark = pytest.mark.anyio
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "src" / "templates"
+
+
+@pytest.fixture
+def page_store(monkeypatch, mock_cache):
+    """In-memory stand-in for the rendered pages in Redis."""
+    store = {}
+
+    async def fake_get(key):
+        return store.get(key)
+
+    async def fake_set(key, body, ttl=None):
+        store[key] = body
+
+    async def fake_get_cache_version(_):
+        store["version reads"] = store.get("version reads", 0) + 1
+        return 3
+
+    monkeypatch.setattr("services.home_service.get_bytes_from_cache", fake_get)
+    monkeypatch.setattr("services.home_service.set_bytes_to_cache", fake_set)
+    async def fake_claim(key, ttl=None):
+        if key in store:
+            return False
+        store[key] = b"1"
+        return True
+
+    async def fake_release(key):
+        store.pop(key, None)
+
+    monkeypatch.setattr(
+        "services.home_service.get_cache_version", fake_get_cache_version
+    )
+    monkeypatch.setattr("services.home_service.claim_key", fake_claim)
+    monkeypatch.setattr("services.home_service.release_key", fake_release)
+    return store
+
+
+@pytest.fixture
+def home_service(film_service, mock_repo):
+    mock_repo.search_with_versions.return_value = (
+        [
+            FilmWork(id="1", title="Mock Film 1", type="movie", rating=8.1),
+            FilmWork(id="2", title="Mock Film 2", type="movie", rating=7.4),
+        ],
+        ["1:1:1", "2:1:1"],
+    )
+    return HomeService(
+        film_service, make_templates(str(TEMPLATES_DIR)), FragmentCache()
+    )
+
+
+async def test_home_page_is_rendered_once(home_service, mock_repo, page_store):
+    """The second hit is a single cache read, no ES query and no rendering."""
+    first = await home_service.get_page(HomeParams())
+    second = await home_service.get_page(HomeParams())
+
+    assert first == second
+    assert b"Mock Film 1" in first
+    mock_repo.search_with_versions.assert_awaited_once()
+    assert page_store[HomeParams().cache_key()].startswith(b"3\n")
+
+
+async def test_materialize_renders_every_variant(home_service, mock_repo, page_store):
+    """After an ETL batch the common combinations are ready for the new version."""
+    await home_service.materialize(4)
+
+    for params in HOME_VARIANTS:
+        assert page_store[params.cache_key()].startswith(b"4\n")
+    assert mock_repo.search_with_versions.await_count == len(HOME_VARIANTS)
+
+
+async def test_one_worker_materializes_each_version(
+    film_service, home_service, mock_repo, page_store
+):
+    """Workers share the pages in Redis, so only one of them renders a version."""
+    other_worker = HomeService(film_service, home_service.templates, FragmentCache())
+
+    await home_service.refresh()
+    await other_worker.refresh()
+    await other_worker.refresh()
+
+    assert home_service.version == other_worker.version == 3
+    assert mock_repo.search_with_versions.await_count == len(HOME_VARIANTS)
+
+
+async def test_failed_materialization_is_retried_by_another_worker(
+    film_service, home_service, mock_repo, page_store
+):
+    other_worker = HomeService(film_service, home_service.templates, FragmentCache())
+    mock_repo.search_with_versions.side_effect = ConnectionError("ES down")
+    with pytest.raises(ConnectionError):
+        await home_service.refresh()
+    assert home_service.version is None
+
+    mock_repo.search_with_versions.side_effect = None
+    await other_worker.refresh()
+
+    for params in HOME_VARIANTS:
+        assert page_store[params.cache_key()].startswith(b"3\n")
+
+
+async def test_known_version_means_one_cache_read(home_service, mock_repo, page_store):
+    """Once the materialiser has run, a hit reads only the page key."""
+    await home_service.materialize(4)
+    home_service.version = 4
+    reads = page_store.get("version reads", 0)
+
+    page = await home_service.get_page(HomeParams())
+
+    assert b"Mock Film 1" in page and not page.startswith(b"4\n")
+    assert page_store.get("version reads", 0) == reads
+    assert mock_repo.search_with_versions.await_count == len(HOME_VARIANTS)
+
+
+async def test_page_of_older_version_is_rendered_again(
+    home_service, mock_repo, page_store
+):
+    """A stable key is reused across versions; stale pages are replaced on read."""
+    await home_service.get_page(HomeParams(sort="year"))
+    home_service.version = 5
+
+    await home_service.get_page(HomeParams(sort="year"))
+
+    assert mock_repo.search_with_versions.await_count == 2
+    assert page_store[HomeParams(sort="year").cache_key()].startswith(b"5\n")
+
+
+async def test_unchanged_cards_are_not_rendered_again(
+    home_service, mock_repo, page_store, monkeypatch
+):
+    """Cards are cached by document revision; only the changed film is rendered."""
+    await home_service.render(HomeParams())
+
+    template = home_service.templates.get_template("_film_card.html")
+    rendered = []
+    render_async = template.render_async
+
+    async def counting_render(**context):
+        rendered.append(context["film"].id)
+        return await render_async(**context)
+
+    monkeypatch.setattr(template, "render_async", counting_render)
+    films, _ = mock_repo.search_with_versions.return_value
+    mock_repo.search_with_versions.return_value = (films, ["1:1:1", "2:1:2"])
+
+    page = await home_service.render(HomeParams())
+
+    assert rendered == ["2"]
+    assert page.count(b'class="film-card"') == 2
@@ -0,0 +1,79 @@
+import anyio
+import pytest
+from unittest.mock import AsyncMock
+
+from models.models import FilmWork
+from repositories.elastic_repository import ElasticRepository
+from repositories.msearch import MsearchBatcher, MsearchError
+
+pytestmark = pytest.mark.anyio
+
+
+def fake_msearch(searches):
+    """Answer every search with a single hit titled after its query."""
+    responses = []
+    for body in searches[1::2]:
+        title = body["query"]["match"]["title"]
+        if title == "broken":
+            responses.append({"status": 400, "error": {"type": "parsing_exception"}})
+        else:
+            hit = {"_source": {"id": title, "title": title, "type": "movie"}}
+            responses.append({"status": 200, "hits": {"hits": [hit]}})
+    return {"responses": responses}
+
+
+@pytest.fixture
+def es():
+    es = AsyncMock()
+    es.msearch.side_effect = fake_msearch
+    return es
+
+
+async def search_all(repo, titles):
+    results = {}
+
+    async def one(title):
+        try:
+            films = await repo.search({"query": {"match": {"title": title}}})
+            results[title] = films[0].title
+        except MsearchError as exc:
+            results[title] = exc.status
+
+    async with anyio.create_task_group() as tg:
+        for title in titles:
+            tg.start_soon(one, title)
+    return results
+
+
+async def test_concurrent_searches_share_one_msearch(es):
+    """Searches issued together become one _msearch and get their own hits back."""
+    batcher = MsearchBatcher(es, window=0.01)
+    repo = ElasticRepository(es, index="movies", model=FilmWork, batcher=batcher)
+
+    results = await search_all(repo, ["a", "b", "c"])
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    es.msearch.assert_awaited_once()
+    es.search.assert_not_awaited()
+    searches = es.msearch.call_args.kwargs["searches"]
+    assert searches[0] == {"index": "movies"}
+
+
+async def test_failed_item_only_affects_its_caller(es):
+    batcher = MsearchBatcher(es, window=0.01)
+    repo = ElasticRepository(es, index="movies", model=FilmWork, batcher=batcher)
+
+    results = await search_all(repo, ["a", "broken"])
+
+    assert results == {"a": "a", "broken": 400}
+
+
+async def test_full_batch_is_sent_without_waiting(es):
+    """Reaching max_batch flushes at once instead of waiting out the window."""
+    batcher = MsearchBatcher(es, window=5, max_batch=2)
+    repo = ElasticRepository(es, index="movies", model=FilmWork, batcher=batcher)
+
+    with anyio.fail_after(1):
+        results = await search_all(repo, ["a", "b"])
+
+    assert results == {"a": "a", "b": "b"}
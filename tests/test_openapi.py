@@ -0,0 +1,37 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.openapi import StaticOpenAPI
+
+
+def make_app(tmp_path, **kwargs):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps({"openapi": "3.1.0", "paths": {}, "components": {}}))
+    app = FastAPI(openapi_url=None)
+    schema = StaticOpenAPI(str(path), **kwargs)
+    schema.install(app)
+    return app, schema, path
+
+
+def test_schema_is_loaded_lazily_and_served_as_bytes(tmp_path):
+    app, schema, path = make_app(
+        tmp_path, patch=lambda s: s.update(security=[{"BearerAuth": []}])
+    )
+    assert schema._schema is None
+
+    resp = TestClient(app).get("/openapi.json")
+    assert resp.status_code == 200
+    assert resp.json()["security"] == [{"BearerAuth": []}]
+
+    path.unlink()  # served from memory from now on
+    assert TestClient(app).get("/openapi.json").content == resp.content
+    assert app.openapi() is schema.schema()
+
+
+def test_docs_point_at_static_schema(tmp_path):
+    app, _, _ = make_app(tmp_path)
+    resp = TestClient(app).get("/docs")
+    assert resp.status_code == 200
+    assert "/openapi.json" in resp.text
@@ -0,0 +1,141 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+
+from elastic_transport import ApiResponseMeta, HttpHeaders
+from elasticsearch import BadRequestError, NotFoundError
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from api.v1 import films_router, genres_router, persons_router, search_router
+from api.v1.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from dependencies.auth import get_current_user
+from models.models import Genre
+from repositories.elastic_repository import (
+    Cursor,
+    CursorError,
+    CursorExpiredError,
+    ElasticRepository,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def es_page(ids, pit_id="pit-2"):
+    return {
+        "pit_id": pit_id,
+        "hits": {
+            "hits": [
+                {"_source": {"id": id_, "name": f"Genre {id_}"}, "sort": [id_, n]}
+                for n, id_ in enumerate(ids)
+            ]
+        },
+    }
+
+
+def api_error(cls, status):
+    return cls("error", ApiResponseMeta(status, "1.1", HttpHeaders(), 0.0, None), {})
+
+
+def test_cursor_token_round_trip():
+    """Tokens are opaque, URL-safe and decode back to the same position."""
+    cursor = Cursor(pit_id="pit-1", search_after=["Drama", 42])
+    token = encode_cursor(cursor)
+    assert "=" not in token and "/" not in token
+    assert decode_cursor(token) == cursor
+    assert decode_cursor("") == Cursor()
+
+
+def test_invalid_cursor_is_rejected():
+    """Garbage tokens are a client error, not a server one."""
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor")
+    assert exc.value.status_code == HTTPStatus.BAD_REQUEST
+
+
+async def test_search_page_walks_point_in_time():
+    """The first page opens a PIT; later pages continue with search_after."""
+    es = AsyncMock()
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+    es.search.return_value = es_page(["a", "b"])
+    repo = ElasticRepository(es, index="genres", model=Genre)
+    body = {"query": {"match_all": {}}, "from": 0, "size": 2}
+
+    genres, cursor = await repo.search_page(body, Cursor())
+
+    sent = es.search.call_args.kwargs["body"]
+    assert "from" not in sent
+    assert sent["pit"]["id"] == "pit-1"
+    assert sent["sort"][-1] == {"_shard_doc": "asc"}
+    assert [g.id for g in genres] == ["a", "b"]
+    assert cursor == Cursor("pit-2", ["b", 1])
+
+    es.search.return_value = es_page(["c"], pit_id="pit-3")
+    genres, cursor = await repo.search_page(body, cursor)
+
+    sent = es.search.call_args.kwargs["body"]
+    assert sent["search_after"] == ["b", 1]
+    assert cursor is None
+    es.open_point_in_time.assert_awaited_once()
+    es.close_point_in_time.assert_awaited_once_with(id="pit-3")
+
+
+async def test_expired_pit_restarts_paging():
+    """An expired or unknown PIT is a client error, not a 500."""
+    es = AsyncMock()
+    repo = ElasticRepository(es, index="genres", model=Genre)
+    body = {"query": {"match_all": {}}, "size": 2}
+
+    es.search.side_effect = api_error(NotFoundError, 404)
+    with pytest.raises(CursorExpiredError) as exc:
+        await repo.search_page(body, Cursor("old-pit", ["b", 1]))
+    assert exc.value.status_code == HTTPStatus.GONE
+
+    es.search.side_effect = api_error(BadRequestError, 400)
+    with pytest.raises(CursorError) as exc:
+        await repo.search_page(body, Cursor("garbage", ["b", 1]))
+    assert exc.value.status_code == HTTPStatus.BAD_REQUEST
+    es.close_point_in_time.assert_not_awaited()
+
+
+async def test_failed_first_page_closes_new_pit():
+    """A PIT opened for a page that failed is closed instead of left to expire."""
+    es = AsyncMock()
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+    es.search.side_effect = api_error(BadRequestError, 400)
+    repo = ElasticRepository(es, index="genres", model=Genre)
+
+    with pytest.raises(BadRequestError):
+        await repo.search_page({"size": 2}, Cursor())
+    es.close_point_in_time.assert_awaited_once_with(id="pit-1")
+
+
+@pytest.mark.parametrize(
+    "module, router, url",
+    [
+        (films_router, films_router.films_router, "/films/?cursor=&limit=2"),
+        (genres_router, genres_router.genres_router, "/genres/?cursor=&limit=2"),
+        (persons_router, persons_router.persons_router, "/persons/?cursor=&limit=2"),
+        (
+            search_router,
+            search_router.films_search_router,
+            "/search/?query=star&cursor=&page_size=2",
+        ),
+    ],
+)
+async def test_cursor_page_sends_next_cursor_header(module, router, url):
+    """The next cursor reaches the client through the real routers."""
+    es = AsyncMock()
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+    es.search.return_value = es_page(["a", "b"])
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[module.get_elastic_client] = lambda: es
+    app.dependency_overrides[get_current_user] = lambda: {"sub": "1"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as c:
+        resp = await c.get(url)
+
+    assert resp.status_code == 200
+    assert [doc["id"] for doc in resp.json()] == ["a", "b"]
+    assert decode_cursor(resp.headers[NEXT_CURSOR_HEADER]) == Cursor("pit-2", ["b", 1])
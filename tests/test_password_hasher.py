@@ -0,0 +1,114 @@
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+AUTH_SERVICE = Path(__file__).resolve().parents[1] / "auth_service"
+sys.path.append(str(AUTH_SERVICE))
+from security.password import (  # noqa: E402
+    Argon2idScheme,
+    BcryptScheme,
+    HashPool,
+    PasswordHasher,
+)
+
+pytestmark = pytest.mark.anyio
+
+# The auth service's top-level packages share names with the films API ones
+AUTH_PACKAGES = {"config", "core", "models", "repositories", "security", "services"}
+
+
+@pytest.fixture
+def anyio_backend():
+    # The hash pool hands jobs to the loop through asyncio.wrap_future
+    return "asyncio"
+
+
+def cheap_argon2(**params) -> Argon2idScheme:
+    return Argon2idScheme(**{"time_cost": 1, "memory_cost": 8, **params})
+
+
+@pytest.fixture
+def pool():
+    pool = HashPool(workers=1, queue_limit=4)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def hasher(pool):
+    return PasswordHasher(cheap_argon2(), [BcryptScheme(rounds=4)], pool=pool)
+
+
+@pytest.fixture
+def auth_modules(monkeypatch):
+    """Import auth service modules apart from the films API packages."""
+    def ours(name):
+        return name.split(".")[0] in AUTH_PACKAGES
+
+    saved = {name: module for name, module in sys.modules.items() if ours(name)}
+    for name in saved:
+        del sys.modules[name]
+    monkeypatch.syspath_prepend(str(AUTH_SERVICE))
+    yield importlib.import_module
+    for name in [name for name in sys.modules if ours(name)]:
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+def test_schemes_identify_their_hashes():
+    bcrypt_hash = BcryptScheme(rounds=4).hash("secret")
+    argon2_hash = cheap_argon2().hash("secret")
+
+    assert BcryptScheme().identify(bcrypt_hash)
+    assert not BcryptScheme().identify(argon2_hash)
+    assert cheap_argon2().identify(argon2_hash)
+    assert not cheap_argon2().identify(bcrypt_hash)
+
+
+def test_needs_rehash_follows_cost_parameters():
+    bcrypt_hash = BcryptScheme(rounds=4).hash("secret")
+    argon2_hash = cheap_argon2().hash("secret")
+
+    assert not BcryptScheme(rounds=4).needs_rehash(bcrypt_hash)
+    assert BcryptScheme(rounds=5).needs_rehash(bcrypt_hash)
+    assert not cheap_argon2().needs_rehash(argon2_hash)
+    assert cheap_argon2(time_cost=2).needs_rehash(argon2_hash)
+    assert cheap_argon2(memory_cost=16).needs_rehash(argon2_hash)
+
+
+async def test_verify_and_update_upgrades_legacy_and_outdated_hashes(hasher):
+    legacy = BcryptScheme(rounds=4).hash("secret")
+    outdated = cheap_argon2(time_cost=2).hash("secret")
+    current = await hasher.hash_password("secret")
+
+    for stored in (legacy, outdated):
+        valid, new_hash = await hasher.verify_and_update("secret", stored)
+        assert valid
+        assert hasher.current.identify(new_hash)
+        assert not hasher.current.needs_rehash(new_hash)
+        assert await hasher.verify_password("secret", new_hash)
+
+    assert await hasher.verify_and_update("secret", current) == (True, None)
+    assert await hasher.verify_and_update("wrong", legacy) == (False, None)
+
+
+async def test_login_persists_upgraded_hash(auth_modules, hasher):
+    """The rehash is committed, so the next login verifies the new hash as is."""
+    UserRepository = auth_modules("repositories.user_repository").UserRepository
+    UserService = auth_modules("services.user_service").UserService
+    user = SimpleNamespace(password_hash=BcryptScheme(rounds=4).hash("secret"))
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalar_one_or_none=lambda: user)
+    service = UserService(UserRepository(session), hasher, role_repo=AsyncMock())
+
+    assert await service.authenticate("user@example.com", "secret") is user
+
+    assert hasher.current.identify(user.password_hash)
+    session.commit.assert_awaited_once()
+
+    assert await service.authenticate("user@example.com", "secret") is user
+    session.commit.assert_awaited_once()
@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "auth_service"))
+from security.password import HashPool, HasherBusyError  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    # The pool hands jobs to the loop through asyncio.wrap_future
+    return "asyncio"
+
+
+@pytest.fixture
+def pool():
+    pool = HashPool(workers=1, queue_limit=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+async def started(pool: HashPool, n: int) -> None:
+    while pool.pending < n:
+        await asyncio.sleep(0.001)
+
+
+async def test_full_queue_is_refused(pool, release):
+    """Past workers + queue_limit jobs the caller gets HasherBusyError (503)."""
+    tasks = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+    await started(pool, 2)
+
+    with pytest.raises(HasherBusyError):
+        await pool.run(release.wait)
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [True, True]
+    assert pool.stats() == {"workers": 1, "pending": 0, "completed": 2, "rejected": 1}
+
+
+async def test_cancelled_caller_keeps_slot_while_job_runs(pool, release):
+    """A slot is freed when the job leaves the executor, not when its caller does."""
+    running = asyncio.create_task(pool.run(release.wait))
+    queued = asyncio.create_task(pool.run(release.wait))
+    await started(pool, 2)
+
+    running.cancel()
+    queued.cancel()
+    await asyncio.gather(running, queued, return_exceptions=True)
+
+    # The queued job never starts; the running one still holds its thread
+    assert pool.pending == 1
+    assert pool.stats()["completed"] == 0
+    tasks = [asyncio.create_task(pool.run(release.wait))]
+    await started(pool, 2)
+    with pytest.raises(HasherBusyError):
+        await pool.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*tasks)
+    pool.shutdown()
+    assert pool.pending == 0
+
+
+async def test_failed_jobs_are_not_completed(pool):
+    def fail():
+        raise ValueError("bad hash")
+
+    with pytest.raises(ValueError):
+        await pool.run(fail)
+    assert pool.stats()["pending"] == 0
+    assert pool.stats()["completed"] == 0
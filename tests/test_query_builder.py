@@ -0,0 +1,100 @@
+import pytest
+
+from models.models import FilmWork
+from services.query_builder import (
+    browse_body,
+    facet_aggs,
+    film_filters,
+    parse_facets,
+    person_films_filter,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_browse_body_uses_filter_context_only():
+    """Browse queries carry no scoring clauses and filter on keyword fields."""
+    body = browse_body(film_filters(5.0, None, "movie"), "rating", "desc", 10, 20)
+
+    assert body["query"] == {
+        "bool": {
+            "filter": [
+                {"range": {"rating": {"gte": 5.0}}},
+                {"term": {"type.raw": "movie"}},
+            ]
+        }
+    }
+    assert body["from"] == 20 and body["size"] == 10
+
+
+def test_browse_body_sorts_text_fields_by_keyword():
+    """Sorting by a text field goes through its .raw sub-field."""
+    body = browse_body([], "title", "asc", 10, 0)
+    assert body["query"] == {"match_all": {}}
+    assert body["sort"] == [{"title.raw": {"order": "asc"}}]
+
+
+async def test_list_films_opts_into_request_cache(film_service, mock_repo, mock_cache):
+    """Browse searches ask ES for the shard request cache."""
+    await film_service.list_films_response(type_="movie")
+    assert mock_repo.search_with_versions.call_args.kwargs == {
+        "request_cache": True,
+        "raw": True,
+    }
+
+
+def test_parse_facets_flattens_buckets():
+    """Terms and range buckets come back as {key, count} pairs."""
+    aggs = {
+        "genres": {"buckets": [{"key": "Drama", "doc_count": 3}]},
+        "ratings": {"buckets": [{"key": "8-10", "from": 8.0, "doc_count": 1}]},
+    }
+    assert parse_facets(aggs) == {
+        "genres": [{"key": "Drama", "count": 3}],
+        "ratings": [{"key": "8-10", "count": 1}],
+    }
+
+
+async def test_search_films_faceted_single_request(
+    film_service, mock_repo, mock_cache
+):
+    """Hits and facet counts come from one ES request."""
+    mock_repo.search_with_aggs.return_value = (
+        [FilmWork(id="1", title="Star Wars", type="movie")],
+        {"types": {"buckets": [{"key": "movie", "doc_count": 1}]}},
+    )
+
+    result = await film_service.search_films_faceted("star")
+
+    mock_repo.search_with_aggs.assert_awaited_once()
+    assert mock_repo.search_with_aggs.call_args.args[0]["aggs"] == facet_aggs()
+    assert result.facets["types"][0].count == 1
+    assert result.results[0].title == "Star Wars"
+
+
+async def test_search_films_faceted_empty_query_uses_catalog_facets(
+    film_service, mock_repo, mock_cache
+):
+    """An empty query browses everything; facets come from a size=0 request."""
+    mock_repo.search.return_value = []
+    mock_repo.search_with_aggs.return_value = ([], {"genres": {"buckets": []}})
+
+    result = await film_service.search_films_faceted("")
+
+    assert mock_repo.search.call_args.args[0]["query"] == {"match_all": {}}
+    assert mock_repo.search_with_aggs.call_args.args[0]["size"] == 0
+    assert result.facets == {"genres": []}
+
+
+def test_person_films_filter_matches_any_role():
+    """Without a role the person may appear in any nested cast array."""
+    clauses = person_films_filter("p1")["bool"]["should"]
+    assert [c["nested"]["path"] for c in clauses] == ["actors", "directors", "writers"]
+    assert clauses[0]["nested"]["query"] == {"term": {"actors.id": "p1"}}
+
+
+def test_person_films_filter_single_role():
+    clauses = person_films_filter("p1", "director")["bool"]["should"]
+    assert clauses == [
+        {"nested": {"path": "directors", "query": {"term": {"directors.id": "p1"}}}}
+    ]
@@ -0,0 +1,106 @@
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import anyio
+import pytest
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "auth_service"))
+from rate_limit.gcra import RateLimiter  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+REDIS_TEST_URL = os.getenv("REDIS_TEST_URL", "redis://localhost:6379/15")
+
+
+@pytest.fixture
+def anyio_backend():
+    # redis.asyncio runs on asyncio only
+    return "asyncio"
+
+
+@pytest.fixture
+async def redis():
+    client = Redis.from_url(REDIS_TEST_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except (ConnectionError, OSError):
+        await client.aclose()
+        pytest.skip(f"no Redis at {REDIS_TEST_URL}")
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def prefix():
+    # Each test gets its own keys, so runs never see each other's state
+    return f"test-rate-{uuid.uuid4().hex}"
+
+
+async def test_burst_then_rejected(redis, prefix):
+    limiter = RateLimiter(redis, limit=5, period=60, prefix=prefix)
+
+    results = [await limiter.hit("user") for _ in range(6)]
+
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+    # One emission interval (60s / 5) until the next slot frees up
+    assert 11.9 < results[-1].retry_after <= 12
+
+
+async def test_concurrent_hits_do_not_collide(redis, prefix):
+    limiter = RateLimiter(redis, limit=10, period=60, prefix=prefix)
+    results = []
+
+    async def hit():
+        results.append(await limiter.hit("user"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(25):
+            tg.start_soon(hit)
+
+    assert sum(r.allowed for r in results) == 10
+
+
+async def test_slot_frees_after_emission_interval(redis, prefix):
+    limiter = RateLimiter(redis, limit=2, period=0.2, prefix=prefix)
+
+    assert (await limiter.hit("user")).allowed
+    assert (await limiter.hit("user")).allowed
+    assert not (await limiter.hit("user")).allowed
+
+    await anyio.sleep(0.12)
+    assert (await limiter.hit("user")).allowed
+    assert not (await limiter.hit("user")).allowed
+
+
+async def test_state_is_one_expiring_key(redis, prefix):
+    limiter = RateLimiter(redis, limit=100, period=10, prefix=prefix)
+
+    for _ in range(150):
+        await limiter.hit("user")
+
+    assert await redis.keys(f"{prefix}:*") == [f"{prefix}:user"]
+    assert await redis.type(f"{prefix}:user") == "string"
+    assert 0 < await redis.pttl(f"{prefix}:user") <= 10_000
+
+
+async def test_cost_and_burst(redis, prefix):
+    limiter = RateLimiter(redis, limit=10, period=60, burst=4, prefix=prefix)
+
+    assert (await limiter.hit("user", cost=3)).remaining == 1
+    assert not (await limiter.hit("user", cost=2)).allowed
+    assert (await limiter.hit("user")).allowed
+
+
+async def test_hit_many_is_per_key(redis, prefix):
+    limiter = RateLimiter(redis, limit=1, period=60, prefix=prefix)
+
+    first = await limiter.hit_many(["a", "b"])
+    second = await limiter.hit_many(["a", "c"])
+
+    assert [r.allowed for r in first] == [True, True]
+    assert [r.allowed for r in second] == [False, True]
@@ -0,0 +1,111 @@
+import anyio
+import pytest
+from elastic_transport import ApiResponseMeta, HttpHeaders
+from elasticsearch import ConnectionError as EsConnectionError, NotFoundError
+from unittest.mock import AsyncMock
+
+from models.models import FilmWork
+from repositories.elastic_repository import ElasticRepository
+from repositories.resilience import (
+    BackendUnavailableError,
+    CircuitBreaker,
+    EsGuard,
+)
+
+pytestmark = pytest.mark.anyio
+
+HIT = {"_source": {"id": "1", "title": "Star Wars", "type": "movie"}}
+
+
+def make_repo(es, **guard_options) -> ElasticRepository:
+    guard = EsGuard(**{"timeout": 0.2, **guard_options})
+    return ElasticRepository(es, index="movies", model=FilmWork, guard=guard)
+
+
+async def test_timeout_serves_last_good_result():
+    """A read that times out falls back to its previous answer."""
+    es = AsyncMock()
+    repo = make_repo(es)
+    es.search.return_value = {"hits": {"hits": [HIT]}}
+    assert (await repo.search({"size": 1}))[0].title == "Star Wars"
+
+    async def slow_search(**_):
+        await anyio.sleep(1)
+
+    es.search.side_effect = slow_search
+    films = await repo.search({"size": 1})
+    assert films[0].title == "Star Wars"
+
+
+async def test_full_concurrency_cap_is_bounded_by_timeout():
+    """Waiting for a free slot counts against the timeout and spares the breaker."""
+    es = AsyncMock()
+    es.search.return_value = {"hits": {"hits": [HIT]}}
+    repo = make_repo(es, max_concurrency=1, breaker=CircuitBreaker(failure_threshold=1))
+    await repo.search({"size": 1})
+
+    async with repo.guard.semaphore:
+        with anyio.fail_after(0.5):
+            films = await repo.search({"size": 1})
+
+    assert films[0].title == "Star Wars"
+    assert es.search.await_count == 1
+    assert repo.guard.breaker.state == "closed"
+
+
+async def test_open_breaker_skips_elasticsearch():
+    """After enough failures ES is not called at all until the reset timeout."""
+    es = AsyncMock()
+    es.search.side_effect = EsConnectionError("down")
+    repo = make_repo(es, breaker=CircuitBreaker(failure_threshold=2))
+
+    for _ in range(2):
+        with pytest.raises(BackendUnavailableError):
+            await repo.search({"query": {"match_all": {}}})
+    assert repo.guard.breaker.state == "open"
+
+    with pytest.raises(BackendUnavailableError):
+        await repo.search({"query": {"match_all": {}}})
+    assert es.search.await_count == 2
+
+
+async def test_half_open_probe_closes_breaker():
+    es = AsyncMock()
+    es.search.return_value = {"hits": {"hits": []}}
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    repo = make_repo(es, breaker=breaker)
+
+    assert await repo.search({}) == []
+    assert breaker.state == "closed"
+
+
+async def test_cancelled_probe_does_not_wedge_breaker():
+    """A half-open probe cancelled mid-flight lets the next request probe again."""
+    es = AsyncMock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    repo = make_repo(es, timeout=5, breaker=breaker)
+
+    async def slow_search(**_):
+        await anyio.sleep(1)
+
+    es.search.side_effect = slow_search
+    with anyio.move_on_after(0.05):
+        await repo.search({})
+
+    es.search.side_effect = None
+    es.search.return_value = {"hits": {"hits": []}}
+    assert await repo.search({}) == []
+    assert breaker.state == "closed"
+
+
+async def test_not_found_does_not_trip_breaker():
+    es = AsyncMock()
+    meta = ApiResponseMeta(404, "1.1", HttpHeaders(), 0.0, None)
+    es.get.side_effect = NotFoundError("not_found", meta, {})
+    repo = make_repo(es, breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(NotFoundError):
+        await repo.get_by_id("missing")
+    assert repo.guard.breaker.state == "closed"
@@ -0,0 +1,102 @@
+import datetime
+
+import orjson
+import pytest
+from http import HTTPStatus
+from starlette.requests import Request
+
+from api.v1.response_cache import (
+    encode_body,
+    etag_matches,
+    make_etag,
+    render_response,
+)
+from models.models import FilmWork
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def response_store(monkeypatch, mock_cache):
+    """In-memory stand-in for the Redis response cache."""
+    store = {}
+
+    async def fake_get(key):
+        return store.get(key)
+
+    async def fake_set(key, cached, ttl=None):
+        store[key] = cached
+
+    monkeypatch.setattr("api.v1.response_cache.get_cached_response", fake_get)
+    monkeypatch.setattr("api.v1.response_cache.set_cached_response", fake_set)
+    return store
+
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+async def test_film_response_is_built_once(film_service, mock_repo, response_store):
+    """The first call encodes the ES document, the second one is served from cache."""
+    first = await film_service.get_film_response("1")
+    second = await film_service.get_film_response("1")
+
+    assert first == second
+    assert orjson.loads(first.body)["title"] == "Mock Film 1"
+    assert first.etag == make_etag(["1:1:1"])
+    mock_repo.get_with_version.assert_awaited_once_with("1", raw=True)
+
+
+async def test_film_response_follows_index_version(
+    film_service, mock_repo, response_store, monkeypatch
+):
+    """A response stored by a read that raced an ETL write is never served."""
+    version = 0
+
+    async def current_version(index):
+        return version
+
+    monkeypatch.setattr("services.film_service.get_cache_version", current_version)
+    await film_service.get_film_response("1")
+    version = 1  # the ETL invalidator bumped the movies index
+    await film_service.get_film_response("1")
+    await film_service.get_film_response("1")
+
+    assert mock_repo.get_with_version.await_count == 2
+
+
+async def test_conditional_request_returns_304(film_service, mock_repo, response_store):
+    """A matching If-None-Match header gets 304 without a body."""
+    mock_repo.search_with_versions.return_value = ([{"id": "1"}], ["1:1:7"])
+    cached = await film_service.list_films_response()
+
+    resp = render_response(cached, make_request(cached.etag))
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+    assert resp.body == b""
+    assert resp.headers["etag"] == cached.etag
+
+    resp = render_response(cached, make_request('"stale"'))
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.body == cached.body
+
+
+def test_etag_follows_document_revisions():
+    """Any change of _seq_no / _primary_term produces a new ETag."""
+    assert make_etag(["1:1:7"]) != make_etag(["1:1:8"])
+    assert make_etag(["1:1:7", "2:1:3"]) != make_etag(["2:1:3", "1:1:7"])
+    assert etag_matches(f'"x", W/{make_etag(["a"])}', make_etag(["a"]))
+    assert etag_matches("*", make_etag(["a"]))
+
+
+def test_encode_body_matches_pydantic_json():
+    """The field-dict fast path encodes models the same way pydantic does."""
+    film = FilmWork(
+        id="1",
+        title="Mock Film 1",
+        type="movie",
+        rating=8.1,
+        creation_date=datetime.date(2001, 1, 1),
+        created=datetime.datetime(2021, 6, 16, 20, 14, 9),
+    )
+    assert orjson.loads(encode_body([film])) == [film.model_dump(mode="json")]
@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from repositories.elastic_repository import ElasticRepository
+from services.suggest_service import PrefixCache, SuggestService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def suggest_repo():
+    repo = AsyncMock(spec=ElasticRepository)
+    repo.search_hits.return_value = [
+        {
+            "_index": "movies_v2",
+            "matched_queries": ["film"],
+            "_source": {"id": "1", "title": "Star Wars"},
+        },
+        {
+            "_index": "persons_v2",
+            "matched_queries": ["person"],
+            "_source": {"id": "2", "full_name": "Stanley Kubrick"},
+        },
+    ]
+    return repo
+
+
+async def test_suggest_mixes_films_and_persons(suggest_repo):
+    """Hits from both indices come back as typed suggestions, whatever the
+    concrete index names behind the aliases are."""
+    service = SuggestService(suggest_repo, cache=PrefixCache())
+    suggestions = await service.suggest("Sta")
+
+    assert [(s.kind, s.text) for s in suggestions] == [
+        ("film", "Star Wars"),
+        ("person", "Stanley Kubrick"),
+    ]
+    film, person = suggest_repo.search_hits.call_args.args[0]["query"]["bool"]["should"]
+    assert film["multi_match"]["type"] == "bool_prefix"
+    assert film["multi_match"]["_name"] == "film"
+    assert "title.suggest._2gram" in film["multi_match"]["fields"]
+    assert person["multi_match"]["_name"] == "person"
+
+
+async def test_hot_prefixes_are_served_in_process(suggest_repo):
+    """Repeated prefixes skip ES; normalisation makes 'STA ' and 'sta' equal."""
+    service = SuggestService(suggest_repo, cache=PrefixCache())
+    await service.suggest("sta")
+    await service.suggest("  STA ")
+
+    suggest_repo.search_hits.assert_awaited_once()
+    assert await service.suggest("   ") == []
+
+
+def test_prefix_cache_is_bounded():
+    """The least recently used prefix is evicted first."""
+    cache = PrefixCache(maxsize=2)
+    cache.set(("a", 10), [])
+    cache.set(("b", 10), [])
+    cache.get(("a", 10))
+    cache.set(("c", 10), [])
+    assert cache.get(("b", 10)) is None
+    assert cache.get(("a", 10)) == []